@@ -0,0 +1,5 @@
+"""
+Gym Workout Planner - Benchmarks
+Author: Aryan Kumawat
+Performance checks runnable with `python -m benchmarks.<name>`
+"""
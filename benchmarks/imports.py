@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Import Graph Check
+Author: Aryan Kumawat
+Imports each module in a fresh interpreter and fails when it pulls in UI or plotting packages
+
+Usage:
+    python -m benchmarks.imports
+    python -m benchmarks.imports --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UI_PACKAGES = ['tkinter', '_tkinter', 'matplotlib', 'numpy', 'PIL']
+
+# Statement to run -> module prefixes it must not load
+RULES = {
+    'import gym_core': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'from gym_core import WorkoutCalculator': UI_PACKAGES + ['gym_advanced'],
+    'from gym_core import WorkoutStatistics': UI_PACKAGES,
+    'import gym': UI_PACKAGES + ['gym_advanced', 'gym_cli', 'gym_export'],
+    'import gym_advanced': UI_PACKAGES,
+    'import gym_cli': UI_PACKAGES + ['gym_advanced'],
+    'import gym_export': UI_PACKAGES,
+    'import gym_store': UI_PACKAGES,
+    'import gym_rest': UI_PACKAGES,
+    'import gym_records': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_columnar': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_notes': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_import': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_sync': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_archive': UI_PACKAGES + ['gym', 'gym_advanced'],
+    'import gym_index': UI_PACKAGES + ['gym_advanced'],
+    'import gym_periodization': UI_PACKAGES,
+    'import gym_workload': UI_PACKAGES + ['gym_advanced'],
+    'import gym_server': UI_PACKAGES,
+    'import gym_kiosk_server': UI_PACKAGES,
+    'import gym_gui': ['matplotlib', 'numpy'],
+    'import gym_gui_enhanced': ['matplotlib', 'numpy'],
+    'import gym_gui_basic': ['matplotlib', 'numpy', 'gym_advanced'],
+}
+
+
+def loaded_modules(statement: str) -> List[str]:
+    """Modules present in sys.modules after running the statement in a fresh interpreter"""
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_DIR,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout)
+
+
+def check(statement: str, forbidden: List[str]) -> Dict:
+    try:
+        modules = loaded_modules(statement)
+    except RuntimeError as e:
+        return {'statement': statement, 'error': str(e)}
+    offending = sorted(
+        module for module in modules
+        if any(module == prefix or module.startswith(prefix + '.') for prefix in forbidden)
+    )
+    return {'statement': statement, 'modules': len(modules), 'forbidden': offending}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check that core modules stay free of UI imports")
+    parser.add_argument('--json', action='store_true', help="Print machine-readable results")
+    args = parser.parse_args(argv)
+
+    results = [check(statement, forbidden) for statement, forbidden in RULES.items()]
+    # A GUI module that cannot be imported here (no Tk) is reported, not failed
+    failures = [r for r in results if r.get('forbidden')
+                or ('error' in r and not r['statement'].startswith('import gym_gui'))]
+
+    if args.json:
+        print(json.dumps({'results': results, 'failed': len(failures)}, indent=2))
+    else:
+        for result in results:
+            if 'error' in result:
+                print(f"  skipped  {result['statement']}: {result['error']}")
+            elif result['forbidden']:
+                print(f"  FAILED   {result['statement']}: loaded {', '.join(result['forbidden'])}")
+            else:
+                print(f"  ok       {result['statement']} ({result['modules']} modules)")
+        print()
+        print("Import graph check failed." if failures else "All modules import only what they need.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
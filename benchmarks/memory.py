@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Memory Footprint Report
+Author: Aryan Kumawat
+Measures with tracemalloc how much memory a resident profile, its histories and its cached views take
+
+Usage:
+    python -m benchmarks.memory --data-file user_data_gui_enhanced.json
+    python -m benchmarks.memory --entries 100000 --weights 5000 --json
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from benchmarks.synthetic import ProfileSpec, generate_profile
+from gym import WorkoutCalculator
+from gym_advanced import AdvancedUser
+
+
+def retained_bytes(build: Callable) -> Tuple[int, object]:
+    """Bytes still allocated after build() returns, while its result is alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+# Candidate compact encodings of the progress log, compared against the list of dicts
+
+def progress_as_tuples(entries: List[Dict]):
+    """(date, day, notes) tuples with interned strings"""
+    return [(sys.intern(e['date']), e['day'], sys.intern(e.get('notes', ''))) for e in entries]
+
+
+def progress_as_columns(entries: List[Dict]):
+    """Columns: minutes since epoch, day numbers, and notes only where present"""
+    epoch = datetime(1970, 1, 1)
+    minutes = array('q', (int((datetime.strptime(e['date'], '%Y-%m-%d %H:%M') - epoch).total_seconds() // 60)
+                          for e in entries))
+    days = bytearray(e['day'] for e in entries)
+    notes = {i: e['notes'] for i, e in enumerate(entries) if e.get('notes')}
+    return minutes, days, notes
+
+
+def weights_as_columns(entries: List[Dict]):
+    """Columns: day ordinals, weights as doubles, and the units"""
+    ordinals = array('l', (datetime.strptime(e['date'], '%Y-%m-%d').toordinal() for e in entries))
+    values = array('d', (float(e['weight']) for e in entries))
+    units = bytearray(0 if e.get('unit', 'kg') == 'kg' else 1 for e in entries)
+    return ordinals, values, units
+
+
+def plan_bytes_per_member(members: int = 1000) -> Dict[str, float]:
+    """Plans held by a roster: one built copy per member vs the interned shared plans"""
+    users = [AdvancedUser(**ProfileSpec(f"Member {i}", seed=i).profile_fields()) for i in range(members)]
+    # Own lists, dicts and text per member, as every member held before plans were interned
+    copies, _ = retained_bytes(lambda: [
+        [{'day': day['day'], 'workout': day['workout'].encode().decode()}
+         for day in WorkoutCalculator.build_workout_plan(user)]
+        for user in users
+    ])
+    interned, _ = retained_bytes(lambda: [WorkoutCalculator.generate_workout_plan(user) for user in users])
+    return {'copies': copies / members, 'interned': interned / members}
+
+
+def per_entry(total: int, count: int) -> float:
+    return total / count if count else 0.0
+
+
+def build_report(raw: str) -> Dict:
+    """Measure a serialized profile loaded through AdvancedUser.from_dict"""
+    data = json.loads(raw)
+    entries, weights = data.get('progress_log', []), data.get('weight_log', [])
+
+    profile_bytes, user = retained_bytes(lambda: AdvancedUser.from_dict(json.loads(raw)))
+    progress_bytes, _ = retained_bytes(lambda: json.loads(json.dumps(entries)))
+    weight_bytes, _ = retained_bytes(lambda: json.loads(json.dumps(weights)))
+
+    snapshot_bytes, _ = retained_bytes(lambda: json.loads(json.dumps(user.to_dict())))
+    plan_bytes, _ = retained_bytes(lambda: WorkoutCalculator.generate_workout_plan(user))
+
+    alternatives = {}
+    if entries:
+        for name, encode in (('tuples', progress_as_tuples), ('columns', progress_as_columns)):
+            size, _ = retained_bytes(lambda: encode(entries))
+            alternatives[f'progress_log:{name}'] = per_entry(size, len(entries))
+    if weights:
+        size, _ = retained_bytes(lambda: weights_as_columns(weights))
+        alternatives['weight_log:columns'] = per_entry(size, len(weights))
+
+    return {
+        'progress_entries': len(entries),
+        'weight_entries': len(weights),
+        'json_bytes': len(raw.encode('utf-8')),
+        'resident_profile_bytes': profile_bytes,
+        'bytes_per_progress_entry': per_entry(progress_bytes, len(entries)),
+        'bytes_per_weight_entry': per_entry(weight_bytes, len(weights)),
+        'cached_views': {
+            'profile_snapshot': snapshot_bytes,
+            'interned_plan': plan_bytes,
+        },
+        'compact_alternatives_bytes_per_entry': alternatives,
+        'plan_bytes_per_member': plan_bytes_per_member(),
+        'members_per_gib': int(2 ** 30 / max(profile_bytes + snapshot_bytes, 1)),
+    }
+
+
+def print_report(report: Dict):
+    print(f"Progress entries:          {report['progress_entries']:>12,}")
+    print(f"Weight entries:            {report['weight_entries']:>12,}")
+    print(f"Serialized JSON:           {report['json_bytes']:>12,} bytes")
+    print(f"Resident profile:          {report['resident_profile_bytes']:>12,} bytes")
+    print(f"Per progress entry (dict): {report['bytes_per_progress_entry']:>12.1f} bytes")
+    print(f"Per weight entry (dict):   {report['bytes_per_weight_entry']:>12.1f} bytes")
+    print("Cached views:")
+    for name, size in report['cached_views'].items():
+        print(f"  {name:<24}{size:>12,} bytes")
+    if report['compact_alternatives_bytes_per_entry']:
+        print("Compact alternatives (bytes per entry):")
+        for name, size in report['compact_alternatives_bytes_per_entry'].items():
+            print(f"  {name:<24}{size:>12.1f}")
+    plans = report['plan_bytes_per_member']
+    print(f"Plan per member (1,000 members): {plans['copies']:,.0f} bytes as copies, "
+          f"{plans['interned']:,.0f} bytes interned")
+    print(f"Members per GiB (profile + snapshot): {report['members_per_gib']:,}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the memory footprint of a resident profile")
+    parser.add_argument('--data-file', help="Profile JSON to measure (default: a generated profile)")
+    parser.add_argument('--entries', type=int, default=10000, help="Generated progress entries")
+    parser.add_argument('--weights', type=int, default=1000, help="Generated weight entries")
+    parser.add_argument('--json', action='store_true', help="Print machine-readable results")
+    args = parser.parse_args(argv)
+
+    if args.data_file:
+        with open(args.data_file, 'r') as f:
+            raw = f.read()
+    else:
+        spec = ProfileSpec("Sample Member", progress=args.entries, weights=args.weights)
+        raw = json.dumps(generate_profile(spec))
+
+    report = build_report(raw)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
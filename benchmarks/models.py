@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Model Representation Comparison
+Author: Aryan Kumawat
+Memory and speed of profiles with dict log entries, compact slotted records and a columnar progress log
+
+Usage:
+    python -m benchmarks.models
+    python -m benchmarks.models --entries 100000 --weights 10000 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from benchmarks.memory import retained_bytes
+from benchmarks.synthetic import ProfileSpec, generate_profile
+from gym_advanced import AdvancedUser, WeightTracker, WorkoutStatistics
+from gym_workload import member_workload
+
+END_DATE = datetime(2025, 6, 30)
+
+
+def best_of(func: Callable, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure(raw: str, **options) -> Dict:
+    """Resident bytes and timings of one representation"""
+    data = json.loads(raw)
+    entries = len(data['progress_log']) + len(data['weight_log'])
+    load = lambda: AdvancedUser.from_dict(json.loads(raw), **options)
+
+    resident, user = retained_bytes(load)
+    return {
+        'resident_bytes': resident,
+        'bytes_per_entry': resident / entries if entries else 0.0,
+        'load_seconds': best_of(load),
+        'save_seconds': best_of(lambda: json.dumps(user.to_dict())),
+        'statistics_seconds': best_of(lambda: WorkoutStatistics.get_statistics(user)),
+        'weight_statistics_seconds': best_of(lambda: (WeightTracker.get_weight_statistics(user),
+                                                      WeightTracker.get_weight_trend(user))),
+        'workload_seconds': best_of(lambda: member_workload(user, on=END_DATE.date())),
+        'lossless': user.to_dict() == data,
+    }
+
+
+def build_report(raw: str) -> Dict:
+    report = {'dicts': measure(raw), 'records': measure(raw, compact=True), 'columns': measure(raw, columnar=True)}
+    for name in ('records', 'columns'):
+        report[name]['memory_ratio'] = report[name]['resident_bytes'] / max(report['dicts']['resident_bytes'], 1)
+    return report
+
+
+def print_report(report: Dict):
+    rows = [('Resident profile (bytes)', 'resident_bytes', "{:,.0f}"),
+            ('Bytes per log entry', 'bytes_per_entry', "{:,.1f}"),
+            ('Load (ms)', 'load_seconds', None), ('Save to JSON (ms)', 'save_seconds', None),
+            ('Workout statistics (ms)', 'statistics_seconds', None),
+            ('Weight statistics (ms)', 'weight_statistics_seconds', None),
+            ('Workload (ms)', 'workload_seconds', None)]
+    names = ('dicts', 'records', 'columns')
+    print(f"{'':<28}{'dict entries':>16}{'records':>16}{'columnar':>16}")
+    for label, key, fmt in rows:
+        cells = [fmt.format(v) if fmt else f"{v * 1000:.3f}" for v in (report[name][key] for name in names)]
+        print(f"{label:<28}" + "".join(f"{cell:>16}" for cell in cells))
+    print(f"{'Round-trips losslessly':<28}" + "".join(f"{str(report[name]['lossless']):>16}" for name in names))
+    print(f"\nRecords use {report['records']['memory_ratio']:.0%} and the columnar log "
+          f"{report['columns']['memory_ratio']:.0%} of the memory of dict entries")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare dict log entries with compact records and columns")
+    parser.add_argument('--data-file', help="Profile JSON to measure (default: a generated profile)")
+    parser.add_argument('--entries', type=int, default=10000, help="Generated progress entries")
+    parser.add_argument('--weights', type=int, default=1000, help="Generated weight entries")
+    parser.add_argument('--json', action='store_true', help="Print machine-readable results")
+    args = parser.parse_args(argv)
+
+    if args.data_file:
+        with open(args.data_file, 'r') as f:
+            raw = f.read()
+    else:
+        spec = ProfileSpec("Sample Member", progress=args.entries, weights=args.weights, end=END_DATE)
+        raw = json.dumps(generate_profile(spec))
+
+    report = build_report(raw)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0 if report['records']['lossless'] and report['columns']['lossless'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
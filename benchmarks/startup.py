@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Cold Start Budget Check
+Author: Aryan Kumawat
+Runs every entry point with --profile-startup and fails when a phase exceeds its budget
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget cold_start=1.5 --budget first_frame=0.5
+    python -m benchmarks.startup --budget-file budgets.json --entry gym.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ['gym.py', 'gym_advanced.py', 'gym_gui.py', 'gym_gui_enhanced.py', 'gym_gui_basic.py']
+GUI_ENTRY_POINTS = {'gym_gui.py', 'gym_gui_enhanced.py', 'gym_gui_basic.py'}
+
+# Budgets in seconds; phases without a budget are reported but never fail
+DEFAULT_BUDGETS = {
+    'cold_start': 2.0,  # Wall time of the whole --profile-startup run
+    'import': 0.5,  # Cumulative cold import time of the entry module
+    'profile_load': 0.5,
+    'plan_generation': 0.05,
+    'first_frame': 1.0,  # Milestone: first rendered frame (GUIs only)
+}
+
+
+def parse_budgets(args) -> Dict[str, float]:
+    """Combine default, file and command line budgets"""
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budget_file:
+        with open(args.budget_file, 'r') as f:
+            budgets.update({k: float(v) for k, v in json.load(f).items()})
+    for item in args.budget:
+        name, _, value = item.partition('=')
+        if not value:
+            raise SystemExit(f"Invalid budget '{item}', expected phase=seconds")
+        budgets[name] = float(value)
+    return budgets
+
+
+def profile_entry(entry: str, data_dir: str) -> Dict:
+    """Run one entry point in a fresh interpreter and collect its startup report"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, os.path.join(PROJECT_DIR, entry), '--profile-startup', '--json'],
+        cwd=data_dir, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+
+    if result.returncode != 0:
+        return {'entry': entry, 'error': result.stderr.strip() or f"exit code {result.returncode}"}
+
+    report = json.loads(result.stdout)
+    module = entry[:-3]
+    measurements = {
+        'cold_start': wall - report.get('measurement_overhead', 0.0),
+        'import': report['imports'].get(module, 0.0),
+    }
+    measurements.update(report['phases'])
+    measurements.update(report['milestones'])
+    return {'entry': entry, 'measurements': measurements}
+
+
+def check_budgets(results: List[Dict], budgets: Dict[str, float]) -> List[str]:
+    """Return a description of every budget violation"""
+    failures = []
+    for result in results:
+        for name, seconds in result.get('measurements', {}).items():
+            budget = budgets.get(name)
+            if budget is not None and seconds > budget:
+                failures.append(f"{result['entry']}: {name} took {seconds * 1000:.1f} ms "
+                                f"(budget {budget * 1000:.1f} ms)")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check cold start time of every entry point")
+    parser.add_argument('--entry', action='append', choices=ENTRY_POINTS,
+                        help="Entry point to check (repeatable, default: all)")
+    parser.add_argument('--budget', action='append', default=[], metavar='PHASE=SECONDS',
+                        help="Override the budget of a phase")
+    parser.add_argument('--budget-file', help="JSON file mapping phase names to budgets in seconds")
+    parser.add_argument('--data-dir', default=PROJECT_DIR,
+                        help="Directory holding the user data files to load")
+    parser.add_argument('--require-gui', action='store_true',
+                        help="Fail instead of skipping GUIs when no display is available")
+    parser.add_argument('--json', action='store_true', help="Print machine-readable results")
+    args = parser.parse_args(argv)
+
+    budgets = parse_budgets(args)
+    results = [profile_entry(entry, args.data_dir) for entry in (args.entry or ENTRY_POINTS)]
+
+    failures = check_budgets(results, budgets)
+    for result in results:
+        if 'error' in result:
+            if result['entry'] in GUI_ENTRY_POINTS and not args.require_gui:
+                result['skipped'] = True
+            else:
+                failures.append(f"{result['entry']}: {result['error']}")
+
+    if args.json:
+        print(json.dumps({'budgets': budgets, 'results': results, 'failures': failures}, indent=2))
+    else:
+        for result in results:
+            print(result['entry'])
+            if 'error' in result:
+                status = "skipped" if result.get('skipped') else "FAILED"
+                print(f"  {status}: {result['error']}")
+                continue
+            for name, seconds in result['measurements'].items():
+                budget = budgets.get(name)
+                limit = f"/ {budget * 1000:.0f} ms" if budget is not None else ""
+                print(f"  {name:<20} {seconds * 1000:9.1f} ms {limit}")
+        print()
+        if failures:
+            print("Startup budget exceeded:")
+            for failure in failures:
+                print(f"  {failure}")
+        else:
+            print("All entry points are within the startup budget.")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Benchmark Suite
+Author: Aryan Kumawat
+Fixed scenarios for the engine, persistence and GUI build paths, compared against a stored baseline
+
+Usage:
+    python -m benchmarks.suite                              run everything, print a table
+    python -m benchmarks.suite --json --output results.json
+    python -m benchmarks.suite --save-baseline baseline.json
+    python -m benchmarks.suite --baseline baseline.json --tolerance 0.25
+    python -m benchmarks.suite --filter statistics --quick
+
+Exits with status 1 when a scenario is slower than its baseline by more than the tolerance.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from benchmarks.synthetic import ProfileSpec, generate_user, member_name
+from gym import WorkoutCalculator
+from gym_import import import_csv
+from gym_notes import NotesIndex
+from gym_rest import recommend_roster
+from gym_sync import merge_logs
+from gym_workload import member_workload, roster_workload
+from gym_advanced import (
+    AdvancedGymWorkoutPlanner, AdvancedUser, RestDayRecommender, WeightTracker, WorkoutStatistics
+)
+
+SIZES = [1_000, 10_000, 100_000]
+QUICK_SIZES = [1_000, 10_000]
+END_DATE = datetime(2025, 6, 30)  # Fixed so every run measures the same data
+
+
+class Scenario:
+    """A named benchmark: setup() builds the input once, run(state) is timed"""
+
+    def __init__(self, name: str, run: Callable, setup: Callable = lambda: None,
+                 repeat: int = 7, teardown: Callable = lambda state: None):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.repeat = repeat
+        self.teardown = teardown
+
+    def measure(self) -> Dict:
+        state = self.setup()
+        try:
+            self.run(state)  # Warm-up
+            timings = []
+            for _ in range(self.repeat):
+                start = time.perf_counter()
+                self.run(state)
+                timings.append(time.perf_counter() - start)
+        finally:
+            self.teardown(state)
+        return {'median': statistics.median(timings), 'min': min(timings), 'runs': self.repeat}
+
+
+def _user(size: int, weights: Optional[int] = None):
+    return generate_user(ProfileSpec(member_name(size), seed=1, progress=size,
+                                     weights=size // 10 if weights is None else weights, end=END_DATE))
+
+
+def _planner(size: int):
+    directory = tempfile.mkdtemp(prefix="gym_bench_")
+    planner = AdvancedGymWorkoutPlanner()
+    planner.data_file = os.path.join(directory, "user_data_advanced.json")
+    planner.user = _user(size)
+    planner.save_user_data()
+    return planner
+
+
+def _remove_planner(planner):
+    directory = os.path.dirname(planner.data_file)
+    for filename in os.listdir(directory):
+        os.remove(os.path.join(directory, filename))
+    os.rmdir(directory)
+
+
+def _history_csv(size: int) -> str:
+    """A member's workouts and weigh-ins as import CSV text"""
+    user = _user(size, weights=size // 10)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['date', 'day', 'notes', 'weight', 'unit'])
+    writer.writerows([entry['date'], entry['day'], entry['notes'], '', ''] for entry in user.progress_log)
+    writer.writerows([entry['date'], '', '', entry['weight'], entry['unit']] for entry in user.weight_log)
+    return out.getvalue()
+
+
+def engine_scenarios(sizes: List[int]) -> List[Scenario]:
+    users = []
+    for age in (18, 35, 55, 70):
+        for goal in range(1, 7):
+            user = ProfileSpec(member_name(age * 10 + goal), seed=2).profile_fields()
+            user.update(age=age, goal=goal)
+            users.append(user)
+
+    def plans(_):
+        for fields in users:
+            WorkoutCalculator.generate_workout_plan(AdvancedUser(**fields))
+
+    def plan_builds(_):
+        for fields in users:
+            WorkoutCalculator.build_workout_plan(AdvancedUser(**fields))
+
+    def roster(members):
+        roster_workload(members, on=END_DATE.date())
+
+    scenarios = [
+        Scenario('plan_generation[24 profiles]', plans, repeat=15),
+        Scenario('plan_build[24 profiles]', plan_builds, repeat=15),
+        Scenario('workload_roster[500 members x 1 year]', roster, repeat=5, setup=lambda: [
+            generate_user(ProfileSpec(member_name(i), seed=3, progress=200, weights=0, end=END_DATE))
+            for i in range(500)
+        ]),
+        Scenario('rest_days_roster[2000 members x 1 year]', lambda users: recommend_roster(users, END_DATE),
+                 repeat=5, setup=lambda: [
+                     generate_user(ProfileSpec(member_name(i), seed=4, progress=200, weights=0, end=END_DATE))
+                     for i in range(2000)
+                 ]),
+    ]
+    for size in sizes:
+        scenarios += [
+            Scenario(f'statistics[{size}]', WorkoutStatistics.get_statistics, lambda size=size: _user(size)),
+            Scenario(f'rest_check[{size}]', RestDayRecommender.should_rest_today, lambda size=size: _user(size)),
+            Scenario(f'workload[{size}]', lambda user: member_workload(user, on=END_DATE.date()),
+                     lambda size=size: _user(size)),
+            Scenario(f'notes_search[{size}]', lambda index: index.search("felt strong", since='2024-01-01'),
+                     lambda size=size: NotesIndex(_user(size).progress_log)),
+            Scenario(f'csv_import[{size}]', lambda text: import_csv(io.StringIO(text), [], []),
+                     lambda size=size: _history_csv(size)),
+            Scenario(f'sync_merge[3 x {size}]', merge_logs,
+                     lambda size=size: [_user(size).progress_log[i:] for i in range(3)]),
+            Scenario(f'weight_analytics[{size // 10}]',
+                     lambda user: (WeightTracker.get_weight_statistics(user), WeightTracker.get_weight_trend(user)),
+                     lambda size=size: _user(0, weights=size // 10)),
+        ]
+    return scenarios
+
+
+def persistence_scenarios(sizes: List[int]) -> List[Scenario]:
+    scenarios = []
+    for size in sizes:
+        repeat = 3 if size >= 100_000 else 7
+        scenarios += [
+            Scenario(f'profile_save[{size}]', AdvancedGymWorkoutPlanner.save_user_data,
+                     lambda size=size: _planner(size), repeat, _remove_planner),
+            Scenario(f'profile_load[{size}]', AdvancedGymWorkoutPlanner.load_user_data,
+                     lambda size=size: _planner(size), repeat, _remove_planner),
+        ]
+    return scenarios
+
+
+def gui_scenarios() -> Tuple[List[Scenario], Callable]:
+    """create_*_tab builders of the enhanced GUI on a withdrawn root window, and a cleanup"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:  # No Tk or no display
+        return [Scenario(f'gui_tabs (skipped: {str(e).splitlines()[0]})', None)], lambda: None
+
+    from tkinter import ttk
+    from gym_gui import EnhancedGymWorkoutPlannerGUI
+
+    root.withdraw()
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="gym_bench_gui_"))  # The GUI reads its data file from the cwd
+    try:
+        app = EnhancedGymWorkoutPlannerGUI(root)
+    finally:
+        os.chdir(cwd)
+    app.user = _user(1_000)
+    app.workout_plan = WorkoutCalculator.generate_workout_plan(app.user)
+
+    def build(builder):
+        def run(_):
+            frame = ttk.Frame(root)
+            builder(frame)
+            root.update_idletasks()
+            frame.destroy()
+        return run
+
+    names = sorted(name for name in dir(app) if name.startswith('create_') and name.endswith('_tab'))
+    scenarios = [Scenario(f'gui_{name}', build(getattr(app, name))) for name in names]
+
+    def cleanup():
+        app.on_close()
+        root.destroy()
+    return scenarios, cleanup
+
+
+def run_suite(quick: bool = False, name_filter: Optional[str] = None) -> Dict:
+    sizes = QUICK_SIZES if quick else SIZES
+    results = {}
+    gui, cleanup = gui_scenarios() if not name_filter or 'gui' in name_filter else ([], lambda: None)
+    try:
+        for scenario in engine_scenarios(sizes) + persistence_scenarios(sizes) + gui:
+            if name_filter and name_filter not in scenario.name:
+                continue
+            if scenario.run is None:
+                results[scenario.name] = {'skipped': True}
+                continue
+            results[scenario.name] = scenario.measure()
+    finally:
+        cleanup()
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'scenarios': results,
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Scenarios whose median is slower than baseline * (1 + tolerance)"""
+    regressions = []
+    for name, result in results['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base or 'median' not in base or 'median' not in result:
+            continue
+        ratio = result['median'] / base['median'] if base['median'] else 1.0
+        result['baseline_ratio'] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {result['median'] * 1000:.3f} ms vs "
+                               f"{base['median'] * 1000:.3f} ms baseline ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Gym Workout Planner benchmark suite")
+    parser.add_argument('--quick', action='store_true', help="Skip the largest history size")
+    parser.add_argument('--filter', help="Only run scenarios whose name contains this text")
+    parser.add_argument('--baseline', help="Compare against a results file from --save-baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    parser.add_argument('--save-baseline', help="Write the results as the new baseline")
+    parser.add_argument('--output', help="Write the results JSON to a file")
+    parser.add_argument('--json', action='store_true', help="Print machine-readable results")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.quick, args.filter)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    results['regressions'] = regressions
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(results, f, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results['scenarios'].items():
+            if result.get('skipped'):
+                print(f"  {name}")
+                continue
+            ratio = f"  {result['baseline_ratio']:.2f}x" if 'baseline_ratio' in result else ""
+            print(f"  {name:<40} {result['median'] * 1000:10.3f} ms  (min {result['min'] * 1000:.3f}){ratio}")
+        if regressions:
+            print("\nSlower than baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
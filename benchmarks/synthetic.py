@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Synthetic Profile Generator
+Author: Aryan Kumawat
+Reproducible AdvancedUser profiles with large histories for benchmarks, in every storage format
+
+Usage:
+    python -m benchmarks.synthetic --output big.json --progress 1000000 --weights 20000
+    python -m benchmarks.synthetic --format store --output members --members 200 --progress 5000
+    python -m benchmarks.synthetic --output p.json --progress 10000 --seed 7 --end 2025-06-30
+
+The same --seed, sizes and --end always produce identical files. Histories are
+streamed to disk, so even 10M progress entries are written in constant memory.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from gym_advanced import AdvancedUser
+
+NOTES = ["", "", "", "", "Felt strong", "New PR", "Tired today", "Short session",
+         "Great pump", "Knee felt sore", "Added extra set", "Morning session"]
+SYLLABLES = ["al", "be", "ca", "do", "el", "fi", "ga", "ho", "is", "ju", "ka", "lo", "ma", "ne", "or", "pa"]
+EXERCISES = [("Squats", 'reps'), ("Deadlifts", 'reps'), ("Bench presses", 'reps'), ("Rowing", 'time'),
+             ("Lunges", 'reps'), ("Planks", 'time'), ("Pull ups", 'reps'), ("Cycling", 'time')]
+
+
+class ProfileSpec:
+    """Sizes and seed of one synthetic member"""
+
+    def __init__(self, name: str, seed: int = 0, progress: int = 1000, weights: int = 100,
+                 custom_workouts: int = 5, calendar_days: int = 28, end: Optional[datetime] = None):
+        self.name = name
+        self.seed = seed
+        self.progress = progress
+        self.weights = weights
+        self.custom_workouts = custom_workouts
+        self.calendar_days = calendar_days
+        self.end = end or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def rng(self, section: str) -> random.Random:
+        """Independent generator per section, so streaming and in-memory output match"""
+        return random.Random(f"{self.seed}:{self.name}:{section}")
+
+    def profile_fields(self) -> Dict:
+        rng = self.rng('profile')
+        return {
+            'name': self.name,
+            'age': rng.randint(16, 75),
+            'gender': rng.choice(['female', 'male']),
+            'goal': rng.randint(1, 6),
+            'training_days': rng.randint(2, 6),
+        }
+
+
+def member_name(index: int) -> str:
+    """Unique alphabetic member name (profile names may not contain digits)"""
+    words = []
+    for _ in range(2):
+        word = ""
+        for _ in range(3):
+            word += SYLLABLES[index % len(SYLLABLES)]
+            index //= len(SYLLABLES)
+        words.append(word.capitalize())
+    return " ".join(words)
+
+
+def iter_progress(spec: ProfileSpec, training_days: int) -> Iterator[Dict]:
+    """Logged workouts in date order, ending at spec.end"""
+    rng = spec.rng('progress')
+    if not spec.progress:
+        return
+    interval = max(timedelta(days=7) / training_days, timedelta(minutes=1) * 2)
+    if spec.progress > 1_000_000:
+        interval = timedelta(minutes=1) * 2  # Very large logs compress into ~2 minute spacing
+    start = spec.end - interval * spec.progress
+    for i in range(spec.progress):
+        jitter = timedelta(minutes=rng.randint(0, max(int(interval.total_seconds() // 60) - 1, 0)))
+        day = i % training_days + 1 if rng.random() < 0.9 else rng.randint(1, training_days)
+        yield {
+            'date': (start + interval * i + jitter).strftime('%Y-%m-%d %H:%M'),
+            'day': day,
+            'notes': rng.choice(NOTES),
+        }
+
+
+def iter_weights(spec: ProfileSpec) -> Iterator[Dict]:
+    """Weight measurements every few days as a slow random walk"""
+    rng = spec.rng('weights')
+    weight = rng.uniform(55, 110)
+    start = spec.end - timedelta(days=3 * spec.weights)
+    for i in range(spec.weights):
+        weight = max(40.0, weight + rng.gauss(-0.02, 0.4))
+        yield {
+            'date': (start + timedelta(days=3 * i)).strftime('%Y-%m-%d'),
+            'weight': round(weight, 1),
+            'unit': 'kg',
+        }
+
+
+def make_custom_workouts(spec: ProfileSpec) -> List[Dict]:
+    rng = spec.rng('custom')
+    workouts = []
+    for i in range(spec.custom_workouts):
+        created = spec.end - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1439))
+        exercises = []
+        for name, kind in rng.sample(EXERCISES, rng.randint(3, 6)):
+            value = rng.randint(8, 20) if kind == 'reps' else rng.randint(2, 15)
+            exercises.append({'name': name, 'type': kind, 'value': value, 'sets': rng.randint(2, 5)})
+        workouts.append({
+            'id': created.strftime('%Y%m%d%H%M%S') + str(i),
+            'name': f"Custom routine {i + 1}",
+            'exercises': exercises,
+            'created_at': created.strftime('%Y-%m-%d %H:%M'),
+        })
+    return workouts
+
+
+def make_calendar(spec: ProfileSpec, training_days: int) -> Dict:
+    calendar = {}
+    for offset in range(spec.calendar_days):
+        date = (spec.end + timedelta(days=offset)).strftime('%Y-%m-%d')
+        weekday = offset % 7
+        if weekday < training_days:
+            calendar[date] = {'type': 'workout', 'day': weekday + 1, 'workout': "Scheduled workout..."}
+        else:
+            calendar[date] = {'type': 'rest'}
+    return calendar
+
+
+def make_rest_days(spec: ProfileSpec, training_days: int) -> List[str]:
+    return [date for date, entry in make_calendar(spec, training_days).items() if entry['type'] == 'rest']
+
+
+def generate_profile(spec: ProfileSpec) -> Dict:
+    """The whole profile in memory, shaped like AdvancedUser.to_dict()"""
+    data = spec.profile_fields()
+    data['progress_log'] = list(iter_progress(spec, data['training_days']))
+    data['custom_workouts'] = make_custom_workouts(spec)
+    data['weight_log'] = list(iter_weights(spec))
+    data['rest_days'] = make_rest_days(spec, data['training_days'])
+    data['workout_calendar'] = make_calendar(spec, data['training_days'])
+    return data
+
+
+def generate_user(spec: ProfileSpec) -> AdvancedUser:
+    return AdvancedUser.from_dict(generate_profile(spec))
+
+
+def _write_array(f, key: str, items) -> int:
+    f.write(f', "{key}": [')
+    count = 0
+    for item in items:
+        f.write((", " if count else "") + json.dumps(item))
+        count += 1
+    f.write("]")
+    return count
+
+
+def write_json_profile(path: str, spec: ProfileSpec) -> str:
+    """Single-profile JSON file as written by the apps, streamed entry by entry"""
+    fields = spec.profile_fields()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', buffering=1024 * 1024) as f:
+        f.write(json.dumps(fields)[:-1])
+        _write_array(f, 'progress_log', iter_progress(spec, fields['training_days']))
+        _write_array(f, 'custom_workouts', make_custom_workouts(spec))
+        _write_array(f, 'weight_log', iter_weights(spec))
+        _write_array(f, 'rest_days', make_rest_days(spec, fields['training_days']))
+        f.write(f', "workout_calendar": {json.dumps(make_calendar(spec, fields["training_days"]))}}}\n')
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_store_profile(data_dir: str, spec: ProfileSpec) -> str:
+    """One file in a ProfileStore directory (as used by the HTTP and kiosk services)"""
+    from gym_store import ProfileStore
+
+    return write_json_profile(ProfileStore(data_dir).path(spec.name), spec)
+
+
+# Storage format name -> writer(output, spec); output is a file for single-file formats, else a directory
+FORMATS: Dict[str, Callable[[str, ProfileSpec], str]] = {
+    'json': write_json_profile,
+    'store': write_store_profile,
+}
+DIRECTORY_FORMATS = {'store'}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic profiles for benchmarks")
+    parser.add_argument('--output', required=True, help="Output file, or directory for multi-member formats")
+    parser.add_argument('--format', choices=sorted(FORMATS), default='json')
+    parser.add_argument('--members', type=int, default=1, help="Number of members (directory formats)")
+    parser.add_argument('--progress', type=int, default=1000, help="Progress entries per member")
+    parser.add_argument('--weights', type=int, default=100, help="Weight entries per member")
+    parser.add_argument('--custom-workouts', type=int, default=5)
+    parser.add_argument('--calendar-days', type=int, default=28)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--end', help="Last history date as YYYY-MM-DD (default: today)")
+    args = parser.parse_args(argv)
+
+    if args.members > 1 and args.format not in DIRECTORY_FORMATS:
+        parser.error(f"--members needs a directory format ({', '.join(sorted(DIRECTORY_FORMATS))})")
+    end = datetime.strptime(args.end, '%Y-%m-%d') if args.end else None
+
+    written = []
+    for index in range(args.members):
+        spec = ProfileSpec(member_name(index + args.seed * 1000), args.seed, args.progress, args.weights,
+                           args.custom_workouts, args.calendar_days, end)
+        written.append(FORMATS[args.format](args.output, spec))
+    print(json.dumps({'format': args.format, 'files': written}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,12 @@ An interactive gym workout planning system with personalized training programs
 
 import math
 import json
-import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from gym_archive import read_profile
+from gym_records import compact_progress, plain_log
 
 
 class Colors:
@@ -25,6 +28,60 @@ class Colors:
     END = '\033[0m'
 
 
+class Screen:
+    """Builds a terminal frame in memory and writes it with a single call"""
+    
+    CLEAR = '\033[2J\033[H'
+    
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self.lines: List[str] = []
+    
+    def add(self, text: str = "") -> 'Screen':
+        """Append text (may span several lines)"""
+        self.lines.extend(text.split("\n"))
+        return self
+    
+    def header(self, text: str) -> 'Screen':
+        rule = f"{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.END}"
+        return self.add(f"\n{rule}\n{Colors.HEADER}{Colors.BOLD}{text.center(80)}{Colors.END}\n{rule}\n")
+    
+    def section(self, text: str) -> 'Screen':
+        return self.add(f"\n{Colors.CYAN}{Colors.BOLD}{text}{Colors.END}\n{Colors.CYAN}{'-' * 80}{Colors.END}")
+    
+    def _is_terminal(self) -> bool:
+        return hasattr(self.out, 'isatty') and self.out.isatty()
+    
+    def _write(self, lines: List[str], clear: bool):
+        prefix = self.CLEAR if clear and self._is_terminal() else ""
+        self.out.write(prefix + "\n".join(lines) + "\n")
+        self.out.flush()
+    
+    def show(self, clear: bool = True):
+        """Write the frame, replacing the previous screen when clear is set"""
+        self._write(self.lines, clear)
+        self.lines = []
+    
+    def page(self, clear: bool = True):
+        """Like show(), but pauses after each terminal-height page of a long frame"""
+        import shutil
+        
+        height = shutil.get_terminal_size().lines - 1
+        lines, self.lines = self.lines, []
+        if not self._is_terminal() or len(lines) <= height:
+            self._write(lines, clear)
+            return
+        
+        for start in range(0, len(lines), height):
+            self._write(lines[start:start + height], clear)
+            shown = min(start + height, len(lines))
+            if shown < len(lines):
+                reply = input(f"{Colors.YELLOW}-- {shown}/{len(lines)} lines -- "
+                              f"Enter: next page, q: stop --{Colors.END}")
+                if reply.strip().lower() == 'q':
+                    break
+
+
 class WorkoutDatabase:
     """Database of workout routines"""
     
@@ -154,6 +211,9 @@ Dumbbell presses (10 reps x 4 sets)"""
 class User:
     """Represents a user profile"""
     
+    __slots__ = ('name', 'age', 'gender', 'goal', 'training_days', 'progress_log', 'archive',
+                 'journal')
+    
     def __init__(self, name: str = "", age: int = 0, gender: str = "", 
                  goal: int = 0, training_days: int = 0):
         self.name = name
@@ -162,21 +222,28 @@ class User:
         self.goal = goal
         self.training_days = training_days
         self.progress_log = []
+        self.archive = {}  # Rollups of history moved out by gym_archive.compact
+        self.journal = {}  # Journal bytes already replayed into this profile (gym_archive)
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary for JSON serialization"""
-        return {
+        data = {
             'name': self.name,
             'age': self.age,
             'gender': self.gender,
             'goal': self.goal,
             'training_days': self.training_days,
-            'progress_log': self.progress_log
+            'progress_log': plain_log(self.progress_log)
         }
+        if self.archive:
+            data['archive'] = self.archive
+        if self.journal:
+            data['journal'] = self.journal
+        return data
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'User':
-        """Create user from dictionary"""
+    def from_dict(cls, data: Dict, compact: bool = False) -> 'User':
+        """Create user from dictionary (compact: keep the log as slotted records)"""
         user = cls(
             name=data.get('name', ''),
             age=data.get('age', 0),
@@ -185,12 +252,40 @@ class User:
             training_days=data.get('training_days', 0)
         )
         user.progress_log = data.get('progress_log', [])
+        user.archive = data.get('archive', {})
+        user.journal = data.get('journal', {})
+        if compact:
+            user.progress_log = compact_progress(user.progress_log)
         return user
 
 
+class PlanDay(dict):
+    """One day of a shared workout plan; read-only"""
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Workout plans are shared between users and cannot be modified")
+    
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (PlanDay, (dict(self),))
+
+
+class WorkoutPlan(tuple):
+    """Immutable sequence of PlanDay, shared by every user with the same plan key"""
+    
+    __slots__ = ()
+
+
 class WorkoutCalculator:
     """Handles workout calculations and adjustments"""
     
+    # Interned plans and adjusted workout texts; both key spaces are small and fixed
+    _plans: Dict[Tuple[int, int, int, int], WorkoutPlan] = {}
+    _workouts: Dict[Tuple[int, int, int], str] = {}
+    
     @staticmethod
     def get_exercise_index(gender: str, age: int) -> int:
         """Get the exercise index based on gender and age"""
@@ -237,31 +332,60 @@ class WorkoutCalculator:
             return line
     
     @classmethod
-    def generate_workout_plan(cls, user: User) -> List[str]:
+    def workout_index_for_day(cls, user: User, day: int) -> int:
+        """Index into WORKOUT_LISTS of the workout scheduled on a plan day"""
+        ex_index = cls.get_exercise_index(user.gender, user.age)
+        # Alternate between goal workout and age/gender workout
+        if user.training_days % 2 == 1:
+            return user.goal - 1 if day % 2 == 1 else ex_index - 1
+        return user.goal - 1 if day % 2 == 0 else ex_index - 1
+    
+    @classmethod
+    def plan_key(cls, user: User) -> Tuple[int, int, int, int]:
+        """Everything a plan depends on: age reduction, age/gender workout, goal and days"""
+        return (
+            cls.calculate_age_reduction(user.age),
+            cls.get_exercise_index(user.gender, user.age),
+            user.goal,
+            user.training_days,
+        )
+    
+    @classmethod
+    def generate_workout_plan(cls, user: User) -> WorkoutPlan:
+        """The user's workout plan, shared with every user that has the same plan key"""
+        key = cls.plan_key(user)
+        plan = cls._plans.get(key)
+        if plan is None:
+            plan = cls._plans.setdefault(key, cls.build_workout_plan(user))
+        return plan
+    
+    @classmethod
+    def plan_stats(cls) -> Dict[str, int]:
+        """Sizes of the interned plan and workout text tables"""
+        return {'plans': len(cls._plans), 'workouts': len(cls._workouts)}
+    
+    @classmethod
+    def build_workout_plan(cls, user: User) -> WorkoutPlan:
         """Generate a complete workout plan for the user"""
         reduction = cls.calculate_age_reduction(user.age)
-        ex_index = cls.get_exercise_index(user.gender, user.age)
         workout_plan = []
         
         for day in range(1, user.training_days + 1):
-            # Alternate between goal workout and age/gender workout
-            if user.training_days % 2 == 1:
-                workout_index = user.goal - 1 if day % 2 == 1 else ex_index - 1
-            else:
-                workout_index = user.goal - 1 if day % 2 == 0 else ex_index - 1
-            
-            workout = WorkoutDatabase.WORKOUT_LISTS[workout_index]
-            adjusted_lines = []
+            workout_index = cls.workout_index_for_day(user, day)
+            text_key = (workout_index, reduction, user.goal)
+            workout = cls._workouts.get(text_key)
+            if workout is None:
+                adjusted_lines = []
+                for line in WorkoutDatabase.WORKOUT_LISTS[workout_index].split("\n"):
+                    adjusted_lines.append(cls.adjust_workout_line(line, reduction, user.goal))
+                workout = cls._workouts.setdefault(text_key, '\n'.join(adjusted_lines))
             
-            for line in workout.split("\n"):
-                adjusted_lines.append(cls.adjust_workout_line(line, reduction, user.goal))
-            
-            workout_plan.append({
+            workout_plan.append(PlanDay({
                 'day': day,
-                'workout': '\n'.join(adjusted_lines)
-            })
+                'workout': workout
+            }))
         
-        return workout_plan
+        return WorkoutPlan(workout_plan)
 
 
 class GymWorkoutPlanner:
@@ -269,23 +393,20 @@ class GymWorkoutPlanner:
     
     def __init__(self):
         self.user: Optional[User] = None
-        self.workout_plan: List[str] = []
+        self.workout_plan: WorkoutPlan = WorkoutPlan()
         self.data_file = "user_data.json"
     
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        Screen().show()
     
     def print_header(self, text: str):
         """Print a styled header"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.END}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{text.center(80)}{Colors.END}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.END}\n")
+        Screen().header(text).show(clear=False)
     
     def print_section(self, text: str):
         """Print a styled section"""
-        print(f"\n{Colors.CYAN}{Colors.BOLD}{text}{Colors.END}")
-        print(f"{Colors.CYAN}{'-' * 80}{Colors.END}")
+        Screen().section(text).show(clear=False)
     
     def validate_name(self, name: str) -> bool:
         """Validate user name input"""
@@ -321,13 +442,14 @@ class GymWorkoutPlanner:
             print(f"{Colors.RED}Error: Please enter 'female' or 'male'{Colors.END}")
         
         # Get training goal
-        self.print_section("Training Goals")
-        print(f"{Colors.GREEN}1.{Colors.END} Losing weight")
-        print(f"{Colors.GREEN}2.{Colors.END} Staying calm and relax")
-        print(f"{Colors.GREEN}3.{Colors.END} Increasing your heart rate")
-        print(f"{Colors.GREEN}4.{Colors.END} Having stronger legs")
-        print(f"{Colors.GREEN}5.{Colors.END} Having stronger ABS")
-        print(f"{Colors.GREEN}6.{Colors.END} Having stronger shoulders and arms")
+        screen = Screen().section("Training Goals")
+        screen.add(f"{Colors.GREEN}1.{Colors.END} Losing weight")
+        screen.add(f"{Colors.GREEN}2.{Colors.END} Staying calm and relax")
+        screen.add(f"{Colors.GREEN}3.{Colors.END} Increasing your heart rate")
+        screen.add(f"{Colors.GREEN}4.{Colors.END} Having stronger legs")
+        screen.add(f"{Colors.GREEN}5.{Colors.END} Having stronger ABS")
+        screen.add(f"{Colors.GREEN}6.{Colors.END} Having stronger shoulders and arms")
+        screen.show(clear=False)
         
         while True:
             try:
@@ -362,24 +484,24 @@ class GymWorkoutPlanner:
             input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
             return
         
-        self.clear_screen()
-        self.print_header(f"{self.user.name.upper()}'S WORKOUT PLAN")
+        screen = Screen().header(f"{self.user.name.upper()}'S WORKOUT PLAN")
         
-        print(f"{Colors.BOLD}Profile:{Colors.END}")
-        print(f"  Age: {self.user.age} years")
-        print(f"  Gender: {self.user.gender.capitalize()}")
-        print(f"  Goal: {WorkoutDatabase.GOAL_NAMES[self.user.goal - 1]}")
-        print(f"  Training Days: {self.user.training_days} days per week")
+        screen.add(f"{Colors.BOLD}Profile:{Colors.END}")
+        screen.add(f"  Age: {self.user.age} years")
+        screen.add(f"  Gender: {self.user.gender.capitalize()}")
+        screen.add(f"  Goal: {WorkoutDatabase.GOAL_NAMES[self.user.goal - 1]}")
+        screen.add(f"  Training Days: {self.user.training_days} days per week")
         
         age_reduction = WorkoutCalculator.calculate_age_reduction(self.user.age)
         if age_reduction > 0:
-            print(f"\n{Colors.YELLOW}Note: Workouts adjusted by {age_reduction}% for age{Colors.END}")
+            screen.add(f"\n{Colors.YELLOW}Note: Workouts adjusted by {age_reduction}% for age{Colors.END}")
         
         for day_plan in self.workout_plan:
-            self.print_section(f"Day {day_plan['day']}")
-            print(day_plan['workout'])
+            screen.section(f"Day {day_plan['day']}")
+            screen.add(day_plan['workout'])
         
-        print(f"\n{Colors.BOLD}{'=' * 80}{Colors.END}")
+        screen.add(f"\n{Colors.BOLD}{'=' * 80}{Colors.END}")
+        screen.page()
         input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
     
     def export_workout_plan(self):
@@ -389,36 +511,19 @@ class GymWorkoutPlanner:
             input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
             return
         
+        from gym_export import EXPORTERS, export_user
+        
+        fmt = input(f"{Colors.BOLD}Format ({'/'.join(EXPORTERS)}) [txt]: {Colors.END}").strip().lower() or 'txt'
+        if fmt not in EXPORTERS:
+            print(f"\n{Colors.RED}Unknown format: {fmt}{Colors.END}")
+            input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"workout_plan_{self.user.name.replace(' ', '_')}_{timestamp}.txt"
+        filename = f"workout_plan_{self.user.name.replace(' ', '_')}_{timestamp}{EXPORTERS[fmt].extension}"
         
         try:
-            with open(filename, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"{self.user.name.upper()}'S PERSONALIZED WORKOUT PLAN\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write(f"Profile Information:\n")
-                f.write(f"  Name: {self.user.name}\n")
-                f.write(f"  Age: {self.user.age} years\n")
-                f.write(f"  Gender: {self.user.gender.capitalize()}\n")
-                f.write(f"  Goal: {WorkoutDatabase.GOAL_NAMES[self.user.goal - 1]}\n")
-                f.write(f"  Training Days: {self.user.training_days} days per week\n")
-                f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                age_reduction = WorkoutCalculator.calculate_age_reduction(self.user.age)
-                if age_reduction > 0:
-                    f.write(f"Note: Workouts adjusted by {age_reduction}% for age\n\n")
-                
-                for day_plan in self.workout_plan:
-                    f.write("-" * 80 + "\n")
-                    f.write(f"DAY {day_plan['day']}\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(day_plan['workout'] + "\n\n")
-                
-                f.write("=" * 80 + "\n")
-                f.write("Keep up the great work! Stay consistent and track your progress.\n")
-                f.write("=" * 80 + "\n")
+            export_user(filename, self.user, self.workout_plan, fmt)
             
             print(f"\n{Colors.GREEN}{Colors.BOLD}Workout plan exported successfully!{Colors.END}")
             print(f"{Colors.CYAN}File saved as: {filename}{Colors.END}")
@@ -434,12 +539,11 @@ class GymWorkoutPlanner:
             input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
             return
         
-        self.clear_screen()
-        self.print_header("LOG WORKOUT")
-        
-        print(f"{Colors.BOLD}Which day did you complete?{Colors.END}")
+        screen = Screen().header("LOG WORKOUT")
+        screen.add(f"{Colors.BOLD}Which day did you complete?{Colors.END}")
         for i in range(1, self.user.training_days + 1):
-            print(f"  {i}. Day {i}")
+            screen.add(f"  {i}. Day {i}")
+        screen.show()
         
         try:
             day = int(input(f"\n{Colors.BOLD}Enter day number: {Colors.END}"))
@@ -470,16 +574,15 @@ class GymWorkoutPlanner:
             input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
             return
         
-        self.clear_screen()
-        self.print_header("WORKOUT PROGRESS")
-        
-        print(f"{Colors.BOLD}Total workouts completed: {len(self.user.progress_log)}{Colors.END}\n")
+        screen = Screen().header("WORKOUT PROGRESS")
+        screen.add(f"{Colors.BOLD}Total workouts completed: {len(self.user.progress_log)}{Colors.END}\n")
         
         for i, entry in enumerate(self.user.progress_log, 1):
-            print(f"{Colors.GREEN}{i}.{Colors.END} {entry['date']} - Day {entry['day']}")
+            screen.add(f"{Colors.GREEN}{i}.{Colors.END} {entry['date']} - Day {entry['day']}")
             if entry['notes']:
-                print(f"   {Colors.CYAN}Notes: {entry['notes']}{Colors.END}")
+                screen.add(f"   {Colors.CYAN}Notes: {entry['notes']}{Colors.END}")
         
+        screen.page()
         input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
     
     def save_user_data(self):
@@ -494,12 +597,11 @@ class GymWorkoutPlanner:
     def load_user_data(self) -> bool:
         """Load user data from JSON file"""
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.user = User.from_dict(data)
-                    self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
-                    return True
+            data = read_profile(self.data_file)  # Includes workouts journaled by the CLI
+            if data is not None:
+                self.user = User.from_dict(data)
+                self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
+                return True
         except Exception as e:
             print(f"{Colors.RED}Error loading user data: {e}{Colors.END}")
         return False
@@ -507,20 +609,20 @@ class GymWorkoutPlanner:
     def show_main_menu(self):
         """Display and handle main menu"""
         while True:
-            self.clear_screen()
-            self.print_header("GYM WORKOUT PLANNER")
+            screen = Screen().header("GYM WORKOUT PLANNER")
             
             if self.user:
-                print(f"{Colors.GREEN}Welcome back, {self.user.name}!{Colors.END}\n")
+                screen.add(f"{Colors.GREEN}Welcome back, {self.user.name}!{Colors.END}\n")
             
-            print(f"{Colors.BOLD}Main Menu:{Colors.END}")
-            print(f"  {Colors.GREEN}1.{Colors.END} {'Update' if self.user else 'Create'} Profile")
-            print(f"  {Colors.GREEN}2.{Colors.END} View Workout Plan")
-            print(f"  {Colors.GREEN}3.{Colors.END} Export Workout Plan")
-            print(f"  {Colors.GREEN}4.{Colors.END} Log Completed Workout")
-            print(f"  {Colors.GREEN}5.{Colors.END} View Progress History")
-            print(f"  {Colors.GREEN}6.{Colors.END} About")
-            print(f"  {Colors.RED}0.{Colors.END} Exit")
+            screen.add(f"{Colors.BOLD}Main Menu:{Colors.END}")
+            screen.add(f"  {Colors.GREEN}1.{Colors.END} {'Update' if self.user else 'Create'} Profile")
+            screen.add(f"  {Colors.GREEN}2.{Colors.END} View Workout Plan")
+            screen.add(f"  {Colors.GREEN}3.{Colors.END} Export Workout Plan")
+            screen.add(f"  {Colors.GREEN}4.{Colors.END} Log Completed Workout")
+            screen.add(f"  {Colors.GREEN}5.{Colors.END} View Progress History")
+            screen.add(f"  {Colors.GREEN}6.{Colors.END} About")
+            screen.add(f"  {Colors.RED}0.{Colors.END} Exit")
+            screen.show()
             
             try:
                 choice = input(f"\n{Colors.BOLD}Enter your choice: {Colors.END}").strip()
@@ -538,10 +640,10 @@ class GymWorkoutPlanner:
                 elif choice == '6':
                     self.show_about()
                 elif choice == '0':
-                    self.clear_screen()
-                    print(f"\n{Colors.GREEN}{Colors.BOLD}Thank you for using Gym Workout Planner!{Colors.END}")
+                    screen = Screen().add(f"\n{Colors.GREEN}{Colors.BOLD}Thank you for using Gym Workout Planner!{Colors.END}")
                     if self.user:
-                        print(f"{Colors.CYAN}Keep up the great work, {self.user.name}!{Colors.END}\n")
+                        screen.add(f"{Colors.CYAN}Keep up the great work, {self.user.name}!{Colors.END}\n")
+                    screen.show()
                     break
                 else:
                     print(f"\n{Colors.RED}Invalid choice. Please try again.{Colors.END}")
@@ -552,22 +654,22 @@ class GymWorkoutPlanner:
     
     def show_about(self):
         """Show about information"""
-        self.clear_screen()
-        self.print_header("ABOUT")
+        screen = Screen().header("ABOUT")
         
-        print(f"{Colors.BOLD}Gym Workout Planner v2.0{Colors.END}")
-        print(f"{Colors.CYAN}Author: Aryan Kumawat{Colors.END}\n")
+        screen.add(f"{Colors.BOLD}Gym Workout Planner v2.0{Colors.END}")
+        screen.add(f"{Colors.CYAN}Author: Aryan Kumawat{Colors.END}\n")
         
-        print("This interactive platform helps you create personalized workout plans")
-        print("based on your age, gender, fitness goals, and training schedule.\n")
+        screen.add("This interactive platform helps you create personalized workout plans")
+        screen.add("based on your age, gender, fitness goals, and training schedule.\n")
         
-        print(f"{Colors.BOLD}Features:{Colors.END}")
-        print("  • Personalized workout routines")
-        print("  • Age-adjusted exercise intensity")
-        print("  • Multiple fitness goals")
-        print("  • Progress tracking")
-        print("  • Export workout plans")
-        print("  • Save and load user profiles")
+        screen.add(f"{Colors.BOLD}Features:{Colors.END}")
+        screen.add("  • Personalized workout routines")
+        screen.add("  • Age-adjusted exercise intensity")
+        screen.add("  • Multiple fitness goals")
+        screen.add("  • Progress tracking")
+        screen.add("  • Export workout plans")
+        screen.add("  • Save and load user profiles")
+        screen.show()
         
         input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
     
@@ -577,7 +679,29 @@ class GymWorkoutPlanner:
         self.show_main_menu()
 
 
-if __name__ == "__main__":
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    from gym_metrics import configure
+    argv = configure(argv)
+    
+    if '--profile-startup' in argv:
+        from gym_profiling import profile_terminal_startup
+        return profile_terminal_startup('gym.py', 'gym', GymWorkoutPlanner, WorkoutCalculator,
+                                        lambda: User("Sample", 30, "male", 1, 7),
+                                        as_json='--json' in argv)
+    
+    if argv:
+        # Any other arguments select a non-interactive command
+        from gym_cli import main as cli_main
+        return cli_main(argv)
+    
     app = GymWorkoutPlanner()
     app.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
 
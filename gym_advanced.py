@@ -7,15 +7,23 @@ Includes: Custom workouts, Rest day recommendations, Weight tracking, Statistics
 
 import math
 import json
-import os
+import sys
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from gym import Colors, WorkoutDatabase, WorkoutCalculator
+from gym import Colors, Screen, WorkoutDatabase, WorkoutCalculator
+from gym_archive import archived, archived_streak, read_profile
+from gym_columnar import ProgressLog, columnar_log, epoch_seconds
+from gym_records import compact_progress, compact_weights, plain_log
 
 
 class AdvancedUser:
     """Enhanced user profile with advanced features"""
     
+    __slots__ = ('name', 'age', 'gender', 'goal', 'training_days', 'progress_log',
+                 'custom_workouts', 'weight_log', 'rest_days', 'workout_calendar', 'archive',
+                 'journal')
+    
     def __init__(self, name: str = "", age: int = 0, gender: str = "", 
                  goal: int = 0, training_days: int = 0):
         self.name = name
@@ -24,29 +32,37 @@ class AdvancedUser:
         self.goal = goal
         self.training_days = training_days
         self.progress_log = []
-        self.custom_workouts = []  # NEW: Custom workouts
+        self.custom_workouts = CustomWorkoutStore()  # NEW: Custom workouts
         self.weight_log = []  # NEW: Weight tracking
         self.rest_days = []  # NEW: Rest day tracking
         self.workout_calendar = {}  # NEW: Calendar mapping
+        self.archive = {}  # Rollups of history moved out by gym_archive.compact
+        self.journal = {}  # Journal bytes already replayed into this profile (gym_archive)
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary for JSON serialization"""
-        return {
+        data = {
             'name': self.name,
             'age': self.age,
             'gender': self.gender,
             'goal': self.goal,
             'training_days': self.training_days,
-            'progress_log': self.progress_log,
-            'custom_workouts': self.custom_workouts,
-            'weight_log': self.weight_log,
+            'progress_log': plain_log(self.progress_log),
+            'custom_workouts': self.custom_workouts.to_list(),
+            'weight_log': plain_log(self.weight_log),
             'rest_days': self.rest_days,
             'workout_calendar': self.workout_calendar
         }
+        if self.archive:
+            data['archive'] = self.archive
+        if self.journal:
+            data['journal'] = self.journal
+        return data
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'AdvancedUser':
-        """Create user from dictionary"""
+    def from_dict(cls, data: Dict, compact: bool = False, columnar: bool = False) -> 'AdvancedUser':
+        """Create user from dictionary (compact: keep the logs as slotted records,
+        columnar: keep progress_log as a ProgressLog)"""
         user = cls(
             name=data.get('name', ''),
             age=data.get('age', 0),
@@ -55,21 +71,39 @@ class AdvancedUser:
             training_days=data.get('training_days', 0)
         )
         user.progress_log = data.get('progress_log', [])
-        user.custom_workouts = data.get('custom_workouts', [])
+        user.custom_workouts = CustomWorkoutStore(data.get('custom_workouts', []))
         user.weight_log = data.get('weight_log', [])
         user.rest_days = data.get('rest_days', [])
         user.workout_calendar = data.get('workout_calendar', {})
+        user.archive = data.get('archive', {})
+        user.journal = data.get('journal', {})
+        if compact:
+            user.progress_log = compact_progress(user.progress_log)
+            user.weight_log = compact_weights(user.weight_log)
+        if columnar:
+            user.progress_log = ProgressLog(user.progress_log)
         return user
 
 
 class CustomWorkoutManager:
     """Manages custom workout creation and editing"""
     
-    @staticmethod
-    def create_custom_workout(name: str, exercises: List[Dict]) -> Dict:
+    _last_id = 0
+    _id_lock = threading.Lock()
+    
+    @classmethod
+    def next_id(cls, after: int = 0) -> str:
+        """Timestamp-style ID, strictly increasing within the process and above after"""
+        with cls._id_lock:
+            value = max(int(datetime.now().strftime('%Y%m%d%H%M%S')), cls._last_id + 1, after + 1)
+            cls._last_id = value
+        return str(value)
+    
+    @classmethod
+    def create_custom_workout(cls, name: str, exercises: List[Dict], workout_id: Optional[str] = None) -> Dict:
         """Create a custom workout with exercises"""
         return {
-            'id': datetime.now().strftime('%Y%m%d%H%M%S'),
+            'id': workout_id or cls.next_id(),
             'name': name,
             'exercises': exercises,
             'created_at': datetime.now().strftime('%Y-%m-%d %H:%M')
@@ -87,6 +121,81 @@ class CustomWorkoutManager:
         return '\n'.join(lines)
 
 
+class CustomWorkoutStore:
+    """A member's custom workouts keyed by ID, with cached display text
+    
+    Workouts keep their insertion order. Change them through update() so the
+    cached text is re-rendered; IDs duplicated in older data files are reassigned.
+    """
+    
+    def __init__(self, workouts: Optional[List[Dict]] = None):
+        self._workouts: Dict[str, Dict] = {}
+        self._versions: Dict[str, int] = {}
+        self._rendered: Dict[str, tuple] = {}  # ID -> (version, text)
+        self._last_id = 0
+        for workout in workouts or []:
+            workout_id = str(workout.get('id', ''))
+            if not workout_id or workout_id in self._workouts:
+                workout_id = CustomWorkoutManager.next_id(self._last_id)
+            workout['id'] = workout_id
+            self._insert(workout)
+    
+    def _insert(self, workout: Dict):
+        self._workouts[workout['id']] = workout
+        self._versions[workout['id']] = 0
+        if workout['id'].isdigit():
+            self._last_id = max(self._last_id, int(workout['id']))
+    
+    def add(self, name: str, exercises: List[Dict]) -> Dict:
+        """Create and store a workout with a new unique ID"""
+        workout = CustomWorkoutManager.create_custom_workout(
+            name, exercises, CustomWorkoutManager.next_id(self._last_id))
+        self._insert(workout)
+        return workout
+    
+    def get(self, workout_id: str) -> Optional[Dict]:
+        return self._workouts.get(workout_id)
+    
+    def update(self, workout_id: str, name: Optional[str] = None,
+               exercises: Optional[List[Dict]] = None) -> Dict:
+        """Change a workout's name and/or exercises"""
+        workout = self._workouts[workout_id]
+        if name is not None:
+            workout['name'] = name
+        if exercises is not None:
+            workout['exercises'] = exercises
+        self._versions[workout_id] += 1
+        return workout
+    
+    def delete(self, workout_id: str) -> bool:
+        if self._workouts.pop(workout_id, None) is None:
+            return False
+        del self._versions[workout_id]
+        self._rendered.pop(workout_id, None)
+        return True
+    
+    def render(self, workout_id: str) -> str:
+        """format_custom_workout() text, rendered once per version"""
+        version = self._versions[workout_id]
+        cached = self._rendered.get(workout_id)
+        if cached is None or cached[0] != version:
+            cached = (version, CustomWorkoutManager.format_custom_workout(self._workouts[workout_id]))
+            self._rendered[workout_id] = cached
+        return cached[1]
+    
+    def to_list(self) -> List[Dict]:
+        return list(self._workouts.values())
+    
+    def __len__(self) -> int:
+        return len(self._workouts)
+    
+    def __iter__(self):
+        return iter(list(self._workouts.values()))
+    
+    def __contains__(self, workout_id) -> bool:
+        return workout_id in self._workouts
+
+
 class RestDayRecommender:
     """Provides intelligent rest day recommendations"""
     
@@ -112,38 +221,57 @@ class RestDayRecommender:
         return min(base_rest, 4)  # Cap at 4 rest days
     
     @staticmethod
-    def should_rest_today(user: 'AdvancedUser') -> tuple:
-        """Determine if user should rest today based on recent activity"""
-        if not user.progress_log:
-            return False, "No workout history available"
-        
-        # Check last 7 days
-        recent_workouts = []
-        today = datetime.now()
-        
-        for log in user.progress_log:
+    def recent_activity(progress_log, now: datetime) -> List[int]:
+        """Workouts per day ago (0-7) as of now; the last slot counts entries dated after now"""
+        activity = [0] * 9
+        columns = columnar_log(progress_log)
+        if columns is not None:
+            # Entries less than 8 days old, read straight from the minutes column
+            seconds = epoch_seconds(now)
+            for minute in columns.since((seconds - 8 * 86400) // 60):
+                days_ago = (seconds - minute * 60) // 86400
+                activity[days_ago if days_ago >= 0 else 8] += 1
+            return activity
+
+        # Dates sort as text, so only entries after the cutoff need parsing
+        cutoff = (now - timedelta(days=8)).strftime('%Y-%m-%d %H:%M')
+        for log in progress_log:
+            text = log.get('date')
+            if not isinstance(text, str) or text <= cutoff:
+                continue
             try:
-                log_date = datetime.strptime(log['date'], '%Y-%m-%d %H:%M')
-                days_ago = (today - log_date).days
-                if days_ago <= 7:
-                    recent_workouts.append(days_ago)
-            except:
+                days_ago = (now - datetime.strptime(text, '%Y-%m-%d %H:%M')).days
+            except ValueError:
                 continue
-        
-        # Recommendations
-        if not recent_workouts:
+            if days_ago <= 7:
+                activity[days_ago if days_ago >= 0 else 8] += 1
+        return activity
+    
+    @staticmethod
+    def advise(activity: List[int], training_days: int) -> tuple:
+        """Rest recommendation from recent_activity() counts"""
+        workouts_this_week = sum(activity)
+        if not workouts_this_week:
             return False, "No recent workouts - you're good to train!"
         
-        if 0 in recent_workouts or 1 in recent_workouts:
-            consecutive = sum(1 for d in recent_workouts if d <= 2)
+        if activity[0] or activity[1]:
+            consecutive = activity[0] + activity[1] + activity[2] + activity[8]
             if consecutive >= 3:
                 return True, "You've worked out 3+ times in the last 2 days. Consider resting."
         
-        workouts_this_week = len(recent_workouts)
-        if workouts_this_week >= user.training_days:
+        if workouts_this_week >= training_days:
             return True, f"You've completed your weekly goal ({workouts_this_week} workouts). Rest or do light activity."
         
-        return False, f"You have {user.training_days - workouts_this_week} workouts left this week."
+        return False, f"You have {training_days - workouts_this_week} workouts left this week."
+    
+    @staticmethod
+    def should_rest_today(user: 'AdvancedUser', now: Optional[datetime] = None) -> tuple:
+        """Determine if user should rest today (or at now) based on recent activity"""
+        if not user.progress_log:
+            return False, "No workout history available"
+        
+        activity = RestDayRecommender.recent_activity(user.progress_log, now or datetime.now())
+        return RestDayRecommender.advise(activity, user.training_days)
 
 
 class WeightTracker:
@@ -162,7 +290,8 @@ class WeightTracker:
     @staticmethod
     def get_weight_statistics(user: 'AdvancedUser') -> Dict:
         """Calculate weight statistics"""
-        if not user.weight_log:
+        rollup = archived(user, 'weight_log')
+        if not user.weight_log and rollup is None:
             return {'error': 'No weight data available'}
         
         weights = [entry['weight'] for entry in user.weight_log]
@@ -177,6 +306,19 @@ class WeightTracker:
             'entries': len(weights)
         }
         
+        if rollup is not None:  # Include the archived weigh-ins
+            current = weights[-1] if weights else rollup['latest']
+            entries = rollup['count'] + len(weights)
+            stats.update(
+                current=current,
+                starting=rollup['starting'],
+                highest=max(weights + [rollup['highest']]),
+                lowest=min(weights + [rollup['lowest']]),
+                average=(rollup['total'] + sum(weights)) / entries,
+                total_change=current - rollup['starting'] if entries > 1 else 0,
+                entries=entries
+            )
+        
         return stats
     
     @staticmethod
@@ -209,10 +351,11 @@ class WorkoutStatistics:
     @staticmethod
     def get_statistics(user: 'AdvancedUser') -> Dict:
         """Get comprehensive workout statistics"""
-        if not user.progress_log:
+        rollup = archived(user, 'progress_log')
+        if not user.progress_log and rollup is None:
             return {'error': 'No workout data available'}
         
-        total_workouts = len(user.progress_log)
+        total_workouts = len(user.progress_log) + (rollup['count'] if rollup else 0)
         
         # Calculate streaks
         current_streak = WorkoutStatistics._calculate_current_streak(user)
@@ -222,10 +365,19 @@ class WorkoutStatistics:
         weekly_avg = WorkoutStatistics._calculate_weekly_average(user)
         
         # Most active day
-        days_count = {}
-        for log in user.progress_log:
-            day = log.get('day', 0)
-            days_count[day] = days_count.get(day, 0) + 1
+        columns = columnar_log(user.progress_log)
+        if columns is not None:
+            days_count = columns.day_counts()
+        else:
+            days_count = {}
+            for log in user.progress_log:
+                day = log.get('day', 0)
+                days_count[day] = days_count.get(day, 0) + 1
+        if rollup is not None:  # Archived days first, as they come first in the history
+            recent = days_count
+            days_count = dict(rollup['days'])
+            for day, count in recent.items():
+                days_count[day] = days_count.get(day, 0) + count
         
         most_active_day = max(days_count.items(), key=lambda x: x[1])[0] if days_count else 0
         
@@ -235,18 +387,28 @@ class WorkoutStatistics:
             'longest_streak': longest_streak,
             'weekly_average': weekly_avg,
             'most_active_day': most_active_day,
-            'days_trained': len(set(log.get('day', 0) for log in user.progress_log))
+            'days_trained': len(days_count)
         }
     
     @staticmethod
     def _calculate_current_streak(user: 'AdvancedUser') -> int:
         """Calculate current consecutive workout streak"""
-        if not user.progress_log:
+        if not user.progress_log and archived(user, 'progress_log') is None:
             return 0
         
         streak = 0
         today = datetime.now().date()
         
+        columns = columnar_log(user.progress_log)
+        if columns is not None:
+            today = today.toordinal()
+            for ordinal in columns.ordinals_descending():
+                if today - ordinal > 1:
+                    return streak
+                streak += 1
+                today = ordinal
+            return streak + archived_streak(user, today)
+        
         # Sort by date
         sorted_logs = sorted(user.progress_log, key=lambda x: x['date'], reverse=True)
         
@@ -259,16 +421,17 @@ class WorkoutStatistics:
                     streak += 1
                     today = log_date
                 else:
-                    break
+                    return streak
             except:
                 continue
         
-        return streak
+        # Every recent workout is part of the streak, which may continue into the archive
+        return streak + archived_streak(user, today.toordinal())
     
     @staticmethod
     def _calculate_longest_streak(user: 'AdvancedUser') -> int:
         """Calculate longest workout streak"""
-        if not user.progress_log:
+        if not user.progress_log and archived(user, 'progress_log') is None:
             return 0
         
         # Implementation simplified - returns current streak for now
@@ -277,9 +440,25 @@ class WorkoutStatistics:
     @staticmethod
     def _calculate_weekly_average(user: 'AdvancedUser') -> float:
         """Calculate average workouts per week"""
+        rollup = archived(user, 'progress_log')
+        if rollup is not None:
+            try:
+                first_date = datetime.strptime(rollup['first_date'], '%Y-%m-%d %H:%M')
+                last_text = user.progress_log[-1]['date'] if user.progress_log else rollup['newest_date']
+                last_date = datetime.strptime(last_text, '%Y-%m-%d %H:%M')
+                weeks = max((last_date - first_date).days / 7, 1)
+                return (len(user.progress_log) + rollup['count']) / weeks
+            except:
+                return 0.0
+        
         if not user.progress_log:
             return 0.0
         
+        columns = columnar_log(user.progress_log)
+        if columns is not None:
+            weeks = max((columns.minutes[-1] - columns.minutes[0]) // 1440 / 7, 1)
+            return len(columns) / weeks
+        
         try:
             first_date = datetime.strptime(user.progress_log[0]['date'], '%Y-%m-%d %H:%M')
             last_date = datetime.strptime(user.progress_log[-1]['date'], '%Y-%m-%d %H:%M')
@@ -338,12 +517,11 @@ class AdvancedGymWorkoutPlanner:
     def load_user_data(self) -> bool:
         """Load user data from JSON file"""
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.user = AdvancedUser.from_dict(data)
-                    self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
-                    return True
+            data = read_profile(self.data_file)  # Includes workouts journaled by the CLI
+            if data is not None:
+                self.user = AdvancedUser.from_dict(data)
+                self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
+                return True
         except Exception as e:
             print(f"{Colors.RED}Error loading user data: {e}{Colors.END}")
         return False
@@ -363,30 +541,32 @@ class AdvancedGymWorkoutPlanner:
             print(f"\n{Colors.RED}Please create a profile first.{Colors.END}")
             return
         
-        print(f"\n{Colors.CYAN}{Colors.BOLD}{'='*80}{Colors.END}")
-        print(f"{Colors.CYAN}{Colors.BOLD}WORKOUT STATISTICS{Colors.END}")
-        print(f"{Colors.CYAN}{Colors.BOLD}{'='*80}{Colors.END}\n")
+        screen = Screen()
+        screen.add(f"\n{Colors.CYAN}{Colors.BOLD}{'='*80}{Colors.END}")
+        screen.add(f"{Colors.CYAN}{Colors.BOLD}WORKOUT STATISTICS{Colors.END}")
+        screen.add(f"{Colors.CYAN}{Colors.BOLD}{'='*80}{Colors.END}\n")
         
         stats = WorkoutStatistics.get_statistics(self.user)
         
         if 'error' in stats:
-            print(f"{Colors.YELLOW}{stats['error']}{Colors.END}")
+            screen.add(f"{Colors.YELLOW}{stats['error']}{Colors.END}")
         else:
-            print(f"{Colors.GREEN}Total Workouts:{Colors.END} {stats['total_workouts']}")
-            print(f"{Colors.GREEN}Current Streak:{Colors.END} {stats['current_streak']} days")
-            print(f"{Colors.GREEN}Longest Streak:{Colors.END} {stats['longest_streak']} days")
-            print(f"{Colors.GREEN}Weekly Average:{Colors.END} {stats['weekly_average']:.1f} workouts/week")
-            print(f"{Colors.GREEN}Most Active Day:{Colors.END} Day {stats['most_active_day']}")
+            screen.add(f"{Colors.GREEN}Total Workouts:{Colors.END} {stats['total_workouts']}")
+            screen.add(f"{Colors.GREEN}Current Streak:{Colors.END} {stats['current_streak']} days")
+            screen.add(f"{Colors.GREEN}Longest Streak:{Colors.END} {stats['longest_streak']} days")
+            screen.add(f"{Colors.GREEN}Weekly Average:{Colors.END} {stats['weekly_average']:.1f} workouts/week")
+            screen.add(f"{Colors.GREEN}Most Active Day:{Colors.END} Day {stats['most_active_day']}")
         
         # Weight statistics
         if self.user.weight_log:
-            print(f"\n{Colors.CYAN}WEIGHT TRACKING{Colors.END}")
+            screen.add(f"\n{Colors.CYAN}WEIGHT TRACKING{Colors.END}")
             weight_stats = WeightTracker.get_weight_statistics(self.user)
-            print(f"{Colors.GREEN}Current Weight:{Colors.END} {weight_stats['current']:.1f} {self.user.weight_log[-1]['unit']}")
-            print(f"{Colors.GREEN}Starting Weight:{Colors.END} {weight_stats['starting']:.1f} {self.user.weight_log[0]['unit']}")
-            print(f"{Colors.GREEN}Total Change:{Colors.END} {weight_stats['total_change']:+.1f} {self.user.weight_log[-1]['unit']}")
-            print(f"{Colors.GREEN}Trend:{Colors.END} {WeightTracker.get_weight_trend(self.user)}")
+            screen.add(f"{Colors.GREEN}Current Weight:{Colors.END} {weight_stats['current']:.1f} {self.user.weight_log[-1]['unit']}")
+            screen.add(f"{Colors.GREEN}Starting Weight:{Colors.END} {weight_stats['starting']:.1f} {self.user.weight_log[0]['unit']}")
+            screen.add(f"{Colors.GREEN}Total Change:{Colors.END} {weight_stats['total_change']:+.1f} {self.user.weight_log[-1]['unit']}")
+            screen.add(f"{Colors.GREEN}Trend:{Colors.END} {WeightTracker.get_weight_trend(self.user)}")
         
+        screen.show(clear=False)
         input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
     
     def manage_weight(self):
@@ -395,13 +575,15 @@ class AdvancedGymWorkoutPlanner:
             print(f"\n{Colors.RED}Please create a profile first.{Colors.END}")
             return
         
-        print(f"\n{Colors.CYAN}{Colors.BOLD}WEIGHT TRACKING{Colors.END}")
-        print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
+        screen = Screen()
+        screen.add(f"\n{Colors.CYAN}{Colors.BOLD}WEIGHT TRACKING{Colors.END}")
+        screen.add(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
         
-        print("1. Add weight entry")
-        print("2. View weight history")
-        print("3. View weight statistics")
-        print("0. Back")
+        screen.add("1. Add weight entry")
+        screen.add("2. View weight history")
+        screen.add("3. View weight statistics")
+        screen.add("0. Back")
+        screen.show(clear=False)
         
         choice = input(f"\n{Colors.BOLD}Choose an option: {Colors.END}")
         
@@ -419,9 +601,10 @@ class AdvancedGymWorkoutPlanner:
             if not self.user.weight_log:
                 print(f"\n{Colors.YELLOW}No weight entries yet{Colors.END}")
             else:
-                print(f"\n{Colors.CYAN}WEIGHT HISTORY{Colors.END}")
+                screen.add(f"\n{Colors.CYAN}WEIGHT HISTORY{Colors.END}")
                 for i, entry in enumerate(self.user.weight_log, 1):
-                    print(f"{i}. {entry['date']}: {entry['weight']} {entry['unit']}")
+                    screen.add(f"{i}. {entry['date']}: {entry['weight']} {entry['unit']}")
+                screen.page(clear=False)
         
         elif choice == '3':
             stats = WeightTracker.get_weight_statistics(self.user)
@@ -440,13 +623,111 @@ class AdvancedGymWorkoutPlanner:
         
         should_rest, message = RestDayRecommender.should_rest_today(self.user)
         
-        print(f"\n{Colors.CYAN}{Colors.BOLD}REST DAY RECOMMENDATION{Colors.END}")
-        print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
+        screen = Screen()
+        screen.add(f"\n{Colors.CYAN}{Colors.BOLD}REST DAY RECOMMENDATION{Colors.END}")
+        screen.add(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
         
         if should_rest:
-            print(f"{Colors.YELLOW}{message}{Colors.END}")
+            screen.add(f"{Colors.YELLOW}{message}{Colors.END}")
         else:
-            print(f"{Colors.GREEN}{message}{Colors.END}")
+            screen.add(f"{Colors.GREEN}{message}{Colors.END}")
+        screen.show(clear=False)
+        
+        input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
+    
+    @staticmethod
+    def _read_exercises() -> List[Dict]:
+        """Prompt for exercises until a blank name is entered"""
+        exercises = []
+        print(f"\n{Colors.CYAN}Enter exercises (blank name to finish){Colors.END}")
+        while True:
+            name = input(f"Exercise {len(exercises) + 1} name: ").strip()
+            if not name:
+                return exercises
+            kind = input("Type (reps/mins) [reps]: ").strip().lower() or 'reps'
+            try:
+                value = int(input("Reps per set: " if kind == 'reps' else "Minutes per set: "))
+                sets = int(input("Sets: "))
+                if value <= 0 or sets <= 0:
+                    raise ValueError
+            except ValueError:
+                print(f"{Colors.RED}Please enter positive whole numbers{Colors.END}")
+                continue
+            exercises.append({'name': name, 'type': 'reps' if kind == 'reps' else 'time',
+                              'value': value, 'sets': sets})
+    
+    def _choose_custom_workout(self) -> Optional[str]:
+        workouts = list(self.user.custom_workouts)
+        if not workouts:
+            print(f"\n{Colors.YELLOW}No custom workouts yet{Colors.END}")
+            return None
+        for i, workout in enumerate(workouts, 1):
+            print(f"{i}. {workout['name']}")
+        try:
+            number = int(input(f"\n{Colors.BOLD}Workout number: {Colors.END}"))
+            if 1 <= number <= len(workouts):
+                return workouts[number - 1]['id']
+        except ValueError:
+            pass
+        print(f"\n{Colors.RED}Invalid workout number{Colors.END}")
+        return None
+    
+    def manage_custom_workouts(self):
+        """Custom workouts menu"""
+        if not self.user:
+            print(f"\n{Colors.RED}Please create a profile first.{Colors.END}")
+            return
+        
+        store = self.user.custom_workouts
+        screen = Screen()
+        screen.add(f"\n{Colors.CYAN}{Colors.BOLD}CUSTOM WORKOUTS{Colors.END}")
+        screen.add(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
+        
+        screen.add("1. Create custom workout")
+        screen.add(f"2. View custom workouts ({len(store)})")
+        screen.add("3. Edit custom workout")
+        screen.add("4. Delete custom workout")
+        screen.add("0. Back")
+        screen.show(clear=False)
+        
+        choice = input(f"\n{Colors.BOLD}Choose an option: {Colors.END}")
+        
+        if choice == '1':
+            name = input("Workout name: ").strip()
+            exercises = self._read_exercises() if name else []
+            if exercises:
+                store.add(name, exercises)
+                self.save_user_data()
+                print(f"\n{Colors.GREEN}Custom workout created!{Colors.END}")
+            else:
+                print(f"\n{Colors.YELLOW}A workout needs a name and at least one exercise{Colors.END}")
+        
+        elif choice == '2':
+            if not store:
+                print(f"\n{Colors.YELLOW}No custom workouts yet{Colors.END}")
+            else:
+                for workout in store:
+                    screen.add(f"\n{store.render(workout['id'])}")
+                    screen.add(f"{Colors.CYAN}Created: {workout['created_at']}{Colors.END}")
+                screen.page(clear=False)
+        
+        elif choice == '3':
+            workout_id = self._choose_custom_workout()
+            if workout_id:
+                name = input(f"New name [{store.get(workout_id)['name']}]: ").strip() or None
+                exercises = None
+                if input("Re-enter the exercises? (y/N): ").strip().lower() == 'y':
+                    exercises = self._read_exercises() or None
+                store.update(workout_id, name, exercises)
+                self.save_user_data()
+                print(f"\n{Colors.GREEN}Custom workout updated!{Colors.END}")
+        
+        elif choice == '4':
+            workout_id = self._choose_custom_workout()
+            if workout_id and input("Delete this workout? (y/N): ").strip().lower() == 'y':
+                store.delete(workout_id)
+                self.save_user_data()
+                print(f"\n{Colors.GREEN}Custom workout deleted{Colors.END}")
         
         input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
     
@@ -455,24 +736,24 @@ class AdvancedGymWorkoutPlanner:
         self.load_user_data()
         
         while True:
-            os.system('clear' if os.name != 'nt' else 'cls')
-            
-            print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.END}")
-            print(f"{Colors.HEADER}{Colors.BOLD}GYM WORKOUT PLANNER - ADVANCED EDITION{Colors.END}")
-            print(f"{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.END}\n")
+            screen = Screen()
+            screen.add(f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.END}")
+            screen.add(f"{Colors.HEADER}{Colors.BOLD}GYM WORKOUT PLANNER - ADVANCED EDITION{Colors.END}")
+            screen.add(f"{Colors.HEADER}{Colors.BOLD}{'='*80}{Colors.END}\n")
             
             if self.user:
-                print(f"{Colors.GREEN}Welcome back, {self.user.name}!{Colors.END}\n")
+                screen.add(f"{Colors.GREEN}Welcome back, {self.user.name}!{Colors.END}\n")
             
-            print(f"{Colors.BOLD}Main Menu:{Colors.END}")
-            print(f"  {Colors.GREEN}1.{Colors.END} Profile & Settings")
-            print(f"  {Colors.GREEN}2.{Colors.END} View Workout Plan")
-            print(f"  {Colors.GREEN}3.{Colors.END} Log Workout")
-            print(f"  {Colors.GREEN}4.{Colors.END} Statistics & Analytics")
-            print(f"  {Colors.GREEN}5.{Colors.END} Weight Tracking")
-            print(f"  {Colors.GREEN}6.{Colors.END} Rest Day Check")
-            print(f"  {Colors.GREEN}7.{Colors.END} Custom Workouts (Coming Soon)")
-            print(f"  {Colors.RED}0.{Colors.END} Exit")
+            screen.add(f"{Colors.BOLD}Main Menu:{Colors.END}")
+            screen.add(f"  {Colors.GREEN}1.{Colors.END} Profile & Settings")
+            screen.add(f"  {Colors.GREEN}2.{Colors.END} View Workout Plan")
+            screen.add(f"  {Colors.GREEN}3.{Colors.END} Log Workout")
+            screen.add(f"  {Colors.GREEN}4.{Colors.END} Statistics & Analytics")
+            screen.add(f"  {Colors.GREEN}5.{Colors.END} Weight Tracking")
+            screen.add(f"  {Colors.GREEN}6.{Colors.END} Rest Day Check")
+            screen.add(f"  {Colors.GREEN}7.{Colors.END} Custom Workouts")
+            screen.add(f"  {Colors.RED}0.{Colors.END} Exit")
+            screen.show()
             
             try:
                 choice = input(f"\n{Colors.BOLD}Enter your choice: {Colors.END}").strip()
@@ -490,13 +771,12 @@ class AdvancedGymWorkoutPlanner:
                 elif choice == '6':
                     self.check_rest_recommendation()
                 elif choice == '7':
-                    print(f"\n{Colors.YELLOW}Custom workouts feature coming soon!{Colors.END}")
-                    input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.END}")
+                    self.manage_custom_workouts()
                 elif choice == '0':
-                    os.system('clear' if os.name != 'nt' else 'cls')
-                    print(f"\n{Colors.GREEN}{Colors.BOLD}Thank you for using Advanced Gym Workout Planner!{Colors.END}")
+                    screen = Screen().add(f"\n{Colors.GREEN}{Colors.BOLD}Thank you for using Advanced Gym Workout Planner!{Colors.END}")
                     if self.user:
-                        print(f"{Colors.CYAN}Keep pushing towards your goals, {self.user.name}!{Colors.END}\n")
+                        screen.add(f"{Colors.CYAN}Keep pushing towards your goals, {self.user.name}!{Colors.END}\n")
+                    screen.show()
                     break
                 else:
                     print(f"\n{Colors.RED}Invalid choice. Please try again.{Colors.END}")
@@ -506,7 +786,25 @@ class AdvancedGymWorkoutPlanner:
                 break
 
 
-if __name__ == "__main__":
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    from gym_metrics import configure
+    argv = configure(argv)
+    
+    if '--profile-startup' in argv:
+        from gym_profiling import profile_terminal_startup
+        return profile_terminal_startup('gym_advanced.py', 'gym_advanced',
+                                        AdvancedGymWorkoutPlanner, WorkoutCalculator,
+                                        lambda: AdvancedUser("Sample", 30, "male", 1, 7),
+                                        as_json='--json' in argv)
+    
     app = AdvancedGymWorkoutPlanner()
     app.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
 
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Journal, Compaction and Archive
+Author: Aryan Kumawat
+Keeps the profile file to a recent window; older history lives in compressed yearly segments
+
+Files next to a data file such as user_data.json:
+    user_data.json                  snapshot: profile, recent logs, archive rollups
+    user_data.json.journal          entries logged since the last compaction, one JSON line each
+    user_data.json.archive/         progress_log-2023.json.gz, weight_log-2023.json.xz, ...
+
+A journal starts with a header line holding a random id. read_profile()
+records under 'journal' how many bytes of each journal it replayed (id ->
+offset); every writer saves that record with the snapshot, so the next read
+replays only what was appended since, even when the snapshot was written from
+an older copy of the profile. Entries are never de-duplicated by value: two
+identical weigh-ins on one day are two weigh-ins. compact() first moves the
+journal aside (.journal.folding) so workouts logged meanwhile start a new one.
+
+compact() folds the journal into the snapshot, moves entries older than the
+retention horizon into the segments and updates per-log rollups (counts, plan
+day counts, first dates, the streak reaching into the archive, weight
+summaries) so statistics still cover the whole history.
+"""
+
+import gzip
+import heapq
+import json
+import lzma
+import os
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from gym_records import parse_minute, parse_ordinal
+
+DEFAULT_RETENTION_DAYS = 365
+MIN_RETENTION_DAYS = 35  # Rest checks look back 8 days, workload ratios 28
+CODECS = {'gzip': ('.json.gz', gzip.open), 'lzma': ('.json.xz', lzma.open)}
+LOGS = {'progress_log': parse_minute, 'weight_log': parse_ordinal}  # Log -> date validator
+
+
+def journal_path(path: str) -> str:
+    return f"{path}.journal"
+
+
+def folding_path(path: str) -> str:
+    return f"{path}.journal.folding"
+
+
+def archive_dir(path: str) -> str:
+    return f"{path}.archive"
+
+
+# Journal
+
+def append_journal(path: str, field: str, entry: Dict):
+    """Record one entry appended to progress_log or weight_log without rewriting the snapshot"""
+    if field not in LOGS:
+        raise ValueError(f"Only {', '.join(LOGS)} entries are journaled, not {field!r}")
+    line = json.dumps({'append': field, 'entry': entry}) + "\n"
+    if not os.path.exists(journal_path(path)):
+        line = json.dumps({'journal': os.urandom(8).hex()}) + "\n" + line
+    with open(journal_path(path), 'a') as f:
+        f.write(line)  # One write per record, so concurrent appends do not interleave
+
+
+def _read_journal(filename: str, offsets: Dict[str, int]) -> Tuple[str, List[Dict], int]:
+    """(journal id, records after its replayed offset, offset after the last complete line)
+
+    A last line without its newline is still being written and is left for
+    the next read; other unreadable lines are skipped.
+    """
+    with open(filename, 'rb') as f:
+        first = f.readline()
+        journal_id = ''
+        if first.endswith(b"\n"):
+            try:
+                journal_id = json.loads(first).get('journal') or ''
+            except (ValueError, AttributeError):
+                pass
+        f.seek(max(offsets.get(journal_id, 0), 0))
+        start = f.tell()
+        lines = f.read().split(b"\n")
+    end = start + sum(len(line) + 1 for line in lines[:-1])
+    records = []
+    for line in lines[:-1]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get('append') in LOGS and isinstance(record.get('entry'), dict):
+            records.append(record)
+    return journal_id, records, end
+
+
+def replay_journal(path: str, data: Dict) -> int:
+    """Append the journal entries the snapshot does not hold yet; returns how many"""
+    offsets = data.get('journal')
+    offsets = offsets if isinstance(offsets, dict) else {}
+    replayed = {}
+    added = 0
+    for filename in (folding_path(path), journal_path(path)):
+        if not os.path.exists(filename):
+            continue
+        journal_id, records, end = _read_journal(filename, offsets)
+        for record in records:
+            data.setdefault(record['append'], []).append(record['entry'])
+        replayed[journal_id] = end
+        added += len(records)
+    if replayed:
+        data['journal'] = replayed
+    else:
+        data.pop('journal', None)
+    return added
+
+
+def _load(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def read_profile(path: str) -> Optional[Dict]:
+    """Snapshot plus journal, or None if there is no profile"""
+    data = _load(path)
+    if data is not None:
+        replay_journal(path, data)
+    return data
+
+
+# Rollups
+
+def _ordinal(text: str) -> int:
+    return date.fromisoformat(text[:10]).toordinal()
+
+
+def _add_progress(rollup: Dict, entries: List[Dict]):
+    """Fold entries (in date order, all newer than the rollup) into a progress rollup"""
+    days = dict(rollup.get('days', []))
+    for entry in entries:
+        day = entry.get('day', 0)
+        days[day] = days.get(day, 0) + 1
+        ordinal = _ordinal(entry['date'])
+        newest = rollup.get('newest_date')
+        chained = newest is not None and ordinal - _ordinal(newest) <= 1
+        rollup['tail_run'] = rollup['tail_run'] + 1 if chained else 1  # Streak ending at the newest entry
+        rollup.setdefault('first_date', entry['date'])
+        rollup['newest_date'] = entry['date']
+        rollup['count'] = rollup.get('count', 0) + 1
+    rollup['days'] = [[day, count] for day, count in days.items()]
+
+
+def _add_weights(rollup: Dict, entries: List[Dict]):
+    """Fold weigh-ins (in date order, all newer than the rollup) into a weight rollup"""
+    for entry in entries:
+        weight = entry['weight']
+        if not rollup.get('count'):
+            rollup.update(count=0, total=0, highest=weight, lowest=weight, starting=weight)
+        rollup['count'] += 1
+        rollup['total'] += weight
+        rollup['highest'] = max(rollup['highest'], weight)
+        rollup['lowest'] = min(rollup['lowest'], weight)
+        rollup['latest'] = weight
+        rollup['newest_date'] = entry['date']
+
+
+ROLLUPS = {'progress_log': _add_progress, 'weight_log': _add_weights}
+
+
+def archived(user, field: str) -> Optional[Dict]:
+    """Rollup of the archived part of a user's log, or None"""
+    archive = getattr(user, 'archive', None) or {}
+    rollup = archive.get(field)
+    return rollup if rollup and rollup.get('count') else None
+
+
+def archived_streak(user, ordinal: int) -> int:
+    """Streak entries in the archive that continue a streak reaching back to ordinal"""
+    rollup = archived(user, 'progress_log')
+    if rollup is None or ordinal - _ordinal(rollup['newest_date']) > 1:
+        return 0
+    return rollup['tail_run']
+
+
+# Segments
+
+def _segment_files(path: str, field: str) -> List[str]:
+    directory = archive_dir(path)
+    if not os.path.isdir(directory):
+        return []
+    suffixes = tuple(suffix for suffix, _ in CODECS.values())
+    return sorted(name for name in os.listdir(directory)
+                  if name.startswith(f"{field}-") and name.endswith(suffixes))
+
+
+def _read_segment(filename: str) -> List[Dict]:
+    opener = next(opener for suffix, opener in CODECS.values() if filename.endswith(suffix))
+    with opener(filename, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_segment(filename: str, entries: List[Dict], codec: str):
+    tmp_name = f"{filename}.tmp"
+    with CODECS[codec][1](tmp_name, 'wt', encoding='utf-8') as f:
+        json.dump(entries, f, separators=(',', ':'))
+    os.replace(tmp_name, filename)
+
+
+def _by_date(*logs: List[Dict]) -> List[Dict]:
+    """Logs merged in date order, every entry kept"""
+    key = lambda entry: entry.get('date') or ''
+    return list(heapq.merge(*(sorted(log, key=key) for log in logs), key=key))
+
+
+def iter_archive(path: str, field: str) -> Iterator[Dict]:
+    """Archived entries of a log, oldest first, one segment in memory at a time"""
+    for name in _segment_files(path, field):
+        yield from _read_segment(os.path.join(archive_dir(path), name))
+
+
+def _archive_entries(path: str, field: str, entries: List[Dict], codec: str):
+    """Add entries to their yearly segments"""
+    directory = archive_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    by_year: Dict[str, List[Dict]] = {}
+    for entry in entries:
+        by_year.setdefault(entry['date'][:4], []).append(entry)
+
+    existing = _segment_files(path, field)
+    for year, new in sorted(by_year.items()):
+        old_names = [name for name in existing if name.startswith(f"{field}-{year}.")]
+        old = [entry for name in old_names for entry in _read_segment(os.path.join(directory, name))]
+        filename = os.path.join(directory, f"{field}-{year}{CODECS[codec][0]}")
+        _write_segment(filename, _by_date(old, new), codec)
+        for name in old_names:
+            if os.path.join(directory, name) != filename:
+                os.remove(os.path.join(directory, name))
+
+
+def _write(path: str, data: Dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# Compaction
+
+def _fold(path: str) -> Tuple[Dict, int]:
+    """Snapshot plus journal, with the journal moved aside so it can be removed once saved"""
+    if not os.path.exists(folding_path(path)) and os.path.exists(journal_path(path)):
+        os.replace(journal_path(path), folding_path(path))
+    data = _load(path)
+    if data is None:
+        raise ValueError(f"No profile in {path}")
+    return data, replay_journal(path, data)
+
+
+def compact(path: str, retention_days: int = DEFAULT_RETENTION_DAYS, codec: str = 'gzip',
+            today: Optional[date] = None) -> Dict:
+    """Fold the journal into the snapshot and archive entries older than the retention window"""
+    if retention_days < MIN_RETENTION_DAYS:
+        raise ValueError(f"Keep at least {MIN_RETENTION_DAYS} days of recent history")
+    if codec not in CODECS:
+        raise ValueError(f"Codec must be one of {', '.join(CODECS)}")
+    start = time.perf_counter()
+    bytes_before = os.path.getsize(path) if os.path.exists(path) else 0
+    data, journaled = _fold(path)
+    horizon = ((today or date.today()) - timedelta(days=retention_days)).isoformat()
+    archive = data.setdefault('archive', {})
+
+    report = {'horizon': horizon, 'journal_entries': journaled, 'archived': {}, 'kept': {}}
+    for field, valid in LOGS.items():
+        log = data.get(field, [])
+        old, hot = [], []
+        for entry in log:
+            text = entry.get('date')
+            (old if valid(text) is not None and text < horizon else hot).append(entry)
+        old = _by_date(old)
+        if old:
+            rollup = archive.setdefault(field, {})
+            newest = rollup.get('newest_date')
+            _archive_entries(path, field, old, codec)
+            if newest is None or old[0]['date'] > newest:
+                ROLLUPS[field](rollup, old)
+            else:  # Backdated entries land inside the archive: recount it
+                rollup.clear()
+                ROLLUPS[field](rollup, list(iter_archive(path, field)))
+            report['archived'][field] = len(old)
+        data[field] = hot
+        report['kept'][field] = len(hot)
+
+    archive.update(horizon=horizon, codec=codec)
+    _write(path, data)
+    if os.path.exists(folding_path(path)):
+        os.remove(folding_path(path))
+    report['segments'] = [name for field in LOGS for name in _segment_files(path, field)]
+    report['bytes_before'] = bytes_before
+    report['bytes_after'] = os.path.getsize(path)
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def restore(path: str) -> Dict:
+    """Bring the archived history back into the snapshot and remove the archive"""
+    data, _ = _fold(path)
+    restored = {}
+    for field in LOGS:
+        archived_entries = list(iter_archive(path, field))
+        if archived_entries:
+            data[field] = _by_date(archived_entries, data.get(field, []))
+        restored[field] = len(archived_entries)
+    data.pop('archive', None)
+    _write(path, data)
+    for field in LOGS:
+        for name in _segment_files(path, field):
+            os.remove(os.path.join(archive_dir(path), name))
+    if os.path.isdir(archive_dir(path)) and not os.listdir(archive_dir(path)):
+        os.rmdir(archive_dir(path))
+    if os.path.exists(folding_path(path)):
+        os.remove(folding_path(path))
+    return {'restored': restored, 'entries': {field: len(data.get(field, [])) for field in LOGS}}
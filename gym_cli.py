@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Scriptable Command Line Interface
+Author: Aryan Kumawat
+Runs one operation non-interactively and prints machine-readable JSON
+
+Usage:
+    python3 gym.py plan [--name N --age A --gender G --goal 1-6 --days 1-7 [--save]]
+    python3 gym.py plan --week 5 [--block-weeks 12]
+    python3 gym.py log --day 2 [--notes "Felt strong"] [--date "2025-01-31 18:30"]
+    python3 gym.py stats
+    python3 gym.py workload [--as-of 2025-06-30]
+    python3 gym.py export [--output plan.txt] [--format txt|csv|json|md|html]
+    python3 gym.py export-members --data-dir members --output-dir exports [--format csv]
+    python3 gym.py weight add 72.5 [--unit kg]
+    python3 gym.py exercise "hip thrusts" [--search]
+    python3 gym.py notes "felt tired" [--since 2025-01-01] [--until 2025-03-31] [--limit 20]
+    python3 gym.py import history.csv [--batch-size 5000] [--dry-run]
+    python3 gym.py sync [FILE ...] [--output merged.json] [--force]
+    python3 gym.py compact [--retention-days 365] [--codec gzip|lzma] [--restore]
+    python3 gym.py rest-days --data-dir members [--at "2025-01-31 07:00"] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from gym import WorkoutDatabase, WorkoutCalculator, User
+from gym_archive import append_journal, read_profile
+from gym_export import EXPORTERS, export_members, export_user
+from gym_metrics import configure
+
+DEFAULT_DATA_FILE = "user_data.json"
+
+
+class CLIError(Exception):
+    """An operation failed; reported as {"error": ...} with exit status 1"""
+
+
+def _bounded_int(low: int, high: int):
+    def parse(value: str) -> int:
+        number = int(value)
+        if not low <= number <= high:
+            raise argparse.ArgumentTypeError(f"must be between {low} and {high}")
+        return number
+    return parse
+
+
+def _name(value: str) -> str:
+    if not value.strip() or not value.replace(" ", "").isalpha():
+        raise argparse.ArgumentTypeError("only alphabetical characters and spaces allowed")
+    return value.strip()
+
+
+def _log_date(value: str) -> str:
+    datetime.strptime(value, '%Y-%m-%d %H:%M')  # Validate the format used by progress_log
+    return value
+
+
+def _day(value: str):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _moment(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M')
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands"""
+    parser = argparse.ArgumentParser(
+        prog="gym.py",
+        description="Gym Workout Planner - non-interactive commands with JSON output"
+    )
+    parser.add_argument('--data-file', default=DEFAULT_DATA_FILE,
+                        help=f"User data file (default: {DEFAULT_DATA_FILE})")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    plan = subparsers.add_parser('plan', help="Generate the workout plan")
+    plan.add_argument('--name', type=_name)
+    plan.add_argument('--age', type=_bounded_int(1, 110))
+    plan.add_argument('--gender', choices=['female', 'male'])
+    plan.add_argument('--goal', type=_bounded_int(1, 6))
+    plan.add_argument('--days', type=_bounded_int(1, 7), help="Training days per week")
+    plan.add_argument('--save', action='store_true',
+                      help="Store the given profile in the data file")
+    plan.add_argument('--week', type=_bounded_int(1, 52),
+                      help="Week of a progressive block instead of the base week")
+    plan.add_argument('--block-weeks', type=_bounded_int(12, 52), default=12,
+                      help="Length of the progressive block (default: 12)")
+
+    log = subparsers.add_parser('log', help="Log a completed workout")
+    log.add_argument('--day', type=_bounded_int(1, 7), required=True)
+    log.add_argument('--notes', default="")
+    log.add_argument('--date', type=_log_date, help="Date as 'YYYY-MM-DD HH:MM' (default: now)")
+
+    subparsers.add_parser('stats', help="Workout and weight statistics")
+
+    workload = subparsers.add_parser('workload', help="Training volume and acute:chronic workload ratio")
+    workload.add_argument('--as-of', type=_day, help="Date of the workload ratio as YYYY-MM-DD (default: today)")
+
+    export = subparsers.add_parser('export', help="Export the workout plan to a text file")
+    export.add_argument('--output', help="Output file (default: timestamped file name)")
+    export.add_argument('--format', dest='fmt', choices=sorted(EXPORTERS),
+                        help="Export format (default: from the file extension, else txt)")
+
+    export_members = subparsers.add_parser('export-members', help="Export every stored member")
+    export_members.add_argument('--data-dir', default='members', help="Directory of member profiles")
+    export_members.add_argument('--output-dir', required=True)
+    export_members.add_argument('--format', dest='fmt', choices=sorted(EXPORTERS), default='txt')
+
+    weight = subparsers.add_parser('weight', help="Weight tracking")
+    weight_commands = weight.add_subparsers(dest='weight_command', required=True)
+    weight_add = weight_commands.add_parser('add', help="Add a weight entry")
+    weight_add.add_argument('weight', type=float)
+    weight_add.add_argument('--unit', choices=['kg', 'lbs'], default='kg')
+
+    exercise = subparsers.add_parser('exercise', help="Find an exercise across all workouts")
+    exercise.add_argument('query', help="Exercise name")
+    exercise.add_argument('--search', action='store_true', help="Match every exercise containing the query")
+
+    notes = subparsers.add_parser('notes', help="Search the notes of logged workouts")
+    notes.add_argument('query', help="Words to look for")
+    notes.add_argument('--since', type=_day, help="First date as YYYY-MM-DD")
+    notes.add_argument('--until', type=_day, help="Last date as YYYY-MM-DD")
+    notes.add_argument('--limit', type=_bounded_int(1, 1000), default=20, help="Maximum matches (default: 20)")
+
+    import_csv = subparsers.add_parser('import', help="Import historical workouts and weigh-ins from CSV")
+    import_csv.add_argument('csv_file', help="CSV with a header row (date, day, notes, weight, unit, type)")
+    import_csv.add_argument('--batch-size', type=_bounded_int(1, 1_000_000), default=5000,
+                            help="Rows appended per batch (default: 5000)")
+    import_csv.add_argument('--dry-run', action='store_true', help="Validate and count without saving")
+
+    sync = subparsers.add_parser('sync', help="Merge the data files of the terminal, advanced and GUI versions")
+    sync.add_argument('files', nargs='*',
+                      help="Data files to merge (default: user_data.json, user_data_advanced.json, "
+                           "user_data_gui_enhanced.json)")
+    sync.add_argument('--output', help="Write the merged profile here instead of back to every file")
+    sync.add_argument('--force', action='store_true', help="Merge files of differently named members")
+
+    compact = subparsers.add_parser('compact', help="Fold the journal in and archive old history")
+    compact.add_argument('--retention-days', type=_bounded_int(35, 36500), default=365,
+                         help="Days of history kept in the data file (default: 365)")
+    compact.add_argument('--codec', choices=['gzip', 'lzma'], default='gzip',
+                         help="Compression of the archive segments (default: gzip)")
+    compact.add_argument('--restore', action='store_true', help="Move the archived history back into the data file")
+
+    rest_days = subparsers.add_parser('rest-days', help="Rest-day recommendations for every stored member")
+    rest_days.add_argument('--data-dir', default='members', help="Directory of member profiles")
+    rest_days.add_argument('--at', type=_moment,
+                           help="Reference time as 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' (start of day; default: now)")
+    rest_days.add_argument('--workers', type=_bounded_int(1, 256),
+                           help="Worker processes reading profiles (default: one per CPU)")
+
+    return parser
+
+
+def load_data(data_file: str) -> Optional[Dict]:
+    """Read the raw user data (with journaled entries), or None if no profile exists yet"""
+    return read_profile(data_file)
+
+
+def save_data(data_file: str, data: Dict):
+    """Write user data atomically"""
+    tmp_file = f"{data_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, data_file)
+
+
+def require_profile(data: Optional[Dict]) -> Dict:
+    if not data:
+        raise CLIError("No profile found. Create one with: plan --name ... --save")
+    return data
+
+
+def profile_summary(user: User) -> Dict:
+    return {
+        'name': user.name,
+        'age': user.age,
+        'gender': user.gender,
+        'goal': user.goal,
+        'goal_name': WorkoutDatabase.GOAL_NAMES[user.goal - 1],
+        'training_days': user.training_days,
+    }
+
+
+def cmd_plan(args, data: Optional[Dict]) -> Dict:
+    profile_args = {
+        'name': args.name, 'age': args.age, 'gender': args.gender,
+        'goal': args.goal, 'training_days': args.days,
+    }
+    given = {key: value for key, value in profile_args.items() if value is not None}
+
+    if data:
+        base = dict(data)
+        base.update(given)
+    else:
+        missing = [key for key in ('age', 'gender', 'goal', 'training_days') if key not in given]
+        if missing:
+            raise CLIError(f"No profile found; missing: {', '.join(missing)}")
+        base = given
+    user = User.from_dict(base)
+
+    if args.save:
+        if not user.name:
+            raise CLIError("--name is required to save a profile")
+        data = dict(data or {})
+        data.update(user.to_dict())  # Keeps keys written by other editions
+        save_data(args.data_file, data)
+
+    result = {
+        'profile': profile_summary(user),
+        'age_reduction': WorkoutCalculator.calculate_age_reduction(user.age),
+        'plan': WorkoutCalculator.generate_workout_plan(user),
+        'saved': args.save,
+    }
+    if args.week:
+        from gym_periodization import PeriodizationBlock
+
+        block = PeriodizationBlock(args.block_weeks)
+        result['week'] = block.prescription(args.week).to_dict()
+        result['plan'] = block.week_plan(user, args.week)
+    return result
+
+
+def cmd_log(args, data: Optional[Dict]) -> Dict:
+    data = require_profile(data)
+    training_days = data.get('training_days', 0)
+    if args.day > training_days:
+        raise CLIError(f"Invalid day number; the plan has {training_days} days")
+
+    entry = {
+        'date': args.date or datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'day': args.day,
+        'notes': args.notes
+    }
+    data.setdefault('progress_log', []).append(entry)
+    append_journal(args.data_file, 'progress_log', entry)  # Folded into the file by `compact`
+    archived = data.get('archive', {}).get('progress_log', {}).get('count', 0)
+    return {'logged': entry, 'total_workouts': len(data['progress_log']) + archived}
+
+
+def cmd_stats(args, data: Optional[Dict]) -> Dict:
+    from gym_advanced import AdvancedUser, WorkoutStatistics, WeightTracker
+
+    user = AdvancedUser.from_dict(require_profile(data))
+    result = {'workouts': WorkoutStatistics.get_statistics(user)}
+    if user.weight_log or user.archive.get('weight_log'):
+        result['weight'] = WeightTracker.get_weight_statistics(user)
+        result['weight']['trend'] = WeightTracker.get_weight_trend(user)
+    return result
+
+
+def cmd_workload(args, data: Optional[Dict]) -> Dict:
+    from gym_workload import member_workload
+
+    return member_workload(User.from_dict(require_profile(data)), on=args.as_of)
+
+
+def cmd_export(args, data: Optional[Dict]) -> Dict:
+    from gym_advanced import AdvancedUser
+
+    user = AdvancedUser.from_dict(require_profile(data))
+    filename = args.output
+    if not filename:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = EXPORTERS[args.fmt or 'txt'].extension
+        filename = f"workout_plan_{user.name.replace(' ', '_')}_{timestamp}{extension}"
+
+    export_user(filename, user, fmt=args.fmt)
+    return {'file': os.path.abspath(filename)}
+
+
+def cmd_export_members(args, data: Optional[Dict]) -> Dict:
+    from gym_store import ProfileStore
+
+    store = ProfileStore(args.data_dir)
+    files = export_members(store.stream(), args.output_dir, args.fmt)
+    return {'files': [os.path.abspath(filename) for filename in files]}
+
+
+def cmd_weight(args, data: Optional[Dict]) -> Dict:
+    from gym_advanced import AdvancedUser, WeightTracker
+
+    data = require_profile(data)
+    user = AdvancedUser.from_dict(data)
+    WeightTracker.add_weight_entry(user, args.weight, args.unit)
+    append_journal(args.data_file, 'weight_log', user.weight_log[-1])
+    return {'added': user.weight_log[-1], 'entries': WeightTracker.get_weight_statistics(user)['entries']}
+
+
+def cmd_exercise(args, data: Optional[Dict]) -> Dict:
+    from gym_index import exercise_index
+
+    index = exercise_index()
+    result = {}
+    for name in index.search(args.query) if args.search else [args.query]:
+        occurrences = index.lookup(name)
+        if not occurrences:
+            continue
+        name = occurrences[0].name
+        entry = {
+            'workouts': [{'workout': index.titles[o.workout], 'position': o.position,
+                          'amount': o.amount, 'unit': o.unit, 'sets': o.sets} for o in occurrences],
+        }
+        if data:
+            entry['weekly_volume'] = index.weekly_volume(User.from_dict(data), name)
+        result[name] = entry
+    if not result:
+        raise CLIError(f"No exercise matches '{args.query}'")
+    return {'exercises': result}
+
+
+def cmd_notes(args, data: Optional[Dict]) -> Dict:
+    from gym_notes import NotesIndex
+
+    index = NotesIndex(require_profile(data).get('progress_log', []))
+    return {'matches': index.search(args.query, args.since, args.until, args.limit)}
+
+
+def cmd_import(args, data: Optional[Dict]) -> Dict:
+    from gym_import import import_csv
+
+    data = require_profile(data)
+    with open(args.csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+        report = import_csv(f, data.setdefault('progress_log', []), data.setdefault('weight_log', []),
+                            args.batch_size)
+    if not args.dry_run and (report.workouts or report.weights):
+        save_data(args.data_file, data)  # One write for the whole file
+    result = report.to_dict()
+    result['saved'] = not args.dry_run and bool(report.workouts or report.weights)
+    return result
+
+
+def cmd_sync(args, data: Optional[Dict]) -> Dict:
+    from gym_sync import sync_files
+
+    return sync_files(args.files or None, args.output, args.force)
+
+
+def cmd_compact(args, data: Optional[Dict]) -> Dict:
+    from gym_archive import compact, restore
+
+    require_profile(data)
+    if args.restore:
+        return restore(args.data_file)
+    return compact(args.data_file, args.retention_days, args.codec)
+
+
+def cmd_rest_days(args, data: Optional[Dict]) -> Dict:
+    from gym_rest import recommend_directory
+
+    return recommend_directory(args.data_dir, args.at, args.workers)
+
+
+HANDLERS = {
+    'plan': cmd_plan,
+    'log': cmd_log,
+    'stats': cmd_stats,
+    'workload': cmd_workload,
+    'export': cmd_export,
+    'export-members': cmd_export_members,
+    'weight': cmd_weight,
+    'exercise': cmd_exercise,
+    'notes': cmd_notes,
+    'import': cmd_import,
+    'sync': cmd_sync,
+    'compact': cmd_compact,
+    'rest-days': cmd_rest_days,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run one command; prints JSON and returns the exit status"""
+    args = build_parser().parse_args(configure(sys.argv[1:] if argv is None else argv))
+    try:
+        result = HANDLERS[args.command](args, load_data(args.data_file))
+    except (CLIError, OSError, ValueError) as e:
+        print(json.dumps({'error': str(e)}))
+        return 1
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Columnar Progress Log
+Author: Aryan Kumawat
+progress_log stored as columns, behind the usual list-of-dicts interface
+
+Columns: minutes since 1970-01-01 as array('i'), plan days as array('B') and the
+notes as one UTF-8 buffer with an offsets table. Reading an item builds the
+familiar {'date', 'day', 'notes'} dict (read-only, as writes to it could not
+reach the columns); analytics read the arrays directly.
+Entries that do not fit the columns (other keys, unusual dates or days) are kept
+as-is in `overflow`; logs holding any fall back to per-entry processing.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import MutableSequence
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from gym_records import MINUTES_PER_DAY, format_minute, parse_minute
+
+EPOCH_MINUTE = date(1970, 1, 1).toordinal() * MINUTES_PER_DAY
+INT32 = (-2 ** 31, 2 ** 31 - 1)
+
+
+class LogEntry(dict):
+    """One entry read from a ProgressLog; read-only, since it is built from the columns
+
+    Change an entry by assigning a new one: log[i] = dict(log[i], notes=...).
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Entries read from a ProgressLog are copies; assign log[i] to change one")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (LogEntry, (dict(self),))
+
+
+class ProgressLog(MutableSequence):
+    """A progress log with list-of-dicts behaviour and columnar storage"""
+
+    def __init__(self, entries: Iterable[Dict] = ()):
+        self.minutes = array('i')
+        self.days = array('B')
+        self.note_offsets = array('I', [0])
+        self._notes = bytearray()
+        self.overflow: Dict[int, Dict] = {}
+        self.is_sorted = True  # minutes never decrease, so date windows can bisect
+        for entry in entries:
+            self.append(entry)
+
+    # Encoding
+
+    @staticmethod
+    def _encode(entry: Dict):
+        """(minute, day, notes bytes) or None when the entry does not fit the columns"""
+        if type(entry) not in (dict, LogEntry) or len(entry) != 3:
+            return None
+        day, notes = entry.get('day'), entry.get('notes')
+        if type(day) is not int or not 0 <= day <= 255 or type(notes) is not str:
+            return None
+        stamp = parse_minute(entry.get('date'))
+        if stamp is None or not INT32[0] <= stamp - EPOCH_MINUTE <= INT32[1]:
+            return None
+        return stamp - EPOCH_MINUTE, day, notes.encode('utf-8')
+
+    def append(self, entry: Dict):
+        encoded = self._encode(entry)
+        if encoded is None:
+            self.overflow[len(self.minutes)] = dict(entry)
+            encoded = (self.minutes[-1] if self.minutes else 0, 0, b"")
+        minute, day, notes = encoded
+        if self.minutes and minute < self.minutes[-1]:
+            self.is_sorted = False
+        self.minutes.append(minute)
+        self.days.append(day)
+        self._notes += notes
+        self.note_offsets.append(len(self._notes))
+
+    def extend(self, entries: Iterable[Dict]):
+        for entry in entries:
+            self.append(entry)
+
+    # Sequence interface
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def _entry(self, i: int, entry_type: type = LogEntry) -> Dict:
+        overflow = self.overflow.get(i)
+        if overflow is not None:
+            return entry_type(overflow)
+        return entry_type(
+            date=format_minute(self.minutes[i] + EPOCH_MINUTE),
+            day=self.days[i],
+            notes=self._notes[self.note_offsets[i]:self.note_offsets[i + 1]].decode('utf-8'),
+        )
+
+    def __getitem__(self, index):
+        """The entry as a read-only LogEntry (or a list of them for slices)"""
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("progress log index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self._entry(i)
+
+    # Changing or removing entries re-encodes the whole log: O(n) per call, unlike
+    # append() and extend(). Fine for edits from the GUI, not for bulk updates.
+
+    def _rebuild(self, entries: List[Dict]):
+        self.__init__(entries)
+
+    def __setitem__(self, index, value):
+        entries = self.to_list()
+        entries[index] = value
+        self._rebuild(entries)
+
+    def __delitem__(self, index):
+        entries = self.to_list()
+        del entries[index]
+        self._rebuild(entries)
+
+    def insert(self, index: int, entry: Dict):
+        if index >= len(self):
+            self.append(entry)
+            return
+        entries = self.to_list()
+        entries.insert(index, entry)
+        self._rebuild(entries)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, ProgressLog)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ProgressLog({len(self)} entries)"
+
+    def to_list(self) -> List[Dict]:
+        """The entries as plain, mutable dicts"""
+        return [self._entry(i, dict) for i in range(len(self))]
+
+    def copy(self) -> 'ProgressLog':
+        """An independent log with the same entries; copies the columns, not per-entry dicts"""
+        clone = ProgressLog.__new__(ProgressLog)
+        clone.minutes = self.minutes[:]
+        clone.days = self.days[:]
+        clone.note_offsets = self.note_offsets[:]
+        clone._notes = self._notes[:]
+        clone.overflow = {i: dict(entry) for i, entry in self.overflow.items()}
+        clone.is_sorted = self.is_sorted
+        return clone
+
+    # Columnar analytics (valid only when is_columnar())
+
+    def is_columnar(self) -> bool:
+        """Whether every entry lives in the columns"""
+        return not self.overflow
+
+    def day_counts(self) -> Dict[int, int]:
+        """Workouts per plan day, in order of first appearance"""
+        return dict(Counter(self.days.tobytes()))
+
+    def ordinals_descending(self) -> Iterator[int]:
+        """Day ordinals of all entries, latest first"""
+        minutes = reversed(self.minutes) if self.is_sorted else sorted(self.minutes, reverse=True)
+        for minute in minutes:
+            yield (minute + EPOCH_MINUTE) // MINUTES_PER_DAY
+
+    def since(self, minute: int) -> array:
+        """Minutes (since 1970) of the entries later than minute"""
+        if self.is_sorted:
+            return self.minutes[bisect_right(self.minutes, minute):]
+        return array('i', (m for m in self.minutes if m > minute))
+
+
+def epoch_seconds(moment: datetime) -> int:
+    """Whole seconds since 1970-01-01 of a naive local datetime"""
+    return (moment.toordinal() * MINUTES_PER_DAY - EPOCH_MINUTE) * 60 + \
+        moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+def columnar_log(log) -> Optional[ProgressLog]:
+    """The log if it is a ProgressLog whose entries all live in the columns, else None"""
+    return log if isinstance(log, ProgressLog) and log.is_columnar() else None
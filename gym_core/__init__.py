@@ -0,0 +1,53 @@
+"""
+Gym Workout Planner - Core Engine
+Author: Aryan Kumawat
+Workout database, plan calculator, statistics and trackers without any UI or plotting imports
+
+Names are resolved on first access, so `from gym_core import WorkoutCalculator`
+loads only the plan engine and not the advanced trackers.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'User': 'gym',
+    'WorkoutDatabase': 'gym',
+    'WorkoutCalculator': 'gym',
+    'WorkoutPlan': 'gym',
+    'PlanDay': 'gym',
+    'ProgressEntry': 'gym_records',
+    'WeightEntry': 'gym_records',
+    'ProgressLog': 'gym_columnar',
+    'AdvancedUser': 'gym_advanced',
+    'CustomWorkoutManager': 'gym_advanced',
+    'CustomWorkoutStore': 'gym_advanced',
+    'RestDayRecommender': 'gym_advanced',
+    'WeightTracker': 'gym_advanced',
+    'WorkoutStatistics': 'gym_advanced',
+    'WorkoutCalendar': 'gym_advanced',
+    'ExerciseIndex': 'gym_index',
+    'exercise_index': 'gym_index',
+    'NotesIndex': 'gym_notes',
+    'import_csv': 'gym_import',
+    'sync_files': 'gym_sync',
+    'compact': 'gym_archive',
+    'recommend_roster': 'gym_rest',
+    'PeriodizationBlock': 'gym_periodization',
+    'member_workload': 'gym_workload',
+    'roster_workload': 'gym_workload',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Export Formats
+Author: Aryan Kumawat
+Streams workout plans, progress history and weight history to text, CSV, JSON, Markdown and HTML
+"""
+
+import csv
+import html
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from gym import WorkoutDatabase, WorkoutCalculator
+from gym_records import LogRecord
+
+BUFFER_SIZE = 64 * 1024
+SECTIONS = ('plan', 'progress', 'weight')
+
+# Called as on_item(done, total) after each plan day; may raise to abort the export
+ProgressCallback = Callable[[int, int], None]
+
+
+class PlanExporter:
+    """Base class of an export format
+
+    Exporters write section by section and one record at a time, so progress
+    and weight histories are streamed rather than rendered into one string.
+    """
+
+    name = ""
+    extension = ""
+    label = ""
+
+    def __init__(self, out):
+        self.out = out
+
+    def begin(self, user, age_reduction: int):
+        pass
+
+    def plan(self, workout_plan: List[Dict], on_item: Optional[ProgressCallback] = None):
+        pass
+
+    def progress(self, entries: Iterable[Dict]):
+        pass
+
+    def weights(self, entries: Iterable[Dict]):
+        pass
+
+    def end(self):
+        pass
+
+    @staticmethod
+    def _each_day(workout_plan: List[Dict], on_item: Optional[ProgressCallback]):
+        total = len(workout_plan)
+        for i, day_plan in enumerate(workout_plan, 1):
+            yield day_plan
+            if on_item:
+                on_item(i, total)
+
+
+class TextExporter(PlanExporter):
+    """The classic plain-text layout"""
+
+    name, extension, label = 'txt', '.txt', "Text files"
+    RULE = "=" * 80 + "\n"
+    DAY_RULE = "-" * 80 + "\n"
+
+    def begin(self, user, age_reduction: int):
+        note = f"Note: Workouts adjusted by {age_reduction}% for age\n\n" if age_reduction > 0 else ""
+        self.out.write(
+            f"{self.RULE}{user.name.upper()}'S PERSONALIZED WORKOUT PLAN\n{self.RULE}\n"
+            f"Profile Information:\n"
+            f"  Name: {user.name}\n"
+            f"  Age: {user.age} years\n"
+            f"  Gender: {user.gender.capitalize()}\n"
+            f"  Goal: {WorkoutDatabase.GOAL_NAMES[user.goal - 1]}\n"
+            f"  Training Days: {user.training_days} days per week\n"
+            f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            f"{note}"
+        )
+
+    def plan(self, workout_plan, on_item=None):
+        for day_plan in self._each_day(workout_plan, on_item):
+            self.out.write(f"{self.DAY_RULE}DAY {day_plan['day']}\n{self.DAY_RULE}{day_plan['workout']}\n\n")
+
+    def progress(self, entries):
+        header = f"{self.DAY_RULE}PROGRESS HISTORY\n{self.DAY_RULE}"
+        for entry in entries:
+            if header:
+                self.out.write(header)
+                header = None
+            notes = f" - {entry['notes']}" if entry.get('notes') else ""
+            self.out.write(f"  {entry['date']}  Day {entry['day']}{notes}\n")
+        if header is None:
+            self.out.write("\n")
+
+    def weights(self, entries):
+        header = f"{self.DAY_RULE}WEIGHT HISTORY\n{self.DAY_RULE}"
+        for entry in entries:
+            if header:
+                self.out.write(header)
+                header = None
+            self.out.write(f"  {entry['date']}  {entry['weight']} {entry['unit']}\n")
+        if header is None:
+            self.out.write("\n")
+
+    def end(self):
+        self.out.write(f"{self.RULE}Keep up the great work! Stay consistent and track your progress.\n{self.RULE}")
+
+
+class CSVExporter(PlanExporter):
+    """One row per plan day, logged workout and weight entry"""
+
+    name, extension, label = 'csv', '.csv', "CSV files"
+    COLUMNS = ['member', 'section', 'date', 'day', 'text', 'weight', 'unit']
+
+    def __init__(self, out):
+        super().__init__(out)
+        self.writer = csv.writer(out)
+        self.member = ""
+
+    def begin(self, user, age_reduction):
+        self.member = user.name
+        self.writer.writerow(self.COLUMNS)
+
+    def plan(self, workout_plan, on_item=None):
+        for day_plan in self._each_day(workout_plan, on_item):
+            self.writer.writerow([self.member, 'plan', '', day_plan['day'], day_plan['workout'], '', ''])
+
+    def progress(self, entries):
+        self.writer.writerows(
+            [self.member, 'progress', entry['date'], entry['day'], entry.get('notes', ''), '', '']
+            for entry in entries
+        )
+
+    def weights(self, entries):
+        self.writer.writerows(
+            [self.member, 'weight', entry['date'], '', '', entry['weight'], entry['unit']]
+            for entry in entries
+        )
+
+
+class JSONExporter(PlanExporter):
+    """A single JSON document, written incrementally"""
+
+    name, extension, label = 'json', '.json', "JSON files"
+
+    def begin(self, user, age_reduction):
+        profile = {
+            'name': user.name, 'age': user.age, 'gender': user.gender,
+            'goal': user.goal, 'goal_name': WorkoutDatabase.GOAL_NAMES[user.goal - 1],
+            'training_days': user.training_days,
+        }
+        self.out.write(f'{{"generated": {json.dumps(datetime.now().isoformat(timespec="seconds"))}, '
+                       f'"profile": {json.dumps(profile)}, "age_reduction": {age_reduction}')
+
+    def _array(self, key: str, items: Iterable):
+        self.out.write(f', "{key}": [')
+        separator = ""
+        for item in items:
+            self.out.write(separator + json.dumps(item.to_dict() if isinstance(item, LogRecord) else item))
+            separator = ", "
+        self.out.write("]")
+
+    def plan(self, workout_plan, on_item=None):
+        self._array('plan', self._each_day(workout_plan, on_item))
+
+    def progress(self, entries):
+        self._array('progress_log', entries)
+
+    def weights(self, entries):
+        self._array('weight_log', entries)
+
+    def end(self):
+        self.out.write("}\n")
+
+
+class MarkdownExporter(PlanExporter):
+    """Markdown with one heading per day and history tables"""
+
+    name, extension, label = 'md', '.md', "Markdown files"
+
+    @staticmethod
+    def _cell(value) -> str:
+        return str(value).replace("|", "\\|").replace("\n", " ")
+
+    def begin(self, user, age_reduction):
+        note = f"\n> Workouts adjusted by {age_reduction}% for age\n" if age_reduction > 0 else ""
+        self.out.write(
+            f"# {user.name}'s Personalized Workout Plan\n\n"
+            f"| Name | Age | Gender | Goal | Training Days |\n"
+            f"|---|---|---|---|---|\n"
+            f"| {self._cell(user.name)} | {user.age} | {user.gender.capitalize()} | "
+            f"{WorkoutDatabase.GOAL_NAMES[user.goal - 1]} | {user.training_days} per week |\n"
+            f"{note}\n"
+        )
+
+    def plan(self, workout_plan, on_item=None):
+        for day_plan in self._each_day(workout_plan, on_item):
+            title, _, exercises = day_plan['workout'].partition("\n\n")
+            items = "".join(f"- {line}\n" for line in exercises.splitlines() if line.strip())
+            self.out.write(f"## Day {day_plan['day']}: {title}\n\n{items}\n")
+
+    def _table(self, title: str, columns: List[str], rows: Iterable[List]):
+        header = f"## {title}\n\n| {' | '.join(columns)} |\n|{'---|' * len(columns)}\n"
+        for row in rows:
+            if header:
+                self.out.write(header)
+                header = None
+            self.out.write(f"| {' | '.join(self._cell(value) for value in row)} |\n")
+        if header is None:
+            self.out.write("\n")
+
+    def progress(self, entries):
+        self._table("Progress History", ['Date', 'Day', 'Notes'],
+                    ([e['date'], e['day'], e.get('notes', '')] for e in entries))
+
+    def weights(self, entries):
+        self._table("Weight History", ['Date', 'Weight', 'Unit'],
+                    ([e['date'], e['weight'], e['unit']] for e in entries))
+
+
+class HTMLExporter(MarkdownExporter):
+    """A standalone HTML page"""
+
+    name, extension, label = 'html', '.html', "HTML files"
+
+    def begin(self, user, age_reduction):
+        name = html.escape(user.name)
+        note = f"<p><em>Workouts adjusted by {age_reduction}% for age</em></p>\n" if age_reduction > 0 else ""
+        self.out.write(
+            f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+            f"<title>{name}'s Workout Plan</title></head>\n<body>\n"
+            f"<h1>{name}'s Personalized Workout Plan</h1>\n"
+            f"<p>Age: {user.age} &middot; Gender: {html.escape(user.gender.capitalize())} &middot; "
+            f"Goal: {WorkoutDatabase.GOAL_NAMES[user.goal - 1]} &middot; "
+            f"Training days: {user.training_days} per week</p>\n{note}"
+        )
+
+    def plan(self, workout_plan, on_item=None):
+        for day_plan in self._each_day(workout_plan, on_item):
+            title, _, exercises = day_plan['workout'].partition("\n\n")
+            items = "".join(f"<li>{html.escape(line)}</li>" for line in exercises.splitlines() if line.strip())
+            self.out.write(f"<h2>Day {day_plan['day']}: {html.escape(title)}</h2>\n<ul>{items}</ul>\n")
+
+    def _table(self, title, columns, rows):
+        header = (f"<h2>{title}</h2>\n<table>\n<tr>"
+                  + "".join(f"<th>{column}</th>" for column in columns) + "</tr>\n")
+        for row in rows:
+            if header:
+                self.out.write(header)
+                header = None
+            self.out.write("<tr>" + "".join(f"<td>{html.escape(str(value))}</td>" for value in row) + "</tr>\n")
+        if header is None:
+            self.out.write("</table>\n")
+
+    def end(self):
+        self.out.write("</body></html>\n")
+
+
+EXPORTERS: Dict[str, type] = {}
+
+
+def register_exporter(exporter_class: type) -> type:
+    """Make an export format available by its name and file extension"""
+    EXPORTERS[exporter_class.name] = exporter_class
+    return exporter_class
+
+
+for _exporter in (TextExporter, CSVExporter, JSONExporter, MarkdownExporter, HTMLExporter):
+    register_exporter(_exporter)
+
+
+def exporter_for(filename: str, fmt: Optional[str] = None) -> type:
+    """Pick the exporter by explicit format name, else by file extension (text by default)"""
+    if fmt:
+        if fmt not in EXPORTERS:
+            raise ValueError(f"Unknown export format: {fmt} (choose from {', '.join(EXPORTERS)})")
+        return EXPORTERS[fmt]
+    extension = os.path.splitext(filename)[1].lower()
+    for exporter_class in EXPORTERS.values():
+        if exporter_class.extension == extension:
+            return exporter_class
+    return TextExporter
+
+
+def file_types() -> List[tuple]:
+    """filedialog filetypes for all registered formats"""
+    return [(cls.label, f"*{cls.extension}") for cls in EXPORTERS.values()] + [("All files", "*.*")]
+
+
+def export_user(filename: str, user, workout_plan: Optional[List[Dict]] = None, fmt: Optional[str] = None,
+                sections=SECTIONS, on_item: Optional[ProgressCallback] = None) -> str:
+    """Export a member's plan and histories; the file is replaced atomically
+
+    If on_item raises (e.g. a cancelled task), the partial file is removed
+    and the exception propagates.
+    """
+    exporter_class = exporter_for(filename, fmt)
+    if workout_plan is None:
+        workout_plan = WorkoutCalculator.generate_workout_plan(user)
+
+    tmp_file = f"{filename}.tmp"
+    try:
+        with open(tmp_file, 'w', buffering=BUFFER_SIZE, newline='', encoding='utf-8') as f:
+            exporter = exporter_class(f)
+            exporter.begin(user, WorkoutCalculator.calculate_age_reduction(user.age))
+            if 'plan' in sections:
+                exporter.plan(workout_plan, on_item)
+            if 'progress' in sections:
+                exporter.progress(getattr(user, 'progress_log', []))
+            if 'weight' in sections:
+                exporter.weights(getattr(user, 'weight_log', []))
+            exporter.end()
+        os.replace(tmp_file, filename)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    return filename
+
+
+def export_members(users: Iterable, output_dir: str, fmt: str = 'txt', sections=SECTIONS,
+                   plan_for: Callable = WorkoutCalculator.generate_workout_plan) -> List[str]:
+    """Export many members, one file each
+
+    `users` may be a generator so only one member is held in memory at a time;
+    plans are the interned, shared plans of WorkoutCalculator by default.
+    """
+    exporter_class = exporter_for("", fmt)
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for user in users:
+        filename = os.path.join(output_dir, f"workout_plan_{user.name.replace(' ', '_')}{exporter_class.extension}")
+        written.append(export_user(filename, user, plan_for(user), fmt, sections))
+    return written
@@ -7,28 +7,24 @@ Includes: Weight tracking, Statistics, Rest recommendations, and more!
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import json
-import os
+import sys
 import math
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-# Optional matplotlib import for future graph features
-try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-
 # Import from existing modules
 from gym import WorkoutDatabase, WorkoutCalculator
 from gym_advanced import (
     AdvancedUser, WeightTracker, WorkoutStatistics,
     RestDayRecommender, CustomWorkoutManager
 )
+from gym_export import export_user, file_types
+from gym_notes import NotesIndex
+from gym_gui_support import (
+    BackgroundTaskRunner, TaskHandle, TaskStatusBar, RefreshScheduler,
+    read_json_file, write_json_file, snapshot_user, snapshot_user_data
+)
 
 
 class EnhancedGymWorkoutPlannerGUI:
@@ -43,7 +39,14 @@ class EnhancedGymWorkoutPlannerGUI:
         # Performance optimizations
         self.root.configure(bg="#f5f5f5")
         self._cache = {}  # Cache for expensive operations
-        self._last_refresh = 0  # Throttle refresh operations
+        self._notes_index: Optional[NotesIndex] = None  # Built on the first notes search
+        self._notes_source = None  # The live progress log the index follows
+        self._notes_lock = threading.Lock()  # One search updates the index at a time
+        self.refresh_scheduler = RefreshScheduler(self.root, self._repaint)  # Coalesces refreshes
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        self.runner = BackgroundTaskRunner(self.root)  # Keeps slow work off the UI thread
+        self._loading = True
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Color scheme - Modern and professional
         self.bg_color = "#f5f5f5"
@@ -58,12 +61,10 @@ class EnhancedGymWorkoutPlannerGUI:
         self.workout_plan: List[Dict] = []
         self.data_file = "user_data_gui_enhanced.json"
         
-        # Load user data
-        self.load_user_data()
-        
-        # Setup GUI
+        # Setup GUI, then load user data in the background
         self.setup_styles()
         self.create_main_window()
+        self.load_user_data()
         
     def setup_styles(self):
         """Setup ttk styles with modern theme"""
@@ -114,13 +115,6 @@ class EnhancedGymWorkoutPlannerGUI:
     
     def create_main_window(self):
         """Create the enhanced main window with tabs"""
-        # Throttle refresh operations to prevent lag
-        import time
-        current_time = time.time()
-        if current_time - self._last_refresh < 0.1:  # 100ms throttle
-            return
-        self._last_refresh = current_time
-        
         # Clear window efficiently
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -138,7 +132,12 @@ class EnhancedGymWorkoutPlannerGUI:
                                style='Title.TLabel')
         title_label.pack()
         
-        if self.user:
+        if self._loading:
+            subtitle_label = ttk.Label(header_frame,
+                                      text="Loading your profile...",
+                                      style='Subtitle.TLabel')
+            subtitle_label.pack()
+        elif self.user:
             subtitle_label = ttk.Label(header_frame,
                                       text=f"Welcome back, {self.user.name}!",
                                       style='Subtitle.TLabel')
@@ -149,29 +148,38 @@ class EnhancedGymWorkoutPlannerGUI:
                                       style='Subtitle.TLabel')
             subtitle_label.pack()
         
-        # Tabbed interface
-        notebook = ttk.Notebook(main_container)
-        notebook.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Tab 1: Workout Plan
-        workout_tab = ttk.Frame(notebook, padding="10")
-        notebook.add(workout_tab, text="  Workout Plan  ")
-        self.create_workout_tab(workout_tab)
-        
-        # Tab 2: Progress & Stats
-        stats_tab = ttk.Frame(notebook, padding="10")
-        notebook.add(stats_tab, text="  Statistics  ")
-        self.create_stats_tab(stats_tab)
-        
-        # Tab 3: Weight Tracking
-        weight_tab = ttk.Frame(notebook, padding="10")
-        notebook.add(weight_tab, text="  Weight Tracking  ")
-        self.create_weight_tab(weight_tab)
-        
-        # Tab 4: Profile & Settings
-        profile_tab = ttk.Frame(notebook, padding="10")
-        notebook.add(profile_tab, text="  Profile  ")
-        self.create_profile_tab(profile_tab)
+        self._tab_frames = {}
+        if self._loading:
+            # Tabs are built once the profile has been loaded
+            ttk.Frame(main_container).pack(fill=tk.BOTH, expand=True, pady=10)
+        else:
+            # Tabbed interface
+            notebook = ttk.Notebook(main_container)
+            notebook.pack(fill=tk.BOTH, expand=True, pady=10)
+            
+            # Tab 1: Workout Plan
+            workout_tab = ttk.Frame(notebook, padding="10")
+            notebook.add(workout_tab, text="  Workout Plan  ")
+            self.create_workout_tab(workout_tab)
+            self._tab_frames['workout'] = workout_tab
+            
+            # Tab 2: Progress & Stats
+            stats_tab = ttk.Frame(notebook, padding="10")
+            notebook.add(stats_tab, text="  Statistics  ")
+            self.create_stats_tab(stats_tab)
+            self._tab_frames['stats'] = stats_tab
+            
+            # Tab 3: Weight Tracking
+            weight_tab = ttk.Frame(notebook, padding="10")
+            notebook.add(weight_tab, text="  Weight Tracking  ")
+            self.create_weight_tab(weight_tab)
+            self._tab_frames['weight'] = weight_tab
+            
+            # Tab 4: Profile & Settings
+            profile_tab = ttk.Frame(notebook, padding="10")
+            notebook.add(profile_tab, text="  Profile  ")
+            self.create_profile_tab(profile_tab)
+            self._tab_frames['profile'] = profile_tab
         
         # Footer with quick actions
         footer_frame = ttk.Frame(main_container)
@@ -191,6 +199,34 @@ class EnhancedGymWorkoutPlannerGUI:
                  text="Built with Python & Tkinter | Enhanced Edition v2.0",
                  font=('Helvetica', 8),
                  foreground='gray').pack(side=tk.RIGHT)
+        
+        # Progress indicator for background tasks
+        status_bar = TaskStatusBar(footer_frame, self.runner)
+        status_bar.pack(side=tk.RIGHT, padx=10)
+        self.runner.attach_indicator(status_bar)
+    
+    def refresh(self, *views: str):
+        """Request a repaint of the given tabs (the whole window if none given)"""
+        self.refresh_scheduler.request(*views)
+    
+    def _repaint(self, views):
+        """Repaint dirty tabs in place, or rebuild the whole window"""
+        if RefreshScheduler.ALL in views or not self._tab_frames:
+            self.create_main_window()
+            return
+        
+        builders = {
+            'workout': self.create_workout_tab,
+            'stats': self.create_stats_tab,
+            'weight': self.create_weight_tab,
+            'profile': self.create_profile_tab,
+        }
+        for view, build in builders.items():
+            if view in views:
+                frame = self._tab_frames[view]
+                for widget in frame.winfo_children():
+                    widget.destroy()
+                build(frame)
     
     def create_workout_tab(self, parent):
         """Create workout plan tab with performance optimizations"""
@@ -250,13 +286,37 @@ class EnhancedGymWorkoutPlannerGUI:
                      font=('Helvetica', 12)).pack(pady=50)
             return
         
-        # Cache statistics calculation
+        # Cache statistics calculation; compute in the background on a miss
         cache_key = f"stats_{len(self.user.progress_log)}_{self.user.name}"
-        if cache_key not in self._cache:
-            self._cache[cache_key] = WorkoutStatistics.get_statistics(self.user)
+        if cache_key in self._cache:
+            self._build_stats_content(parent, self._cache[cache_key])
+            return
+        
+        loading_label = ttk.Label(parent, text="Calculating statistics...",
+                                  font=('Helvetica', 12), foreground='gray')
+        loading_label.pack(pady=50)
+        
+        def on_stats_ready(stats):
+            self._cache[cache_key] = stats
+            if parent.winfo_exists():
+                loading_label.destroy()
+                self._build_stats_content(parent, stats)
         
-        stats = self._cache[cache_key]
+        def on_stats_failed(error):
+            if parent.winfo_exists():
+                loading_label.config(text=f"Could not calculate statistics: {error}")
         
+        def on_stats_cancelled():
+            if parent.winfo_exists():
+                loading_label.config(text="Statistics calculation cancelled")
+        
+        self.runner.submit("Calculating statistics", WorkoutStatistics.get_statistics,
+                           snapshot_user(self.user),
+                           on_success=on_stats_ready, on_error=on_stats_failed,
+                           on_cancel=on_stats_cancelled)
+    
+    def _build_stats_content(self, parent, stats: Dict):
+        """Build the statistics cards and recent activity from computed stats"""
         if 'error' in stats:
             ttk.Label(parent, text="Complete some workouts to see statistics!",
                      font=('Helvetica', 12)).pack(pady=50)
@@ -310,6 +370,80 @@ class EnhancedGymWorkoutPlannerGUI:
             recent_text.insert(tk.END, ''.join(recent_entries))
             recent_text.config(state='disabled')
             recent_text.pack(fill=tk.BOTH, expand=True)
+            
+            self._build_notes_search(parent)
+    
+    def _build_notes_search(self, parent):
+        """Search box over workout notes, with optional date range"""
+        search_frame = ttk.LabelFrame(parent, text="Search Notes", padding="10")
+        search_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        controls = ttk.Frame(search_frame)
+        controls.pack(fill=tk.X)
+        query_var, since_var, until_var = tk.StringVar(), tk.StringVar(), tk.StringVar()
+        query_entry = ttk.Entry(controls, textvariable=query_var, width=30)
+        query_entry.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(controls, text="From (YYYY-MM-DD):").pack(side=tk.LEFT)
+        ttk.Entry(controls, textvariable=since_var, width=11).pack(side=tk.LEFT, padx=5)
+        ttk.Label(controls, text="To:").pack(side=tk.LEFT)
+        ttk.Entry(controls, textvariable=until_var, width=11).pack(side=tk.LEFT, padx=5)
+        
+        results_text = scrolledtext.ScrolledText(search_frame, wrap=tk.WORD,
+                                                 font=('Helvetica', 9), height=6,
+                                                 state='disabled')
+        results_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        def show(text: str):
+            if results_text.winfo_exists():
+                results_text.config(state='normal')
+                results_text.delete("1.0", tk.END)
+                results_text.insert(tk.END, text)
+                results_text.config(state='disabled')
+        
+        pending: List[TaskHandle] = []  # The search whose results are still wanted
+        
+        def on_results(handle: TaskHandle, results: Optional[List[Dict]]):
+            if handle not in pending or results is None:
+                return  # Superseded by a newer search
+            pending.clear()
+            show(''.join(f"{i}. {r.get('date', '?')} - Day {r.get('day', '?')} - {r['notes']}\n"
+                         for i, r in enumerate(results, 1)) or "No matching notes")
+        
+        def on_error(handle: TaskHandle, error: Exception):
+            if handle in pending:
+                pending.clear()
+                show(str(error))
+        
+        def search(event=None):
+            if not query_var.get().strip():
+                return
+            for previous in pending:
+                previous.cancel()
+            pending.clear()
+            show("Searching...")
+            log = self.user.progress_log
+            handle = self.runner.submit("Searching notes", self._search_notes, log, log.copy(), query_var.get(),
+                                        since_var.get().strip() or None, until_var.get().strip() or None,
+                                        on_success=lambda results: on_results(handle, results),
+                                        on_error=lambda error: on_error(handle, error))
+            pending.append(handle)
+        
+        query_entry.bind('<Return>', search)
+        ttk.Button(controls, text="Search", command=search,
+                  style='Secondary.TButton').pack(side=tk.LEFT, padx=5)
+    
+    def _search_notes(self, source, log, query: str, since: Optional[str],
+                      until: Optional[str]) -> List[Dict]:
+        """Ranked notes matches in log, a copy of the live source log taken on the main thread
+
+        The index follows source, so it only catches up with newly logged workouts.
+        """
+        with self._notes_lock:
+            if self._notes_index is None or self._notes_source is not source:
+                self._notes_index, self._notes_source = NotesIndex(log), source
+            else:
+                self._notes_index.log = log
+            return self._notes_index.search(query, since, until)
     
     def create_stat_card(self, parent, title, value, color, row, col):
         """Create a statistic display card"""
@@ -360,7 +494,7 @@ class EnhancedGymWorkoutPlannerGUI:
                 self._cache.clear()
                 messagebox.showinfo("Success", "Weight entry added!")
                 weight_entry.delete(0, tk.END)
-                self.create_main_window()  # Refresh
+                self.refresh('weight', 'profile')
             except ValueError:
                 messagebox.showerror("Error", "Please enter a valid weight")
         
@@ -530,13 +664,10 @@ Weight Entries: {len(self.user.weight_log)}
                     messagebox.showerror("Error", "Training days must be between 1 and 7")
                     return
                 
-                # Preserve existing data if updating
+                # Update in place so logs, custom workouts, calendar and archive rollups are kept
                 if self.user:
-                    old_logs = self.user.progress_log
-                    old_weight = self.user.weight_log
-                    self.user = AdvancedUser(name, age, gender, goal, training_days)
-                    self.user.progress_log = old_logs
-                    self.user.weight_log = old_weight
+                    self.user.name, self.user.age, self.user.gender = name, age, gender
+                    self.user.goal, self.user.training_days = goal, training_days
                 else:
                     self.user = AdvancedUser(name, age, gender, goal, training_days)
                 
@@ -547,7 +678,7 @@ Weight Entries: {len(self.user.weight_log)}
                 self._cache.clear()
                 messagebox.showinfo("Success", "Profile saved successfully!")
                 form_window.destroy()
-                self.create_main_window()
+                self.refresh()
                 
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numbers")
@@ -604,7 +735,7 @@ Weight Entries: {len(self.user.weight_log)}
             self._cache.clear()
             messagebox.showinfo("Success", f"Great job completing Day {day}!")
             log_window.destroy()
-            self.create_main_window()
+            self.refresh('stats', 'profile')
         
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=20)
@@ -640,73 +771,83 @@ Weight Entries: {len(self.user.weight_log)}
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            filetypes=file_types(),
             initialfile=default_filename
         )
         
         if filename:
-            try:
-                with open(filename, 'w') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write(f"{self.user.name.upper()}'S PERSONALIZED WORKOUT PLAN\n")
-                    f.write("=" * 80 + "\n\n")
-                    
-                    f.write(f"Profile Information:\n")
-                    f.write(f"  Name: {self.user.name}\n")
-                    f.write(f"  Age: {self.user.age} years\n")
-                    f.write(f"  Gender: {self.user.gender.capitalize()}\n")
-                    f.write(f"  Goal: {WorkoutDatabase.GOAL_NAMES[self.user.goal - 1]}\n")
-                    f.write(f"  Training Days: {self.user.training_days} days per week\n")
-                    f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    
-                    age_reduction = WorkoutCalculator.calculate_age_reduction(self.user.age)
-                    if age_reduction > 0:
-                        f.write(f"Note: Workouts adjusted by {age_reduction}% for age\n\n")
-                    
-                    for day_plan in self.workout_plan:
-                        f.write("-" * 80 + "\n")
-                        f.write(f"DAY {day_plan['day']}\n")
-                        f.write("-" * 80 + "\n")
-                        f.write(day_plan['workout'] + "\n\n")
-                    
-                    f.write("=" * 80 + "\n")
-                    f.write("Stay consistent and track your progress!\n")
-                    f.write("=" * 80 + "\n")
-                
-                messagebox.showinfo("Success", f"Workout plan exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export file:\n{str(e)}")
+            self.runner.submit("Exporting plan", self._write_plan_export, filename,
+                               snapshot_user(self.user), self.workout_plan,
+                               pass_handle=True,
+                               on_success=lambda _: messagebox.showinfo(
+                                   "Success", "Workout plan exported successfully!"),
+                               on_error=lambda e: messagebox.showerror(
+                                   "Error", f"Failed to export file:\n{str(e)}"),
+                               on_cancel=lambda: messagebox.showinfo(
+                                   "Export Cancelled", "The workout plan was not exported."))
+    
+    def _write_plan_export(self, handle, filename: str, user, workout_plan: List[Dict]):
+        """Write the workout plan export of a user snapshot (runs on a worker thread)"""
+        def on_item(done: int, total: int):
+            handle.check_cancelled()
+            handle.report_progress(done / total)
+        
+        export_user(filename, user, workout_plan, on_item=on_item)
     
     def save_user_data(self):
-        """Save user data to JSON file"""
+        """Save user data to JSON file in the background"""
         if self.user:
-            try:
-                with open(self.data_file, 'w') as f:
-                    json.dump(self.user.to_dict(), f, indent=2)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save data:\n{str(e)}")
+            self.runner.submit("Saving profile", write_json_file,
+                               self.data_file, snapshot_user_data(self.user),
+                               latest_key='save', cancellable=False,
+                               on_error=lambda e: messagebox.showerror(
+                                   "Error", f"Failed to save data:\n{str(e)}"))
     
-    def load_user_data(self) -> bool:
-        """Load user data from JSON file"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.user = AdvancedUser.from_dict(data)
-                    self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
-                    return True
-        except Exception as e:
-            print(f"Error loading user data: {e}")
-        return False
-
+    def load_user_data(self):
+        """Load user data from JSON file in the background"""
+        self._loading = True
+        self.runner.submit("Loading profile", read_json_file, self.data_file,
+                           on_success=self._on_user_data_loaded,
+                           on_error=self._on_user_data_load_failed)
+    
+    def _on_user_data_loaded(self, data: Optional[Dict]):
+        """Apply loaded user data and rebuild the window"""
+        self._loading = False
+        if data is not None:
+            self.user = AdvancedUser.from_dict(data, columnar=True)
+            self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
+        self._cache.clear()
+        self.refresh()
+    
+    def _on_user_data_load_failed(self, error: Exception):
+        print(f"Error loading user data: {error}")
+        self._on_user_data_loaded(None)
+    
+    def on_close(self):
+        """Cancel exports and other cancellable tasks, then wait for pending saves and close"""
+        self.runner.cancel_all()
+        self.runner.shutdown(wait=True)
+        self.root.destroy()
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    from gym_metrics import configure
+    argv = configure(argv)
+    
+    if '--profile-startup' in argv:
+        from gym_profiling import profile_gui_startup
+        return profile_gui_startup('gym_gui.py', 'gym_gui', EnhancedGymWorkoutPlannerGUI, WorkoutCalculator,
+                                   lambda: AdvancedUser("Sample", 30, "male", 1, 7),
+                                   as_json='--json' in argv)
+    
     root = tk.Tk()
     app = EnhancedGymWorkoutPlannerGUI(root)
     root.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
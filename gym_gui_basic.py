@@ -7,12 +7,17 @@ A beautiful graphical interface for the gym workout planning system
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import json
-import os
+import sys
 import math
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from gym_export import export_user, file_types
+from gym_gui_support import (
+    BackgroundTaskRunner, TaskStatusBar, RefreshScheduler,
+    read_json_file, write_json_file, snapshot_user, snapshot_user_data
+)
+
 
 class WorkoutDatabase:
     """Database of workout routines"""
@@ -151,10 +156,12 @@ class User:
         self.goal = goal
         self.training_days = training_days
         self.progress_log = []
+        self.archive = {}  # Rollups of history moved out by gym_archive.compact
+        self.journal = {}  # Journal bytes already replayed into this profile (gym_archive)
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary for JSON serialization"""
-        return {
+        data = {
             'name': self.name,
             'age': self.age,
             'gender': self.gender,
@@ -162,6 +169,11 @@ class User:
             'training_days': self.training_days,
             'progress_log': self.progress_log
         }
+        if self.archive:
+            data['archive'] = self.archive
+        if self.journal:
+            data['journal'] = self.journal
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'User':
@@ -174,6 +186,8 @@ class User:
             training_days=data.get('training_days', 0)
         )
         user.progress_log = data.get('progress_log', [])
+        user.archive = data.get('archive', {})
+        user.journal = data.get('journal', {})
         return user
 
 
@@ -260,6 +274,11 @@ class GymWorkoutPlannerGUI:
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
+        self.runner = BackgroundTaskRunner(self.root)  # Keeps slow work off the UI thread
+        self._loading = True
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.refresh_scheduler = RefreshScheduler(self.root, lambda views: self.create_main_window())
+        
         # Color scheme
         self.bg_color = "#f0f0f0"
         self.primary_color = "#4CAF50"
@@ -271,12 +290,10 @@ class GymWorkoutPlannerGUI:
         self.workout_plan: List[Dict] = []
         self.data_file = "user_data.json"
         
-        # Load user data
-        self.load_user_data()
-        
-        # Setup GUI
+        # Setup GUI, then load user data in the background
         self.setup_styles()
         self.create_main_window()
+        self.load_user_data()
         
     def setup_styles(self):
         """Setup ttk styles"""
@@ -330,7 +347,12 @@ class GymWorkoutPlannerGUI:
         title_label = ttk.Label(header_frame, text="Gym Workout Planner", style='Title.TLabel')
         title_label.pack()
         
-        if self.user:
+        if self._loading:
+            subtitle_label = ttk.Label(header_frame,
+                                      text="Loading your profile...",
+                                      style='Subtitle.TLabel')
+            subtitle_label.pack()
+        elif self.user:
             subtitle_label = ttk.Label(header_frame, 
                                       text=f"Welcome back, {self.user.name}!",
                                       style='Subtitle.TLabel')
@@ -361,14 +383,20 @@ class GymWorkoutPlannerGUI:
         
         for text, command, row, col in buttons:
             btn = ttk.Button(button_container, text=text, command=command,
-                           style='Primary.TButton', width=20)
+                           style='Primary.TButton', width=20,
+                           state='disabled' if self._loading else 'normal')
             btn.grid(row=row, column=col, padx=10, pady=10, sticky='ew')
         
         # Exit button
-        exit_btn = ttk.Button(main_container, text="Exit", command=self.root.quit,
+        exit_btn = ttk.Button(main_container, text="Exit", command=self.on_close,
                             style='Secondary.TButton')
         exit_btn.pack(pady=10)
         
+        # Progress indicator for background tasks
+        status_bar = TaskStatusBar(main_container, self.runner)
+        status_bar.pack(pady=5)
+        self.runner.attach_indicator(status_bar)
+        
         # Footer
         footer_label = ttk.Label(main_container,
                                 text="Built with Python & Tkinter | Author: Aryan Kumawat",
@@ -464,16 +492,18 @@ class GymWorkoutPlannerGUI:
                     messagebox.showerror("Error", "Training days must be between 1 and 7")
                     return
                 
-                # Save user
-                self.user = User(name, age, gender, goal, training_days)
-                if hasattr(self, 'user') and self.user.progress_log:
-                    self.user.progress_log = self.user.progress_log
+                # Update in place so the progress log and archive rollups are kept
+                if self.user:
+                    self.user.name, self.user.age, self.user.gender = name, age, gender
+                    self.user.goal, self.user.training_days = goal, training_days
+                else:
+                    self.user = User(name, age, gender, goal, training_days)
                 self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
                 self.save_user_data()
                 
                 messagebox.showinfo("Success", "Profile saved successfully!")
                 profile_window.destroy()
-                self.create_main_window()
+                self.refresh_scheduler.request()
                 
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numbers for age and training days")
@@ -560,42 +590,28 @@ Training Days: {self.user.training_days} days per week
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            filetypes=file_types(),
             initialfile=default_filename
         )
         
         if filename:
-            try:
-                with open(filename, 'w') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write(f"{self.user.name.upper()}'S PERSONALIZED WORKOUT PLAN\n")
-                    f.write("=" * 80 + "\n\n")
-                    
-                    f.write(f"Profile Information:\n")
-                    f.write(f"  Name: {self.user.name}\n")
-                    f.write(f"  Age: {self.user.age} years\n")
-                    f.write(f"  Gender: {self.user.gender.capitalize()}\n")
-                    f.write(f"  Goal: {WorkoutDatabase.GOAL_NAMES[self.user.goal - 1]}\n")
-                    f.write(f"  Training Days: {self.user.training_days} days per week\n")
-                    f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    
-                    age_reduction = WorkoutCalculator.calculate_age_reduction(self.user.age)
-                    if age_reduction > 0:
-                        f.write(f"Note: Workouts adjusted by {age_reduction}% for age\n\n")
-                    
-                    for day_plan in self.workout_plan:
-                        f.write("-" * 80 + "\n")
-                        f.write(f"DAY {day_plan['day']}\n")
-                        f.write("-" * 80 + "\n")
-                        f.write(day_plan['workout'] + "\n\n")
-                    
-                    f.write("=" * 80 + "\n")
-                    f.write("Keep up the great work! Stay consistent and track your progress.\n")
-                    f.write("=" * 80 + "\n")
-                
-                messagebox.showinfo("Success", f"Workout plan exported to:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export file:\n{str(e)}")
+            self.runner.submit("Exporting plan", self._write_plan_export, filename,
+                               snapshot_user(self.user), self.workout_plan,
+                               pass_handle=True,
+                               on_success=lambda _: messagebox.showinfo(
+                                   "Success", f"Workout plan exported to:\n{filename}"),
+                               on_error=lambda e: messagebox.showerror(
+                                   "Error", f"Failed to export file:\n{str(e)}"),
+                               on_cancel=lambda: messagebox.showinfo(
+                                   "Export Cancelled", "The workout plan was not exported."))
+    
+    def _write_plan_export(self, handle, filename: str, user, workout_plan: List[Dict]):
+        """Write the workout plan export of a user snapshot (runs on a worker thread)"""
+        def on_item(done: int, total: int):
+            handle.check_cancelled()
+            handle.report_progress(done / total)
+        
+        export_user(filename, user, workout_plan, on_item=on_item)
     
     def show_log_workout(self):
         """Show workout logging dialog"""
@@ -690,19 +706,39 @@ Training Days: {self.user.training_days} days per week
                                                 font=('Helvetica', 10),
                                                 height=20)
         history_text.pack(fill=tk.BOTH, expand=True)
+        history_text.insert(tk.END, "Loading workout history...")
+        history_text.config(state='disabled')
         
-        for i, entry in enumerate(self.user.progress_log, 1):
-            history_text.insert(tk.END, f"{i}. {entry['date']} - Day {entry['day']}\n")
-            if entry['notes']:
-                history_text.insert(tk.END, f"   Notes: {entry['notes']}\n")
-            history_text.insert(tk.END, "\n")
+        def on_history_ready(content):
+            if history_text.winfo_exists():
+                history_text.config(state='normal')
+                history_text.delete("1.0", tk.END)
+                history_text.insert(tk.END, content)
+                history_text.config(state='disabled')
         
-        history_text.config(state='disabled')
+        # Format long histories off the UI thread, then insert them at once
+        self.runner.submit("Loading history", self._format_progress_history,
+                           list(self.user.progress_log), pass_handle=True,
+                           on_success=on_history_ready)
         
         close_btn = ttk.Button(main_frame, text="Close", command=progress_window.destroy,
                               style='Secondary.TButton')
         close_btn.pack(pady=10)
     
+    @staticmethod
+    def _format_progress_history(handle, entries: List[Dict]) -> str:
+        """Format the workout history text (runs on a worker thread)"""
+        lines = []
+        for i, entry in enumerate(entries, 1):
+            lines.append(f"{i}. {entry['date']} - Day {entry['day']}\n")
+            if entry['notes']:
+                lines.append(f"   Notes: {entry['notes']}\n")
+            lines.append("\n")
+            if i % 1000 == 0:
+                handle.check_cancelled()
+                handle.report_progress(i / len(entries))
+        return ''.join(lines)
+    
     def show_about(self):
         """Show about dialog"""
         about_text = """
@@ -729,35 +765,58 @@ Built with Python & Tkinter
         messagebox.showinfo("About Gym Workout Planner", about_text)
     
     def save_user_data(self):
-        """Save user data to JSON file"""
+        """Save user data to JSON file in the background"""
         if self.user:
-            try:
-                with open(self.data_file, 'w') as f:
-                    json.dump(self.user.to_dict(), f, indent=2)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save user data:\n{str(e)}")
+            self.runner.submit("Saving profile", write_json_file,
+                               self.data_file, snapshot_user_data(self.user),
+                               latest_key='save', cancellable=False,
+                               on_error=lambda e: messagebox.showerror(
+                                   "Error", f"Failed to save user data:\n{str(e)}"))
     
-    def load_user_data(self) -> bool:
-        """Load user data from JSON file"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.user = User.from_dict(data)
-                    self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
-                    return True
-        except Exception as e:
-            print(f"Error loading user data: {e}")
-        return False
-
+    def load_user_data(self):
+        """Load user data from JSON file in the background"""
+        self._loading = True
+        self.runner.submit("Loading profile", read_json_file, self.data_file,
+                           on_success=self._on_user_data_loaded,
+                           on_error=self._on_user_data_load_failed)
+    
+    def _on_user_data_loaded(self, data: Optional[Dict]):
+        """Apply loaded user data and rebuild the window"""
+        self._loading = False
+        if data is not None:
+            self.user = User.from_dict(data)
+            self.workout_plan = WorkoutCalculator.generate_workout_plan(self.user)
+        self.refresh_scheduler.request()
+    
+    def _on_user_data_load_failed(self, error: Exception):
+        print(f"Error loading user data: {error}")
+        self._on_user_data_loaded(None)
+    
+    def on_close(self):
+        """Cancel exports and other cancellable tasks, then wait for pending saves and close"""
+        self.runner.cancel_all()
+        self.runner.shutdown(wait=True)
+        self.root.destroy()
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    from gym_metrics import configure
+    argv = configure(argv)
+    
+    if '--profile-startup' in argv:
+        from gym_profiling import profile_gui_startup
+        return profile_gui_startup('gym_gui_basic.py', 'gym_gui_basic', GymWorkoutPlannerGUI, WorkoutCalculator,
+                                   lambda: User("Sample", 30, "male", 1, 7),
+                                   as_json='--json' in argv)
+    
     root = tk.Tk()
     app = GymWorkoutPlannerGUI(root)
     root.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
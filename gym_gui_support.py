@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - GUI Support Utilities
+Author: Aryan Kumawat
+Background task execution and refresh scheduling shared by the Tkinter GUIs
+"""
+
+import copy
+import json
+import os
+import threading
+import traceback
+import tkinter as tk
+from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, CancelledError
+from typing import Callable, Dict, List, Optional, Set
+
+from gym_archive import read_profile
+
+
+class TaskCancelled(Exception):
+    """Raised inside a background task once cancellation was requested"""
+
+
+class TaskHandle:
+    """Handle for a task submitted to the BackgroundTaskRunner"""
+
+    def __init__(self, name: str, cancellable: bool = True):
+        self.name = name
+        self.cancellable = cancellable
+        self.future = None
+        self.progress = 0.0  # Fraction between 0 and 1, written by the worker
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation (the result will be discarded)"""
+        if not self.cancellable:
+            return
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise TaskCancelled if cancellation was requested (call from the worker)"""
+        if self._cancel_event.is_set():
+            raise TaskCancelled(self.name)
+
+    def report_progress(self, fraction: float):
+        """Report progress from the worker thread"""
+        self.progress = max(0.0, min(1.0, fraction))
+
+
+class BackgroundTaskRunner:
+    """Runs slow work off the Tk main thread and posts results back via root.after
+
+    Worker threads never touch widgets: the main thread polls finished futures
+    and dispatches the callbacks itself.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, root, max_workers: int = 2, use_processes: bool = False):
+        self.root = root
+        self.use_processes = use_processes
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="gym-worker")
+        self._active: List[Dict] = []
+        self._poll_scheduled = False
+        self._indicator: Optional['TaskStatusBar'] = None
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_sequence: Dict[str, int] = {}
+        self._key_written: Dict[str, int] = {}
+
+    def attach_indicator(self, indicator: Optional['TaskStatusBar']):
+        """Attach the progress indicator that reflects running tasks"""
+        self._indicator = indicator
+        self._update_indicator()
+
+    def submit(self, name: str, func: Callable, *args,
+               on_success: Optional[Callable] = None,
+               on_error: Optional[Callable] = None,
+               on_cancel: Optional[Callable] = None,
+               pass_handle: bool = False,
+               latest_key: Optional[str] = None,
+               cancellable: bool = True,
+               **kwargs) -> TaskHandle:
+        """Run func(*args, **kwargs) in the background
+
+        pass_handle -- give the TaskHandle to func as its first argument so it can
+                       report progress and check for cancellation (threads only)
+        latest_key  -- tasks sharing this key run one at a time and a task is
+                       skipped when a newer one with the same key already ran,
+                       e.g. successive saves of the same profile
+        cancellable -- False for work that must complete, such as saves
+        """
+        if self.use_processes and (pass_handle or latest_key is not None):
+            raise ValueError("pass_handle and latest_key need a thread-based runner")
+        handle = TaskHandle(name, cancellable)
+
+        if self.use_processes:
+            handle.future = self._executor.submit(func, *args, **kwargs)
+        else:
+            call_args = (handle,) + args if pass_handle else args
+            if latest_key is not None:
+                handle.future = self._executor.submit(
+                    self._run_latest, latest_key, self._next_sequence(latest_key),
+                    func, call_args, kwargs)
+            else:
+                handle.future = self._executor.submit(func, *call_args, **kwargs)
+
+        self._active.append({
+            'handle': handle,
+            'on_success': on_success,
+            'on_error': on_error,
+            'on_cancel': on_cancel,
+        })
+        self._schedule_poll()
+        self._update_indicator()
+        return handle
+
+    def cancel_all(self):
+        """Request cancellation of every running task"""
+        for task in self._active:
+            task['handle'].cancel()
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work; by default wait for pending tasks such as saves"""
+        self._executor.shutdown(wait=wait)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._active)
+
+    def _next_sequence(self, key: str) -> int:
+        self._key_locks.setdefault(key, threading.Lock())
+        self._key_sequence[key] = self._key_sequence.get(key, 0) + 1
+        return self._key_sequence[key]
+
+    def _run_latest(self, key: str, sequence: int, func: Callable, args, kwargs):
+        with self._key_locks[key]:
+            if sequence < self._key_written.get(key, 0):
+                return None  # Superseded by a newer task with the same key
+            result = func(*args, **kwargs)
+            self._key_written[key] = sequence
+            return result
+
+    def _schedule_poll(self):
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Dispatch callbacks for finished tasks (runs on the main thread)"""
+        self._poll_scheduled = False
+        finished, still_running = [], []
+        for task in self._active:
+            (finished if task['handle'].future.done() else still_running).append(task)
+        self._active = still_running  # Callbacks below may submit more tasks
+
+        for task in finished:
+            handle = task['handle']
+            future = handle.future
+            if handle.cancelled or future.cancelled():
+                self._dispatch(task['on_cancel'])
+                continue
+
+            try:
+                result = future.result()
+            except (TaskCancelled, CancelledError):
+                self._dispatch(task['on_cancel'])
+            except Exception as e:
+                self._dispatch(task['on_error'], e)
+            else:
+                self._dispatch(task['on_success'], result)
+
+        self._update_indicator()
+        if self._active:
+            self._schedule_poll()
+
+    def _dispatch(self, callback: Optional[Callable], *args):
+        """Run a callback; an exception is reported like any Tk callback error and dispatch goes on"""
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            report = getattr(self.root, 'report_callback_exception', traceback.print_exception)
+            report(type(e), e, e.__traceback__)
+
+    def _update_indicator(self):
+        indicator = self._indicator
+        if indicator is None:
+            return
+        try:
+            if not indicator.winfo_exists():
+                self._indicator = None
+                return
+        except tk.TclError:
+            self._indicator = None
+            return
+
+        if self._active:
+            handles = [task['handle'] for task in self._active]
+            progress = sum(h.progress for h in handles) / len(handles)
+            label = handles[0].name if len(handles) == 1 else f"{len(handles)} tasks"
+            indicator.show(label, progress)
+        else:
+            indicator.hide()
+
+
+class TaskStatusBar(ttk.Frame):
+    """Progress indicator with a cancel button for background tasks"""
+
+    def __init__(self, parent, runner: BackgroundTaskRunner, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.runner = runner
+
+        self._label = ttk.Label(self, text="", font=('Helvetica', 9), foreground='gray')
+        self._progress = ttk.Progressbar(self, length=140, mode='determinate', maximum=1.0)
+        self._cancel_btn = ttk.Button(self, text="Cancel", command=runner.cancel_all, width=8)
+        self._visible = False
+
+    def show(self, label: str, progress: float):
+        """Show the indicator for the running task(s)"""
+        self._label.config(text=f"{label}...")
+        if progress > 0:
+            self._progress.stop()
+            self._progress.config(mode='determinate', value=progress)
+        elif str(self._progress.cget('mode')) != 'indeterminate':
+            self._progress.config(mode='indeterminate')
+            self._progress.start(15)
+
+        if not self._visible:
+            self._label.pack(side=tk.LEFT, padx=(0, 5))
+            self._progress.pack(side=tk.LEFT, padx=5)
+            self._cancel_btn.pack(side=tk.LEFT, padx=5)
+            self._visible = True
+
+    def hide(self):
+        """Hide the indicator once all tasks are done"""
+        if self._visible:
+            self._progress.stop()
+            self._label.pack_forget()
+            self._progress.pack_forget()
+            self._cancel_btn.pack_forget()
+            self._visible = False
+
+
+class RefreshScheduler:
+    """Coalesces refresh requests into a single repaint per idle cycle
+
+    Callers mark views dirty with request(); the repaint callback runs once from
+    root.after_idle with the union of every view marked since the last repaint,
+    so any number of quick successive mutations results in one repaint and no
+    request is ever dropped.
+    """
+
+    ALL = 'all'
+
+    def __init__(self, root, repaint: Callable[[Set[str]], None]):
+        self.root = root
+        self._repaint = repaint
+        self._dirty: Set[str] = set()
+        self._scheduled = False
+        self.requested = 0  # Number of refresh requests received
+        self.executed = 0  # Number of repaints actually performed
+
+    def request(self, *views: str):
+        """Mark views dirty (all views if none given) and schedule a repaint"""
+        self.requested += 1
+        self._dirty.update(views or (self.ALL,))
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._flush)
+
+    def _flush(self):
+        dirty, self._dirty = self._dirty, set()
+        self._scheduled = False
+        self.executed += 1
+        self._repaint(dirty)
+
+    def stats(self) -> Dict[str, int]:
+        """Requested vs. executed repaint counters"""
+        return {
+            'requested': self.requested,
+            'executed': self.executed,
+            'coalesced': self.requested - self.executed,
+        }
+
+
+def read_json_file(path: str) -> Optional[Dict]:
+    """Read a profile data file and its journal, returning None if it does not exist"""
+    return read_profile(path)
+
+
+def write_json_file(path: str, data: Dict):
+    """Write a JSON data file atomically (temporary file + rename)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def snapshot_user(user):
+    """A copy of a user whose logs a worker can read while the UI keeps logging to the original
+
+    Worker tasks (statistics, exports, notes searches) get this instead of the
+    live user; take it on the main thread, like snapshot_user_data for saves.
+    """
+    snapshot = copy.copy(user)
+    for field in ('progress_log', 'weight_log'):
+        log = getattr(user, field, None)
+        if log is not None:
+            setattr(snapshot, field, log.copy())
+    return snapshot
+
+
+def snapshot_user_data(user) -> Dict:
+    """Copy a user's serialized data so a worker can write it while the UI mutates the user"""
+    data = user.to_dict()
+    for key, value in data.items():
+        if isinstance(value, list):
+            data[key] = list(value)
+        elif isinstance(value, dict):
+            data[key] = dict(value)
+    return data
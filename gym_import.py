@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - CSV Import
+Author: Aryan Kumawat
+Streams historical workouts and weigh-ins from CSV into progress_log / weight_log
+
+Columns (header names are case-insensitive, extra columns are ignored):
+    date            'YYYY-MM-DD HH:MM', ISO 8601 date-times or 'YYYY-MM-DD'
+    day, notes      workouts: plan day 1-7 and optional notes
+    weight, unit    weigh-ins: weight and 'kg' (default) or 'lbs'
+    type            optional 'workout' or 'weight'; otherwise a row with a
+                    weight is a weigh-in and any other row a workout
+Rows are validated and de-duplicated (against the logs and the file itself)
+and appended in batches; the caller saves once at the end.
+"""
+
+import csv
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from gym_records import parse_minute, parse_ordinal
+
+BATCH_SIZE = 5000
+MAX_ERRORS = 20
+MAX_WEIGHT = 1000
+
+
+class RowError(ValueError):
+    """A row (or header) that cannot be imported"""
+
+
+class ImportReport:
+    """Counts, the first few row errors and throughput of one import"""
+
+    def __init__(self):
+        self.rows = 0
+        self.workouts = 0
+        self.weights = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors: List[str] = []
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def reject(self, line: int, reason: str):
+        self.invalid += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"line {line}: {reason}")
+
+    def to_dict(self) -> Dict:
+        return {
+            'rows': self.rows, 'workouts': self.workouts, 'weights': self.weights,
+            'duplicates': self.duplicates, 'invalid': self.invalid, 'errors': self.errors,
+            'seconds': round(self.seconds, 3), 'rows_per_second': round(self.rows_per_second),
+        }
+
+
+def _workout_date(text: str, latest: str) -> str:
+    """Any accepted date format as 'YYYY-MM-DD HH:MM', no later than latest"""
+    if parse_minute(text) is not None:
+        moment_text = text
+    else:
+        try:
+            moment = datetime.fromisoformat(text)
+        except ValueError:
+            raise RowError(f"unreadable date '{text}'")
+        moment_text = moment.strftime('%Y-%m-%d %H:%M')
+    if moment_text > latest:
+        raise RowError(f"date '{text}' is in the future")
+    return moment_text
+
+
+def _weight_date(text: str, latest: str) -> str:
+    """Any accepted date format as 'YYYY-MM-DD', no later than latest"""
+    day_text = text if parse_ordinal(text) is not None else _workout_date(text, latest)[:10]
+    if day_text > latest[:10]:
+        raise RowError(f"date '{text}' is in the future")
+    return day_text
+
+
+def parse_workout(row: Dict[str, str], latest: str) -> Dict:
+    """A progress_log entry from a CSV row; latest is the current 'YYYY-MM-DD HH:MM'"""
+    day = row.get('day', '').strip()
+    if not day.isdigit() or not 1 <= int(day) <= 7:
+        raise RowError(f"day must be 1-7, not '{day}'")
+    return {'date': _workout_date(row.get('date', '').strip(), latest), 'day': int(day),
+            'notes': row.get('notes', '').strip()}
+
+
+def parse_weight(row: Dict[str, str], latest: str) -> Dict:
+    """A weight_log entry from a CSV row"""
+    text = row.get('weight', '').strip()
+    try:
+        weight = float(text)
+    except ValueError:
+        raise RowError(f"weight must be a number, not '{text}'")
+    if not 0 < weight <= MAX_WEIGHT:
+        raise RowError(f"weight {text} is out of range")
+    unit = row.get('unit', '').strip().lower() or 'kg'
+    if unit not in ('kg', 'lbs'):
+        raise RowError(f"unit must be kg or lbs, not '{unit}'")
+    return {'date': _weight_date(row.get('date', '').strip(), latest), 'weight': weight, 'unit': unit}
+
+
+def _is_weight(row: Dict[str, str]) -> bool:
+    kind = row.get('type', '').strip().lower()
+    if kind:
+        if kind not in ('workout', 'weight'):
+            raise RowError(f"type must be workout or weight, not '{kind}'")
+        return kind == 'weight'
+    return bool(row.get('weight', '').strip())
+
+
+def _workout_key(entry) -> Tuple:
+    return (entry.get('date'), entry.get('day'))
+
+
+def _weight_key(entry) -> Tuple:
+    return (entry.get('date'), entry.get('weight'), entry.get('unit'))
+
+
+class _Target:
+    """One log being imported into: seen keys, pending batch and date order"""
+
+    def __init__(self, log, key):
+        self.log = log
+        self.key = key
+        self.seen = {key(entry) for entry in log}
+        self.batch: List[Dict] = []
+        self.last = max((entry.get('date') or '' for entry in log), default='')
+        self.in_order = True
+
+    def add(self, entry: Dict) -> bool:
+        key = self.key(entry)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        if entry['date'] < self.last:
+            self.in_order = False
+        self.last = max(self.last, entry['date'])
+        self.batch.append(entry)
+        return True
+
+    def flush(self):
+        if self.batch:
+            self.log.extend(self.batch)
+            self.batch = []
+
+    def finish(self):
+        self.flush()
+        if not self.in_order:  # Keep the logs chronological (the weight log's last entry is "current")
+            self.log[:] = sorted(self.log, key=lambda entry: entry.get('date') or '')
+
+
+def import_csv(source: TextIO, progress_log: List, weight_log: List, batch_size: int = BATCH_SIZE,
+               now: Optional[datetime] = None) -> ImportReport:
+    """Validate, de-duplicate and append every row of a CSV stream to the logs"""
+    report = ImportReport()
+    start = time.perf_counter()
+    latest = (now or datetime.now()).strftime('%Y-%m-%d %H:%M')
+    reader = csv.DictReader(source, restval='')
+    if reader.fieldnames is None or 'date' not in {name.strip().lower() for name in reader.fieldnames}:
+        raise RowError("the CSV needs a header row with a 'date' column")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+
+    targets = {False: _Target(progress_log, _workout_key), True: _Target(weight_log, _weight_key)}
+    for row in reader:
+        report.rows += 1
+        try:
+            is_weight = _is_weight(row)
+            entry = parse_weight(row, latest) if is_weight else parse_workout(row, latest)
+        except RowError as e:
+            report.reject(reader.line_num, str(e))
+            continue
+        target = targets[is_weight]
+        if not target.add(entry):
+            report.duplicates += 1
+        elif is_weight:
+            report.weights += 1
+        else:
+            report.workouts += 1
+        if len(target.batch) >= batch_size:
+            target.flush()
+    for target in targets.values():
+        target.finish()
+
+    report.seconds = time.perf_counter() - start
+    return report
+
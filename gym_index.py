@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Exercise Index
+Author: Aryan Kumawat
+Inverted index from exercise name to every workout that prescribes it
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from gym import User, WorkoutCalculator, WorkoutDatabase
+
+# "Hip thrusts (12 reps x 3 sets)" -> name, amount, unit, sets
+EXERCISE_LINE = re.compile(r'^(?P<name>.+?) \((?P<amount>\d+) (?P<unit>reps|mins) x (?P<sets>\d+) sets\)$')
+
+
+class ExerciseOccurrence(NamedTuple):
+    """One exercise line of a workout"""
+    workout: int   # Index into WorkoutDatabase.WORKOUT_LISTS
+    position: int  # Exercise number within the workout, from 1
+    name: str
+    amount: int
+    unit: str      # 'reps' or 'mins'
+    sets: int
+    line: str
+
+
+def normalize_exercise(name: str) -> str:
+    """Case- and whitespace-insensitive key of an exercise name"""
+    return " ".join(name.lower().split())
+
+
+class ExerciseIndex:
+    """Exercise name -> occurrences across the workout database, built once"""
+
+    def __init__(self, workouts: Optional[List[str]] = None):
+        self.workouts = WorkoutDatabase.WORKOUT_LISTS if workouts is None else workouts
+        self.titles = [workout.split("\n", 1)[0] for workout in self.workouts]
+        self._occurrences: Dict[str, List[ExerciseOccurrence]] = {}
+        self.names: Dict[str, str] = {}  # Normalized -> display name
+
+        for workout_index, workout in enumerate(self.workouts):
+            position = 0
+            for line in workout.split("\n")[1:]:
+                match = EXERCISE_LINE.match(line.strip())
+                if not match:
+                    continue
+                position += 1
+                name = match.group('name')
+                key = normalize_exercise(name)
+                self.names.setdefault(key, name)
+                self._occurrences.setdefault(key, []).append(ExerciseOccurrence(
+                    workout_index, position, name, int(match.group('amount')),
+                    match.group('unit'), int(match.group('sets')), line.strip()
+                ))
+
+    def lookup(self, name: str) -> List[ExerciseOccurrence]:
+        """Every occurrence of an exercise (exact name, any case)"""
+        return self._occurrences.get(normalize_exercise(name), [])
+
+    def workouts_including(self, name: str) -> List[int]:
+        """Workout indexes that include the exercise"""
+        return sorted({occurrence.workout for occurrence in self.lookup(name)})
+
+    def search(self, text: str) -> List[str]:
+        """Display names of exercises whose name contains text"""
+        needle = normalize_exercise(text)
+        return sorted(name for key, name in self.names.items() if needle in key)
+
+    def weekly_volume(self, user: User, name: str) -> Dict[str, Dict[str, int]]:
+        """Sessions, sets and total reps/mins of an exercise in the user's week, by unit
+
+        Amounts are age-adjusted exactly as in the generated plan.
+        """
+        reduction = WorkoutCalculator.calculate_age_reduction(user.age)
+        by_workout: Dict[int, List[ExerciseOccurrence]] = {}
+        for occurrence in self.lookup(name):
+            by_workout.setdefault(occurrence.workout, []).append(occurrence)
+
+        volume: Dict[str, Dict[str, int]] = {}
+        for day in range(1, user.training_days + 1):
+            for occurrence in by_workout.get(WorkoutCalculator.workout_index_for_day(user, day), []):
+                adjusted = WorkoutCalculator.adjust_workout_line(occurrence.line, reduction, user.goal)
+                amount = int(EXERCISE_LINE.match(adjusted).group('amount'))
+                totals = volume.setdefault(occurrence.unit, {'sessions': 0, 'sets': 0, 'total': 0})
+                totals['sessions'] += 1
+                totals['sets'] += occurrence.sets
+                totals['total'] += amount * occurrence.sets
+        return volume
+
+
+_index: Optional[ExerciseIndex] = None
+
+
+def exercise_index() -> ExerciseIndex:
+    """The shared index of WorkoutDatabase.WORKOUT_LISTS, built on first use"""
+    global _index
+    if _index is None:
+        _index = ExerciseIndex()
+    return _index
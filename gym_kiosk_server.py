@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Kiosk Session Server
+Author: Aryan Kumawat
+Serves many check-in kiosks from one asyncio process over a JSON-lines protocol
+
+Usage:
+    python3 gym_kiosk_server.py [--host 127.0.0.1] [--port 8765] [--data-dir members]
+
+Protocol:
+    Each request is one JSON object per line; each reply is one JSON line
+    echoing the request "id" with either {"ok": true, "result": ...} or
+    {"ok": false, "status": ..., "error": ...}.
+
+    {"op": "create_profile", "member": "Jane", "age": 30, "gender": "female", "goal": 4, "training_days": 3}
+    {"op": "select", "member": "Jane"}       sets the session's member for later requests
+    {"op": "log_workout", "day": 2, "notes": "Felt strong"}
+    {"op": "view_plan"}
+    {"op": "view_progress"}
+    {"op": "ping"}
+    {"op": "stats"}                           session/cache counters (and timings with --metrics)
+    {"op": "quit"}
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from gym import WorkoutCalculator
+from gym_metrics import configure, enabled, registry
+from gym_server import APIError, PlanService
+from gym_store import ProfileStore
+
+MAX_LINE_BYTES = 64 * 1024
+
+
+class KioskSession:
+    """State of one kiosk connection"""
+
+    def __init__(self, peer: str):
+        self.peer = peer
+        self.member: Optional[str] = None
+
+
+class KioskServer:
+    """Maps kiosk requests onto PlanService without a thread per client
+
+    Sessions run as coroutines on one event loop. Every operation on the
+    profile store runs on a small shared thread pool, since it may read the
+    disk or wait for the member's store lock during a save, and an asyncio
+    lock per member keeps writes in request order.
+    """
+
+    def __init__(self, service: PlanService, io_workers: int = 4):
+        self.service = service
+        self.io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="kiosk-io")
+        self._member_locks: Dict[str, asyncio.Lock] = {}
+        self.sessions = 0
+        self.requests = 0
+
+    def _member_lock(self, name: str) -> asyncio.Lock:
+        key = name.strip().lower()
+        if key not in self._member_locks:
+            self._member_locks[key] = asyncio.Lock()
+        return self._member_locks[key]
+
+    async def _run_io(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.io_pool, func, *args)
+
+    async def _read(self, name: str, func):
+        """Run a read-only operation off the event loop (it may wait for a save)"""
+        return await self._run_io(func, name)
+
+    async def _write(self, name: str, func, body: Dict):
+        """Run a mutating operation; saves for one member never overlap"""
+        async with self._member_lock(name):
+            return await self._run_io(func, name, body)
+
+    def _session_member(self, session: KioskSession, request: Dict) -> str:
+        name = request.get('member') or session.member
+        if not name:
+            raise APIError(400, "No member selected; send 'select' or include 'member'")
+        return str(name)
+
+    async def dispatch(self, session: KioskSession, request: Dict):
+        """Execute one request for a session"""
+        op = request.get('op')
+        if op == 'ping':
+            return {'status': 'ok'}
+        if op == 'stats':
+            result = {'sessions': self.sessions, 'requests': self.requests,
+                      'plans': WorkoutCalculator.plan_stats(), 'profiles': self.service.store.stats()}
+            if enabled():
+                result['metrics'] = json.loads(registry.to_json())['functions']
+            return result
+
+        name = self._session_member(session, request)
+        if op == 'create_profile':
+            result = await self._write(name, self.service.save_profile, request)
+            session.member = name
+            return result
+        if op == 'select':
+            result = await self._read(name, self.service.progress)
+            session.member = name
+            return {'member': name, 'total_workouts': result['total_workouts']}
+        if op == 'log_workout':
+            return await self._write(name, self.service.log_workout, request)
+        if op == 'view_plan':
+            return await self._read(name, self.service.member_plan)
+        if op == 'view_progress':
+            return await self._read(name, self.service.progress)
+        raise APIError(400, f"Unknown op: {op!r}")
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info('peername')
+        session = KioskSession(str(peer))
+        self.sessions += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await self._send(writer, {'ok': False, 'status': 413, 'error': "Request line too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                self.requests += 1
+                request_id = None
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise APIError(400, "Request must be a JSON object")
+                    request_id = request.get('id')
+                    if request.get('op') == 'quit':
+                        await self._send(writer, {'id': request_id, 'ok': True, 'result': {'bye': True}})
+                        break
+                    reply = {'ok': True, 'result': await self.dispatch(session, request)}
+                except APIError as e:
+                    reply = {'ok': False, 'status': e.status, 'error': str(e)}
+                except ValueError as e:
+                    reply = {'ok': False, 'status': 400, 'error': f"Invalid request: {e}"}
+                except Exception as e:
+                    reply = {'ok': False, 'status': 500, 'error': f"Internal error: {e}"}
+                reply['id'] = request_id
+                await self._send(writer, reply)
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, payload: Dict):
+        writer.write(json.dumps(payload).encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE_BYTES)
+
+    def close(self):
+        self.io_pool.shutdown(wait=True)
+
+
+async def serve(host: str, port: int, data_dir: str):
+    kiosk = KioskServer(PlanService(ProfileStore(data_dir)))
+    server = await kiosk.start(host, port)
+    port = server.sockets[0].getsockname()[1]
+    print(f"Serving Gym Workout Planner kiosks on {host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        kiosk.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gym Workout Planner kiosk session server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--data-dir', default='members', help="Directory of member profiles")
+    args = parser.parse_args(configure(sys.argv[1:] if argv is None else argv))
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.data_dir))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Hot-Path Instrumentation
+Author: Aryan Kumawat
+Opt-in call counts and latency histograms for plan generation, statistics, persistence and GUI tabs
+
+Enable with the GYM_METRICS environment variable or the --metrics flag on any entry point:
+    GYM_METRICS=1 python3 gym.py                 JSON summary on stderr at exit
+    python3 gym_gui.py --metrics=metrics.prom    Prometheus text file at exit
+    python3 gym_server.py --metrics              also served at GET /metrics
+
+When disabled nothing is wrapped, so the instrumented functions run untouched.
+"""
+
+import atexit
+import functools
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+METRICS_ENV = "GYM_METRICS"
+
+# Upper bounds in seconds, Prometheus style (the +Inf bucket is implicit)
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Class name -> methods to time; classes are matched in every loaded project module
+TARGETS = {
+    'WorkoutCalculator': ['generate_workout_plan', 'build_workout_plan', 'adjust_workout_line'],
+    'WorkoutStatistics': ['get_statistics'],
+    'RestDayRecommender': ['should_rest_today'],
+    'GymWorkoutPlanner': ['save_user_data', 'load_user_data'],
+    'AdvancedGymWorkoutPlanner': ['save_user_data', 'load_user_data'],
+    'EnhancedGymWorkoutPlannerGUI': ['create_*_tab'],
+    'GymWorkoutPlannerGUI': ['create_*_tab'],
+}
+
+# Module -> functions to time. The GUIs only submit loads and saves to a background
+# task, so the file reads and writes themselves are timed, in every module binding them.
+FUNCTION_TARGETS = {
+    'gym_gui_support': ['read_json_file', 'write_json_file'],
+}
+
+# Modules that define targets; the UI-free ones are imported on enable, GUIs only if loaded
+CORE_MODULES = ['gym', 'gym_advanced']
+UI_MODULES = ['gym_gui', 'gym_gui_enhanced', 'gym_gui_basic']
+
+
+class Histogram:
+    """Call count, total and bucketed latency of one function"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_seconds': self.total,
+            'mean_seconds': self.total / self.count if self.count else 0.0,
+            'max_seconds': self.max,
+            'buckets': {str(bound): n for bound, n in zip(list(BUCKETS) + ['+Inf'], self.buckets)},
+        }
+
+
+class MetricsRegistry:
+    """Histograms by function name"""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def timed(self, name: str, func):
+        """Wrap a function so every call is recorded under name"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(name, time.perf_counter() - start)
+        wrapper.__wrapped_by_metrics__ = True
+        return wrapper
+
+    def to_json(self) -> str:
+        with self._lock:
+            data = {name: h.to_dict() for name, h in sorted(self.histograms.items())}
+        return json.dumps({'functions': data}, indent=2)
+
+    def to_prometheus(self) -> str:
+        metric = "gym_function_duration_seconds"
+        lines = [f"# HELP {metric} Wall time of instrumented Gym Workout Planner functions",
+                 f"# TYPE {metric} histogram"]
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, n in zip(list(BUCKETS) + ['+Inf'], h.buckets):
+                    cumulative += n
+                    lines.append(f'{metric}_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{function="{name}"}} {h.total}')
+                lines.append(f'{metric}_count{{function="{name}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Optional[str] = None):
+        """Write to path (.prom/.txt for Prometheus text, JSON otherwise) or stderr"""
+        if path is None:
+            sys.stderr.write(self.to_json() + "\n")
+            return
+        text = self.to_prometheus() if path.endswith(('.prom', '.txt')) else self.to_json()
+        with open(path, 'w') as f:
+            f.write(text)
+
+
+registry = MetricsRegistry()
+_enabled = False
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def _method_names(cls, patterns: List[str]) -> List[str]:
+    names = []
+    for pattern in patterns:
+        if '*' in pattern:
+            prefix, _, suffix = pattern.partition('*')
+            names.extend(name for name in vars(cls) if name.startswith(prefix) and name.endswith(suffix))
+        elif pattern in vars(cls):
+            names.append(pattern)
+    return names
+
+
+def instrument_class(cls, patterns: List[str]):
+    """Replace the matching methods of cls with timed wrappers (idempotent)"""
+    for name in _method_names(cls, patterns):
+        attr = vars(cls)[name]
+        if isinstance(attr, (staticmethod, classmethod)):
+            func = attr.__func__
+            if getattr(func, '__wrapped_by_metrics__', False):
+                continue
+            setattr(cls, name, type(attr)(registry.timed(f"{cls.__name__}.{name}", func)))
+        elif callable(attr) and not getattr(attr, '__wrapped_by_metrics__', False):
+            setattr(cls, name, registry.timed(f"{cls.__name__}.{name}", attr))
+
+
+def instrument_function(module, name: str):
+    """Replace a module-level function with a timed wrapper, also where it was imported by name"""
+    current = getattr(module, name)
+    if getattr(current, '__wrapped_by_metrics__', False):
+        original, wrapper = current.__wrapped__, current
+    else:
+        original, wrapper = current, registry.timed(f"{module.__name__}.{name}", current)
+    for module_name in ['__main__', module.__name__] + CORE_MODULES + UI_MODULES:
+        importer = sys.modules.get(module_name)
+        if importer is not None and getattr(importer, name, None) is original:
+            setattr(importer, name, wrapper)
+
+
+def instrument_loaded_modules():
+    """Instrument target classes and functions in the entry script and every loaded project module"""
+    for module_name in ['__main__'] + CORE_MODULES + UI_MODULES:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for class_name, patterns in TARGETS.items():
+            cls = getattr(module, class_name, None)
+            if isinstance(cls, type) and cls.__module__ == module.__name__:
+                instrument_class(cls, patterns)
+    for module_name, names in FUNCTION_TARGETS.items():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            for name in names:
+                instrument_function(module, name)
+
+
+def enable(dump_path: Optional[str] = None, dump_at_exit: bool = True):
+    """Turn instrumentation on and (optionally) dump the registry at exit"""
+    global _enabled
+    for module_name in CORE_MODULES:
+        importlib.import_module(module_name)
+    instrument_loaded_modules()
+    if not _enabled and dump_at_exit:
+        atexit.register(registry.dump, dump_path)
+    _enabled = True
+
+
+def configure(argv: List[str]) -> List[str]:
+    """Enable instrumentation from --metrics[=FILE] or GYM_METRICS; returns argv without the flag
+
+    GYM_METRICS=1 dumps JSON to stderr, any other value is used as the output file.
+    """
+    remaining, requested, path = [], False, None
+    for arg in argv:
+        if arg == '--metrics' or arg.startswith('--metrics='):
+            requested = True
+            path = arg.partition('=')[2] or None
+        else:
+            remaining.append(arg)
+
+    env = os.environ.get(METRICS_ENV, "")
+    if env and env != "0":
+        requested = True
+        if path is None and env != "1":
+            path = env
+
+    if requested:
+        enable(path)
+    return remaining
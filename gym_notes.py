@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Workout Notes Search
+Author: Aryan Kumawat
+Inverted token index over progress_log notes with ranked, date-filtered search
+
+The index follows the log it was built from: entries appended since the last
+search are indexed before the next one, so only new notes are tokenized.
+Matches are ranked by the rarity (idf) of the query words they contain, newer
+entries first among equals; query words no note contains are ignored.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Union
+
+from gym_records import MINUTES_PER_DAY, parse_minute, parse_ordinal
+
+TOKEN = re.compile(r"\w+")
+DateBound = Union[date, str, None]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case words of a note"""
+    return TOKEN.findall(text.casefold())
+
+
+def _bound(value: DateBound, end: bool) -> Optional[int]:
+    """A date (or 'YYYY-MM-DD') as the first or last minute of that day"""
+    if value is None:
+        return None
+    ordinal = value.toordinal() if isinstance(value, date) else parse_ordinal(value)
+    if ordinal is None:
+        raise ValueError(f"Dates must be YYYY-MM-DD, not {value!r}")
+    return (ordinal + end) * MINUTES_PER_DAY - end
+
+
+class NotesIndex:
+    """Word -> positions of the progress log entries whose notes contain it"""
+
+    def __init__(self, progress_log: Optional[List[Dict]] = None):
+        self.log = [] if progress_log is None else progress_log
+        self.rebuild()
+
+    def rebuild(self):
+        """Index the whole log again (needed after entries are edited or removed)"""
+        self._postings: Dict[str, array] = {}
+        self._minutes = array('q')  # Entry date in minutes since 0001-01-01, -1 if unreadable
+        self._sorted = True
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Index entries appended since the last call; returns how many were added"""
+        if len(self.log) < len(self._minutes):
+            self.rebuild()
+            return len(self._minutes)
+        start = len(self._minutes)
+        for position, entry in enumerate(self.log[start:], start):
+            self._add(position, entry)
+        return len(self._minutes) - start
+
+    def _add(self, position: int, entry: Dict):
+        minute = parse_minute(entry.get('date'))
+        if minute is None:
+            minute = -1
+        if minute < (self._minutes[-1] if self._minutes else 0):
+            self._sorted = False
+        self._minutes.append(minute)
+        notes = entry.get('notes')
+        for token in set(tokenize(notes)) if isinstance(notes, str) else ():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array('I')
+            postings.append(position)
+
+    def __len__(self) -> int:
+        return len(self._minutes)
+
+    def frequency(self, word: str) -> int:
+        """Number of entries whose notes contain the word"""
+        postings = self._postings.get(word.casefold())
+        return len(postings) if postings is not None else 0
+
+    def _candidates(self, postings: array, first: Optional[int], last: Optional[int]):
+        """Postings restricted to entries dated within [first, last] minutes"""
+        if first is None and last is None:
+            return postings
+        if self._sorted:  # Dates ascend with positions, so bisect both
+            low = 0 if first is None else bisect_left(self._minutes, first)
+            high = len(self._minutes) if last is None else bisect_right(self._minutes, last)
+            return postings[bisect_left(postings, low):bisect_left(postings, high)]
+        minutes = self._minutes
+        return [p for p in postings if minutes[p] >= 0 and (first is None or minutes[p] >= first)
+                and (last is None or minutes[p] <= last)]
+
+    def search(self, query: str, since: DateBound = None, until: DateBound = None,
+               limit: int = 20) -> List[Dict]:
+        """Best-matching entries (newest first among equal scores), dates inclusive"""
+        self.refresh()
+        words = list(dict.fromkeys(tokenize(query)))
+        first, last = _bound(since, end=False), _bound(until, end=True)
+        if not words or len(self) == 0 or limit <= 0:
+            return []
+
+        found = {}  # Query word -> (idf, matching positions in date range)
+        for word in words:
+            postings = self._postings.get(word)
+            if postings is not None:
+                found[word] = (math.log(1 + len(self) / len(postings)), self._candidates(postings, first, last))
+        found = {word: hit for word, hit in found.items() if len(hit[1])}
+        if not found:
+            return []
+
+        # Entries with every found word rank first and score the same, so take the newest
+        best = sum(idf for idf, _ in found.values())
+        if len(found) == 1:
+            (_, positions), = found.values()
+            ranked = [(best, p) for p in reversed(positions[-limit:])]
+        else:
+            smallest, *others = sorted((positions for _, positions in found.values()), key=len)
+            common = set(smallest)
+            for positions in others:
+                common = common.intersection(positions)
+            ranked = [(best, p) for p in heapq.nlargest(limit, common)]
+        if len(ranked) < limit and len(found) > 1:
+            scores: Dict[int, float] = {}
+            for idf, positions in found.values():
+                for position in positions:
+                    scores[position] = scores.get(position, 0.0) + idf
+            rest = heapq.nlargest(limit - len(ranked), (p for p in scores if p not in common),
+                                  key=lambda p: (scores[p], p))
+            ranked += [(scores[p], p) for p in rest]
+        return [{'position': p, 'score': round(score, 3), **self.log[p]} for score, p in ranked]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Periodization
+Author: Aryan Kumawat
+Multi-week progressive-overload blocks built on the weekly plan, one week at a time
+
+A block is a run of mesocycles: loading weeks followed by one deload week. Reps/mins
+ramp up across the loading weeks of the whole block and sets step up at even
+intervals, so short and year-long blocks both end at the same peak.
+Week N is computed on demand from the member's cached weekly plan, so serving
+"this week" never builds the rest of the block.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from gym import PlanDay, WorkoutCalculator, WorkoutPlan
+from gym_index import EXERCISE_LINE
+
+MIN_WEEKS = 12
+MAX_WEEKS = 52
+
+
+class WeekPrescription:
+    """How week N of a block changes the weekly plan"""
+
+    def __init__(self, week: int, phase: str, factor: float, extra_sets: int):
+        self.week = week
+        self.phase = phase            # 'loading' or 'deload'
+        self.factor = factor          # Multiplier for reps/mins
+        self.extra_sets = extra_sets  # Added to (or, if negative, removed from) every exercise
+
+    def apply(self, line: str) -> str:
+        """Scale one exercise line; other lines are returned unchanged"""
+        match = EXERCISE_LINE.match(line)
+        if not match:
+            return line
+        amount = max(1, math.ceil(int(match.group('amount')) * self.factor))
+        sets = max(1, int(match.group('sets')) + self.extra_sets)
+        return f"{match.group('name')} ({amount} {match.group('unit')} x {sets} sets)"
+
+    def to_dict(self) -> Dict:
+        return {'week': self.week, 'phase': self.phase,
+                'factor': round(self.factor, 3), 'extra_sets': self.extra_sets}
+
+
+class PeriodizationBlock:
+    """A 12-52 week progressive block; week plans are built lazily and cached"""
+
+    def __init__(self, weeks: int = MIN_WEEKS, cycle_weeks: int = 4, ramp: Optional[float] = None,
+                 max_factor: float = 1.5, deload_factor: float = 0.6, max_extra_sets: int = 2,
+                 max_entries: int = 4096):
+        if not MIN_WEEKS <= weeks <= MAX_WEEKS:
+            raise ValueError(f"A block lasts {MIN_WEEKS} to {MAX_WEEKS} weeks, not {weeks}")
+        if cycle_weeks < 2:
+            raise ValueError("A mesocycle needs at least one loading week and a deload week")
+        self.weeks = weeks
+        self.cycle_weeks = cycle_weeks
+        self.cycles = math.ceil(weeks / cycle_weeks)
+        loading_weeks = weeks - weeks // cycle_weeks
+        # By default the last loading week reaches max_factor
+        self.ramp = (max_factor - 1) / max(loading_weeks - 1, 1) if ramp is None else ramp
+        self.max_factor = max_factor
+        self.deload_factor = deload_factor
+        self.max_extra_sets = max_extra_sets
+        self.max_entries = max_entries
+        self._plans: 'OrderedDict[Tuple, WorkoutPlan]' = OrderedDict()
+        self._workouts: Dict[Tuple[str, float, int], str] = {}  # Interned week workout texts
+        self._lock = threading.Lock()
+
+    def prescription(self, week: int) -> WeekPrescription:
+        """Ramp, sets and phase of a week (1-based) in O(1)"""
+        if not 1 <= week <= self.weeks:
+            raise ValueError(f"Week must be between 1 and {self.weeks}")
+        cycle, position = divmod(week - 1, self.cycle_weeks)
+        loading_weeks = self.cycle_weeks - 1
+        extra_sets = cycle * (self.max_extra_sets + 1) // self.cycles
+        if position == loading_weeks:
+            return WeekPrescription(week, 'deload', self.deload_factor, extra_sets - 1)
+        level = cycle * loading_weeks + position  # Loading weeks before this one
+        return WeekPrescription(week, 'loading', min(1 + self.ramp * level, self.max_factor), extra_sets)
+
+    def _workout(self, workout: str, prescription: WeekPrescription) -> str:
+        key = (workout, prescription.factor, prescription.extra_sets)
+        text = self._workouts.get(key)
+        if text is None:
+            text = '\n'.join(prescription.apply(line) for line in workout.split('\n'))
+            with self._lock:
+                text = self._workouts.setdefault(key, text)
+        return text
+
+    def week_plan(self, user, week: int) -> WorkoutPlan:
+        """The user's read-only plan for one week of the block, shared by members with the same plan"""
+        prescription = self.prescription(week)
+        key = (WorkoutCalculator.plan_key(user), week)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan
+
+        plan = WorkoutPlan(PlanDay({
+            'day': day['day'],
+            'week': week,
+            'phase': prescription.phase,
+            'workout': self._workout(day['workout'], prescription),
+        }) for day in WorkoutCalculator.generate_workout_plan(user))
+        with self._lock:
+            plan = self._plans.setdefault(key, plan)
+            self._plans.move_to_end(key)
+            if len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return plan
+
+    def iter_weeks(self, user, start: int = 1) -> Iterator[WorkoutPlan]:
+        """Week plans from start to the end of the block, one at a time"""
+        for week in range(start, self.weeks + 1):
+            yield self.week_plan(user, week)
+
+    def week_number(self, start: datetime, today: Optional[datetime] = None) -> int:
+        """Block week of a date for a block started on start (repeats after the last week)"""
+        days = ((today or datetime.now()) - start).days
+        return max(days, 0) // 7 % self.weeks + 1
+
+    def current_week_plan(self, user, start: datetime, today: Optional[datetime] = None) -> WorkoutPlan:
+        return self.week_plan(user, self.week_number(start, today))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Startup Profiling
+Author: Aryan Kumawat
+Implements the --profile-startup mode shared by all entry points
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_import_times(module: str, max_depth: int = 1) -> Dict[str, float]:
+    """Measure cold import time per module in a fresh interpreter
+
+    Runs `python -X importtime -c "import <module>"` and returns the cumulative
+    import time in seconds of every top-level import (including interpreter
+    startup modules) and of the modules the target imports, up to max_depth.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+
+    times = {}
+    children = {}  # Nested imports, listed before the module that imported them
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)) / 1e6, match.group(3), match.group(4)
+        depth = (len(indent) - 1) // 2
+        if depth == 0:
+            times[name] = times.get(name, 0.0) + cumulative
+            if name == module:
+                times.update(children)
+            children = {}
+        elif depth <= max_depth:
+            children[name] = children.get(name, 0.0) + cumulative
+    return times
+
+
+class StartupProfiler:
+    """Records the duration of startup phases for one entry point"""
+
+    def __init__(self, entry: str, module: str):
+        self.entry = entry
+        self.module = module
+        self.phases: Dict[str, float] = {}
+        self.milestones: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def milestone(self, name: str):
+        """Record the time elapsed since profiling started"""
+        self.milestones[name] = time.perf_counter() - self._start
+
+    def report(self, include_imports: bool = True) -> Dict:
+        """Build the startup report"""
+        report = {
+            'entry': self.entry,
+            'phases': dict(self.phases),
+            'milestones': dict(self.milestones),
+        }
+        if include_imports:
+            start = time.perf_counter()
+            report['imports'] = measure_import_times(self.module)
+            # Lets callers timing the whole process exclude the measuring subprocess
+            report['measurement_overhead'] = time.perf_counter() - start
+        return report
+
+    def emit(self, as_json: bool = False):
+        """Print the startup report to stdout"""
+        report = self.report()
+        if as_json:
+            print(json.dumps(report, indent=2))
+            return
+
+        print(f"Startup profile: {self.entry}")
+        print("  Imports (cold interpreter, cumulative):")
+        for name, seconds in sorted(report['imports'].items(), key=lambda x: -x[1]):
+            print(f"    {name:<32} {seconds * 1000:9.1f} ms")
+        print("  Phases:")
+        for name, seconds in report['phases'].items():
+            print(f"    {name:<32} {seconds * 1000:9.1f} ms")
+        for name, seconds in report['milestones'].items():
+            print(f"  Time to {name.replace('_', ' ')}: {seconds * 1000:.1f} ms")
+
+
+def profile_terminal_startup(entry: str, module: str, app_factory: Callable,
+                             calculator, sample_user: Callable,
+                             as_json: bool = False) -> int:
+    """Profile startup of a terminal entry point without entering its menu loop"""
+    profiler = StartupProfiler(entry, module)
+
+    with profiler.phase('app_init'):
+        app = app_factory()
+    with profiler.phase('profile_load'):
+        app.load_user_data()
+    user = app.user or sample_user()
+    with profiler.phase('plan_generation'):
+        calculator.generate_workout_plan(user)
+    profiler.milestone('ready')
+
+    profiler.emit(as_json)
+    return 0
+
+
+def profile_gui_startup(entry: str, module: str, app_factory: Callable,
+                        calculator, sample_user: Callable,
+                        as_json: bool = False, timeout: float = 30.0) -> int:
+    """Profile startup of a Tkinter entry point up to the first rendered frame"""
+    import tkinter as tk
+
+    profiler = StartupProfiler(entry, module)
+
+    try:
+        with profiler.phase('tk_init'):
+            root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Cannot profile {entry}: {e}", file=sys.stderr)
+        return 2
+
+    with profiler.phase('window_build'):
+        app = app_factory(root)
+    with profiler.phase('first_frame'):
+        root.update()
+    profiler.milestone('first_frame')
+
+    # The GUIs load the profile in the background; wait until it is shown
+    with profiler.phase('profile_load'):
+        deadline = time.perf_counter() + timeout
+        while getattr(app, '_loading', False) and time.perf_counter() < deadline:
+            root.update()
+            time.sleep(0.001)
+        root.update()
+    profiler.milestone('profile_ready')
+
+    user = app.user or sample_user()
+    with profiler.phase('plan_generation'):
+        calculator.generate_workout_plan(user)
+
+    app.on_close()
+    profiler.emit(as_json)
+    return 0
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Compact Log Records
+Author: Aryan Kumawat
+Slotted progress and weight entries that round-trip losslessly to the JSON dicts
+
+A progress entry keeps its date as one int (day ordinal * 1440 + minute of day),
+the plan day as a small int and the notes interned. Entries support read access
+like the dicts they replace (entry['date'], entry.get('notes')); any field that
+does not fit the compact form is kept verbatim in `extra`.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+MINUTES_PER_DAY = 1440
+
+# Formatting tables: "HH:MM" for every minute of a day, "YYYY-MM-DD" per day formatted
+_MINUTES = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(MINUTES_PER_DAY)]
+_DAYS: Dict[int, str] = {}
+# And back: minute of the day per "HH:MM", ordinal per valid "YYYY-MM-DD" parsed
+_MINUTE_OF = {text: minute for minute, text in enumerate(_MINUTES)}
+_ORDINALS: Dict[str, int] = {}
+
+
+def _day_text(ordinal: int) -> str:
+    text = _DAYS.get(ordinal)
+    if text is None:
+        text = _DAYS[ordinal] = date.fromordinal(ordinal).isoformat()
+    return text
+
+
+def parse_ordinal(text) -> Optional[int]:
+    """'YYYY-MM-DD' -> day ordinal, or None if not in exactly that form"""
+    if type(text) is not str:
+        return None
+    ordinal = _ORDINALS.get(text)
+    if ordinal is not None:
+        return ordinal
+    if len(text) != 10 or text[4] != '-' or text[7] != '-':
+        return None
+    digits = text[:4] + text[5:7] + text[8:]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        ordinal = _ORDINALS[text] = date(int(digits[:4]), int(digits[4:6]), int(digits[6:])).toordinal()
+    except ValueError:
+        return None
+    return ordinal
+
+
+def parse_minute(text) -> Optional[int]:
+    """'YYYY-MM-DD HH:MM' -> minutes since 0001-01-01, or None if not in exactly that form"""
+    if type(text) is not str or len(text) != 16 or text[10] != ' ':
+        return None
+    ordinal = parse_ordinal(text[:10])
+    minute = _MINUTE_OF.get(text[11:])
+    if ordinal is None or minute is None:
+        return None
+    return ordinal * MINUTES_PER_DAY + minute
+
+
+def format_minute(stamp: int) -> str:
+    ordinal, minute = divmod(stamp, MINUTES_PER_DAY)
+    return f"{_day_text(ordinal)} {_MINUTES[minute]}"
+
+
+class LogRecord(ABC):
+    """Dict-style read access on top of to_dict()"""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __getitem__(self, key):
+        """Value of a field, as in the JSON dict"""
+
+    @abstractmethod
+    def to_dict(self) -> Dict:
+        """The JSON dict this record stands for"""
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return key in self.keys()
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (dict, LogRecord)):
+            return self.to_dict() == (other if isinstance(other, dict) else other.to_dict())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ProgressEntry(LogRecord):
+    """A logged workout: {'date': 'YYYY-MM-DD HH:MM', 'day': int, 'notes': str}"""
+
+    __slots__ = ('stamp', 'day', 'notes', 'extra')
+
+    def __init__(self, stamp: Optional[int], day: Optional[int], notes: Optional[str],
+                 extra: Optional[Dict] = None):
+        self.stamp = stamp
+        self.day = day
+        self.notes = notes
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, entry: Dict) -> 'ProgressEntry':
+        if len(entry) == 3 and type(entry.get('day')) is int and type(entry.get('notes')) is str:
+            stamp = parse_minute(entry.get('date'))
+            if stamp is not None:  # The usual {'date', 'day', 'notes'} entry
+                return cls(stamp, entry['day'], sys.intern(entry['notes']))
+        extra = {key: value for key, value in entry.items() if key not in ('date', 'day', 'notes')}
+        stamp = parse_minute(entry['date']) if 'date' in entry else None
+        if stamp is None and 'date' in entry:
+            extra['date'] = entry['date']
+        day = entry.get('day')
+        if 'day' in entry and (type(day) is not int):
+            extra['day'] = day
+            day = None
+        notes = entry.get('notes')
+        if 'notes' in entry and type(notes) is not str:
+            extra['notes'] = notes
+            notes = None
+        return cls(stamp, day, sys.intern(notes) if notes is not None else None, extra or None)
+
+    def get(self, key, default=None):
+        if key == 'day' and self.day is not None:  # Hot path for plan lookups
+            return self.day
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        if key == 'date' and self.stamp is not None:
+            return format_minute(self.stamp)
+        if key == 'day' and self.day is not None:
+            return self.day
+        if key == 'notes' and self.notes is not None:
+            return self.notes
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def to_dict(self) -> Dict:
+        entry = {}
+        if self.stamp is not None:
+            entry['date'] = format_minute(self.stamp)
+        if self.day is not None:
+            entry['day'] = self.day
+        if self.notes is not None:
+            entry['notes'] = self.notes
+        if self.extra:
+            entry.update(self.extra)
+        return entry
+
+
+class WeightEntry(LogRecord):
+    """A weight measurement: {'date': 'YYYY-MM-DD', 'weight': number, 'unit': 'kg' or 'lbs'}"""
+
+    __slots__ = ('ordinal', 'weight', 'unit', 'extra')
+
+    def __init__(self, ordinal: Optional[int], weight, unit: Optional[str], extra: Optional[Dict] = None):
+        self.ordinal = ordinal
+        self.weight = weight
+        self.unit = unit
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, entry: Dict) -> 'WeightEntry':
+        if len(entry) == 3 and type(entry.get('weight')) in (int, float) and type(entry.get('unit')) is str:
+            ordinal = parse_ordinal(entry.get('date'))
+            if ordinal is not None:  # The usual {'date', 'weight', 'unit'} entry
+                return cls(ordinal, entry['weight'], sys.intern(entry['unit']))
+        extra = {key: value for key, value in entry.items() if key not in ('date', 'weight', 'unit')}
+        ordinal = parse_ordinal(entry['date']) if 'date' in entry else None
+        if ordinal is None and 'date' in entry:
+            extra['date'] = entry['date']
+        weight = entry.get('weight')
+        if 'weight' in entry and type(weight) not in (int, float):
+            extra['weight'] = weight
+            weight = None
+        unit = entry.get('unit')
+        if 'unit' in entry and type(unit) is not str:
+            extra['unit'] = unit
+            unit = None
+        return cls(ordinal, weight, sys.intern(unit) if unit is not None else None, extra or None)
+
+    def __getitem__(self, key):
+        if key == 'date' and self.ordinal is not None:
+            return _day_text(self.ordinal)
+        if key == 'weight' and self.weight is not None:
+            return self.weight
+        if key == 'unit' and self.unit is not None:
+            return self.unit
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def to_dict(self) -> Dict:
+        entry = {}
+        if self.ordinal is not None:
+            entry['date'] = _day_text(self.ordinal)
+        if self.weight is not None:
+            entry['weight'] = self.weight
+        if self.unit is not None:
+            entry['unit'] = self.unit
+        if self.extra:
+            entry.update(self.extra)
+        return entry
+
+
+def compact_progress(entries: Iterable[Dict]) -> List[ProgressEntry]:
+    return [ProgressEntry.from_dict(entry) for entry in entries]
+
+
+def compact_weights(entries: Iterable[Dict]) -> List[WeightEntry]:
+    return [WeightEntry.from_dict(entry) for entry in entries]
+
+
+def plain_log(entries: List) -> List[Dict]:
+    """The log as JSON dicts; returned unchanged when it holds no records"""
+    if hasattr(entries, 'to_list'):  # A columnar ProgressLog
+        return entries.to_list()
+    if not any(isinstance(entry, LogRecord) for entry in entries):
+        return entries
+    return [entry.to_dict() if isinstance(entry, LogRecord) else entry for entry in entries]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Roster Rest-Day Recommendations
+Author: Aryan Kumawat
+Rest-day recommendations for every member as of one reference time, in one report
+
+Each member costs one pass over the dates of their progress log (plain text
+comparisons; only the last 8 days are parsed), so a roster is dominated by
+reading its profile files. recommend_files() spreads those reads over a
+process pool in chunks; workers send back only the recommendations.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+from gym_advanced import RestDayRecommender
+from gym_archive import read_profile
+
+CHUNK_SIZE = 200  # Profile files per worker task
+Reference = Union[date, datetime, None]
+
+
+def reference_time(on: Reference = None) -> datetime:
+    """The moment recommendations are made for: now, a datetime, or the start of a date"""
+    if on is None:
+        return datetime.now()
+    if isinstance(on, datetime):
+        return on
+    return datetime(on.year, on.month, on.day)
+
+
+def recommend(profile, now: datetime) -> Dict:
+    """One member's recommendation; profile is an AdvancedUser or its raw JSON dict
+
+    recent_workouts is None for members who have not logged anything yet.
+    """
+    if isinstance(profile, dict):
+        name, training_days, log = profile['name'], profile['training_days'], profile.get('progress_log', [])
+    else:
+        name, training_days, log = profile.name, profile.training_days, profile.progress_log
+    if not log:
+        return {'name': name, 'rest': False, 'message': "No workout history available", 'recent_workouts': None}
+    activity = RestDayRecommender.recent_activity(log, now)
+    rest, message = RestDayRecommender.advise(activity, training_days)
+    return {'name': name, 'rest': rest, 'message': message, 'recent_workouts': sum(activity)}
+
+
+def _recommend_paths(paths: List[str], now: datetime) -> List[Dict]:
+    """Worker task: recommendations for a chunk of profile files"""
+    results = []
+    for path in paths:
+        try:
+            results.append(recommend(read_profile(path), now))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            results.append({'file': path, 'error': f"{type(e).__name__}: {e}"})
+    return results
+
+
+def _report(results: List[Dict], now: datetime, start: float) -> Dict:
+    seconds = time.perf_counter() - start
+    valid = [result for result in results if 'error' not in result]
+    return {
+        'reference': now.strftime('%Y-%m-%d %H:%M'),
+        'members': len(valid),
+        'rest': sum(1 for result in valid if result['rest']),
+        'train': sum(1 for result in valid if not result['rest']),
+        'no_history': sum(1 for result in valid if result['recent_workouts'] is None),
+        'errors': [result for result in results if 'error' in result],
+        'seconds': round(seconds, 3),
+        'members_per_second': round(len(results) / seconds) if seconds else 0,
+        'recommendations': valid,
+    }
+
+
+def recommend_roster(profiles: Iterable, on: Reference = None) -> Dict:
+    """Report for profiles already in memory (users or raw dicts; a generator is fine)"""
+    start = time.perf_counter()
+    now = reference_time(on)
+    return _report([recommend(profile, now) for profile in profiles], now, start)
+
+
+def recommend_files(paths: List[str], on: Reference = None, workers: Optional[int] = None,
+                    chunk_size: int = CHUNK_SIZE) -> Dict:
+    """Report for profile files, read across a process pool (workers=1 reads them in-process)"""
+    start = time.perf_counter()
+    now = reference_time(on)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        results = [result for chunk in chunks for result in _recommend_paths(chunk, now)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [result for chunk_results in pool.map(_recommend_paths, chunks, [now] * len(chunks))
+                       for result in chunk_results]
+    return _report(results, now, start)
+
+
+def recommend_directory(data_dir: str, on: Reference = None, workers: Optional[int] = None) -> Dict:
+    """Report for every member profile in a ProfileStore directory"""
+    if not os.path.isdir(data_dir):
+        raise ValueError(f"No member directory {data_dir}")
+    paths = [os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir)) if name.endswith('.json')]
+    return recommend_files(paths, on, workers)
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - HTTP Plan Service
+Author: Aryan Kumawat
+Serves plan generation, logging and statistics as a JSON HTTP API from one warm process
+
+Usage:
+    python3 gym_server.py [--host 127.0.0.1] [--port 8080] [--data-dir members]
+
+Endpoints:
+    GET  /health
+    GET  /plan?age=30&gender=male&goal=4&days=3
+    GET  /members
+    GET  /members/<name>                 profile snapshot
+    POST /members/<name>                 {"age", "gender", "goal", "training_days"}
+    GET  /members/<name>/plan
+    GET  /members/<name>/stats
+    GET  /members/<name>/progress
+    POST /members/<name>/log             {"day", "notes"?, "date"?}
+    POST /members/<name>/weight          {"weight", "unit"?}
+    GET  /cache                          cache statistics
+    GET  /metrics                        Prometheus timings (with --metrics)
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from gym import WorkoutDatabase, WorkoutCalculator
+from gym_advanced import AdvancedUser, WorkoutStatistics, WeightTracker
+from gym_metrics import configure, registry
+from gym_store import ProfileStore, validate_member_name
+
+
+class APIError(Exception):
+    """Error returned to the client as {"error": ...} with an HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_field(data: Dict, key: str, low: int, high: int) -> int:
+    try:
+        value = int(data[key])
+    except KeyError:
+        raise APIError(400, f"Missing field: {key}")
+    except (TypeError, ValueError):
+        raise APIError(400, f"Field {key} must be a number")
+    if not low <= value <= high:
+        raise APIError(400, f"Field {key} must be between {low} and {high}")
+    return value
+
+
+def validate_profile(data: Dict) -> Dict:
+    """Validate profile fields with the same rules as the interactive forms"""
+    gender = str(data.get('gender', '')).lower()
+    if gender not in ('female', 'male'):
+        raise APIError(400, "Field gender must be 'female' or 'male'")
+    return {
+        'age': _int_field(data, 'age', 1, 110),
+        'gender': gender,
+        'goal': _int_field(data, 'goal', 1, 6),
+        'training_days': _int_field(data, 'training_days', 1, 7),
+    }
+
+
+class PlanService:
+    """Request handling logic, independent of the HTTP transport"""
+
+    def __init__(self, store: ProfileStore):
+        self.store = store
+
+    def _member(self, name: str) -> AdvancedUser:
+        if not validate_member_name(name):
+            raise APIError(400, "Member names may only contain letters and spaces")
+        user = self.store.get(name)
+        if user is None:
+            raise APIError(404, f"Unknown member: {name}")
+        return user
+
+    def plan_for(self, user) -> Dict:
+        return {
+            'age_reduction': WorkoutCalculator.calculate_age_reduction(user.age),
+            'goal_name': WorkoutDatabase.GOAL_NAMES[user.goal - 1],
+            'plan': WorkoutCalculator.generate_workout_plan(user),
+        }
+
+    def member_plan(self, name: str) -> Dict:
+        return self.plan_for(self._member(name))
+
+    def anonymous_plan(self, query: Dict) -> Dict:
+        params = {key: values[0] for key, values in query.items()}
+        if 'days' in params:
+            params['training_days'] = params.pop('days')
+        profile = validate_profile(params)
+        return self.plan_for(AdvancedUser("", **profile))
+
+    def save_profile(self, name: str, body: Dict) -> Dict:
+        if not validate_member_name(name):
+            raise APIError(400, "Member names may only contain letters and spaces")
+        profile = validate_profile(body)
+        with self.store.lock(name):
+            user = self.store.get(name)
+            if user is None:
+                self.store.put(AdvancedUser(name.strip(), **profile))
+            else:
+                user.age = profile['age']
+                user.gender = profile['gender']
+                user.goal = profile['goal']
+                user.training_days = profile['training_days']
+                self.store.save(name)
+        return self.store.snapshot(name)
+
+    def log_workout(self, name: str, body: Dict) -> Dict:
+        user = self._member(name)
+        day = _int_field(body, 'day', 1, max(user.training_days, 1))
+        date = body.get('date') or datetime.now().strftime('%Y-%m-%d %H:%M')
+        try:
+            datetime.strptime(date, '%Y-%m-%d %H:%M')
+        except (TypeError, ValueError):
+            raise APIError(400, "Field date must be 'YYYY-MM-DD HH:MM'")
+
+        entry = {'date': date, 'day': day, 'notes': str(body.get('notes', ''))}
+        with self.store.lock(name):
+            user.progress_log.append(entry)
+            self.store.save(name)
+            total = len(user.progress_log)
+        return {'logged': entry, 'total_workouts': total}
+
+    def add_weight(self, name: str, body: Dict) -> Dict:
+        user = self._member(name)
+        try:
+            weight = float(body['weight'])
+        except KeyError:
+            raise APIError(400, "Missing field: weight")
+        except (TypeError, ValueError):
+            raise APIError(400, "Field weight must be a number")
+        unit = body.get('unit', 'kg')
+        if unit not in ('kg', 'lbs'):
+            raise APIError(400, "Field unit must be 'kg' or 'lbs'")
+
+        with self.store.lock(name):
+            WeightTracker.add_weight_entry(user, weight, unit)
+            self.store.save(name)
+            return {'added': user.weight_log[-1], 'entries': WeightTracker.get_weight_statistics(user)['entries']}
+
+    def statistics(self, name: str) -> Dict:
+        user = self._member(name)
+        with self.store.lock(name):
+            result = {'workouts': WorkoutStatistics.get_statistics(user)}
+            if user.weight_log or user.archive.get('weight_log'):
+                result['weight'] = WeightTracker.get_weight_statistics(user)
+                result['weight']['trend'] = WeightTracker.get_weight_trend(user)
+        return result
+
+    def progress(self, name: str) -> Dict:
+        user = self._member(name)
+        with self.store.lock(name):
+            entries = list(user.progress_log)
+        return {'total_workouts': len(entries), 'progress_log': entries}
+
+    def route(self, method: str, path: str, query: Dict, body: Optional[Dict]) -> Dict:
+        """Dispatch a request to the matching operation"""
+        parts = [unquote(part) for part in path.strip('/').split('/') if part]
+
+        if method == 'GET' and parts == ['health']:
+            return {'status': 'ok'}
+        if method == 'GET' and parts == ['plan']:
+            return self.anonymous_plan(query)
+        if method == 'GET' and parts == ['cache']:
+            return {'plans': WorkoutCalculator.plan_stats(), 'profiles': self.store.stats()}
+        if method == 'GET' and parts == ['members']:
+            return {'members': self.store.members()}
+
+        if len(parts) >= 2 and parts[0] == 'members':
+            name, action = parts[1], parts[2] if len(parts) == 3 else None
+            if len(parts) > 3:
+                raise APIError(404, "Not found")
+            if method == 'GET' and action is None:
+                self._member(name)
+                return self.store.snapshot(name)
+            if method == 'GET' and action == 'plan':
+                return self.member_plan(name)
+            if method == 'GET' and action == 'stats':
+                return self.statistics(name)
+            if method == 'GET' and action == 'progress':
+                return self.progress(name)
+            if method == 'POST' and action is None:
+                return self.save_profile(name, body or {})
+            if method == 'POST' and action == 'log':
+                return self.log_workout(name, body or {})
+            if method == 'POST' and action == 'weight':
+                return self.add_weight(name, body or {})
+
+        raise APIError(404, "Not found")
+
+
+class PlanRequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests into PlanService calls"""
+
+    service: PlanService = None  # Set by make_server
+    server_version = "GymWorkoutPlanner/2.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        if method == 'GET' and url.path == '/metrics':
+            self._send(200, registry.to_prometheus().encode('utf-8'), 'text/plain; version=0.0.4')
+            return
+        try:
+            body = None
+            if method == 'POST':
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    raise APIError(400, "Request body must be JSON")
+                if not isinstance(body, dict):
+                    raise APIError(400, "Request body must be a JSON object")
+            status, result = 200, self.service.route(method, url.path, parse_qs(url.query), body)
+        except APIError as e:
+            status, result = e.status, {'error': str(e)}
+        except Exception as e:
+            status, result = 500, {'error': f"Internal error: {e}"}
+        self._send_json(status, result)
+
+    def _send_json(self, status: int, payload: Dict):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status: int, data: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep kiosk logs quiet; errors are returned to the client
+
+
+def make_server(host: str, port: int, service: PlanService) -> ThreadingHTTPServer:
+    """Create the HTTP server bound to a PlanService"""
+    handler = type('BoundPlanRequestHandler', (PlanRequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gym Workout Planner JSON HTTP service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--data-dir', default='members', help="Directory of member profiles")
+    args = parser.parse_args(configure(sys.argv[1:] if argv is None else argv))
+
+    service = PlanService(ProfileStore(args.data_dir))
+    server = make_server(args.host, args.port, service)
+    print(f"Serving Gym Workout Planner API on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
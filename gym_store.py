@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Profile Store
+Author: Aryan Kumawat
+Multi-member profile storage with in-process caches for long-running services
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from gym_advanced import AdvancedUser
+from gym_archive import read_profile
+
+
+def validate_member_name(name: str) -> bool:
+    """Member names follow the profile rule: letters and spaces only"""
+    return bool(name and not name.isspace() and name.replace(" ", "").isalpha())
+
+
+class ProfileStore:
+    """One JSON profile file per member, cached in memory once loaded
+
+    Every mutation of a member must happen while holding lock(name); saving
+    bumps the member's version, which invalidates cached snapshots.
+    """
+
+    def __init__(self, data_dir: str = "members"):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self._users: Dict[str, AdvancedUser] = {}
+        self._versions: Dict[str, int] = {}
+        self._snapshots: Dict[str, Tuple[int, Dict]] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._guard = threading.Lock()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.data_dir, f"{name.strip().lower().replace(' ', '_')}.json")
+
+    def lock(self, name: str) -> threading.RLock:
+        """Per-member lock serializing mutations and file writes"""
+        key = name.strip().lower()
+        with self._guard:
+            if key not in self._locks:
+                self._locks[key] = threading.RLock()
+            return self._locks[key]
+
+    def members(self) -> List[str]:
+        """Names of all stored members"""
+        names = []
+        for filename in sorted(os.listdir(self.data_dir)):
+            if filename.endswith('.json'):
+                names.append(filename[:-5].replace('_', ' '))
+        return names
+
+    def stream(self):
+        """Yield every stored member, read one file at a time without caching"""
+        for name in self.members():
+            key = name.strip().lower()
+            user = self._users.get(key)
+            if user is None:
+                user = AdvancedUser.from_dict(read_profile(self.path(name)))
+            yield user
+
+    def is_cached(self, name: str) -> bool:
+        """Whether a member is already loaded in memory"""
+        return name.strip().lower() in self._users
+
+    def get(self, name: str) -> Optional[AdvancedUser]:
+        """Load a member (cached after the first read), or None if unknown"""
+        if not validate_member_name(name):
+            raise ValueError(f"Invalid member name: {name!r}")
+        key = name.strip().lower()
+        user = self._users.get(key)
+        if user is not None:
+            return user
+
+        with self.lock(name):
+            user = self._users.get(key)
+            if user is None:
+                path = self.path(name)
+                data = read_profile(path)
+                if data is None:
+                    return None
+                user = AdvancedUser.from_dict(data)
+                self._users[key] = user
+                self._versions.setdefault(key, 0)
+            return user
+
+    def put(self, user: AdvancedUser):
+        """Add or replace a member and save it"""
+        if not validate_member_name(user.name):
+            raise ValueError(f"Invalid member name: {user.name!r}")
+        with self.lock(user.name):
+            self._users[user.name.strip().lower()] = user
+            self.save(user.name)
+
+    def save(self, name: str):
+        """Write a cached member to disk atomically (call while holding lock(name))"""
+        key = name.strip().lower()
+        user = self._users[key]
+        path = self.path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(user.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def snapshot(self, name: str) -> Optional[Dict]:
+        """Cached serialized copy of a member's profile, rebuilt after each save"""
+        user = self.get(name)
+        if user is None:
+            return None
+        key = name.strip().lower()
+        with self.lock(name):
+            version = self._versions.get(key, 0)
+            cached = self._snapshots.get(key)
+            if cached is None or cached[0] != version:
+                cached = (version, json.loads(json.dumps(user.to_dict())))
+                self._snapshots[key] = cached
+            return cached[1]
+
+    def stats(self) -> Dict[str, int]:
+        return {'cached_members': len(self._users), 'cached_snapshots': len(self._snapshots)}
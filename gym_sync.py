@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Data File Sync
+Author: Aryan Kumawat
+Merges the profiles kept by the terminal, advanced and GUI versions into one history
+
+Each version saves its own file, so a member who uses several of them ends up
+with diverging logs. Logs are merged on their timestamps in one pass over the
+already sorted inputs (a log that is out of order is sorted first), dropping
+entries that are identical to one with the same timestamp in another file.
+Profile fields come from the most recently saved file.
+"""
+
+import heapq
+import json
+import os
+import time
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from gym_archive import read_profile
+
+DATA_FILES = ('user_data.json', 'user_data_advanced.json', 'user_data_gui_enhanced.json')
+PROFILE_FIELDS = ('name', 'age', 'gender', 'goal', 'training_days')
+LOG_FIELDS = ('progress_log', 'weight_log')
+
+
+def _timestamp(entry: Dict) -> str:
+    return entry.get('date') or ''
+
+
+def _in_order(log: List[Dict]) -> bool:
+    return all(_timestamp(a) <= _timestamp(b) for a, b in zip(log, log[1:]))
+
+
+def merge_logs(logs: Iterable[List[Dict]]) -> Tuple[List[Dict], int]:
+    """Merge logs on their timestamps; returns the merged log and the duplicates dropped
+
+    An entry is a duplicate when an identical entry with the same timestamp came
+    from another log, so repeats within one log (two identical weigh-ins on a
+    day) are kept: an entry appears as often as in the log holding it most.
+    Linear in the total number of entries when each log is in date order.
+    Entries sharing a timestamp keep the order of the logs they came from.
+    """
+    ordered = [log if _in_order(log) else sorted(log, key=_timestamp) for log in logs]
+    tagged = [zip(repeat(source), log) for source, log in enumerate(ordered)]
+    merged: List[Dict] = []
+    group: List[Dict] = []  # Distinct entries kept with the current timestamp
+    kept: List[int] = []  # How many copies of each were kept
+    seen: Dict[int, List[int]] = {}  # Source -> copies of each it contained so far
+    current = None
+    duplicates = 0
+    for source, entry in heapq.merge(*tagged, key=lambda item: _timestamp(item[1])):
+        stamp = _timestamp(entry)
+        if stamp != current:
+            current, group, kept, seen = stamp, [], [], {}
+        try:
+            i = group.index(entry)
+        except ValueError:
+            i = len(group)
+            group.append(entry)
+            kept.append(0)
+        counts = seen.setdefault(source, [])
+        counts.extend([0] * (len(group) - len(counts)))
+        counts[i] += 1
+        if counts[i] <= kept[i]:  # Another log already supplied this copy
+            duplicates += 1
+            continue
+        kept[i] += 1
+        merged.append(entry)
+    return merged, duplicates
+
+
+def _union(items: Iterable) -> List:
+    """Items without repeats, in first-seen order"""
+    seen = {}
+    for item in items:
+        seen.setdefault(json.dumps(item, sort_keys=True), item)
+    return list(seen.values())
+
+
+def merge_profiles(profiles: List[Dict]) -> Tuple[Dict, Dict[str, int]]:
+    """Merge profiles given oldest first; returns the profile and duplicates dropped per log"""
+    merged: Dict = {}
+    for profile in profiles:
+        for field in PROFILE_FIELDS:
+            if field in profile:
+                merged[field] = profile[field]
+
+    duplicates = {}
+    for field in LOG_FIELDS:
+        logs = [profile[field] for profile in profiles if profile.get(field)]
+        if logs or any(field in profile for profile in profiles):
+            merged[field], duplicates[field] = merge_logs(logs)
+
+    if any('custom_workouts' in profile for profile in profiles):
+        workouts: Dict = {}  # Newer files replace a custom workout with the same ID
+        for profile in profiles:
+            for workout in profile.get('custom_workouts', []):
+                key = workout.get('id') or json.dumps(workout, sort_keys=True)
+                workouts.pop(key, None)
+                workouts[key] = workout
+        merged['custom_workouts'] = list(workouts.values())
+    if any('rest_days' in profile for profile in profiles):
+        merged['rest_days'] = _union(day for profile in profiles for day in profile.get('rest_days', []))
+    if any('workout_calendar' in profile for profile in profiles):
+        merged['workout_calendar'] = {}
+        for profile in profiles:
+            merged['workout_calendar'].update(profile.get('workout_calendar', {}))
+    return merged, duplicates
+
+
+def _write(path: str, data: Dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def sync_files(paths: Optional[List[str]] = None, output: Optional[str] = None,
+               force: bool = False) -> Dict:
+    """Merge the profiles in paths (default: DATA_FILES) and write the result
+
+    The result goes to output, or back to every file it was merged from so each
+    version of the app sees the same history. Files of differently named members
+    are only merged with force.
+    """
+    start = time.perf_counter()
+    found = [path for path in (paths or DATA_FILES) if os.path.exists(path)]
+    if not found:
+        raise ValueError("No data files to sync")
+
+    found.sort(key=os.path.getmtime)  # Oldest first, so the newest profile fields win
+    profiles = [read_profile(path) for path in found]
+    for path, profile in zip(found, profiles):
+        if profile.get('archive', {}).get('progress_log') or profile.get('archive', {}).get('weight_log'):
+            raise ValueError(f"{path} has archived history; run `compact --restore` on it before syncing")
+    names = sorted({profile.get('name', '').strip().lower() for profile in profiles} - {''})
+    if len(names) > 1 and not force:
+        raise ValueError(f"The files belong to different members ({', '.join(names)}); "
+                         "pass --force to merge them anyway")
+
+    merged, duplicates = merge_profiles(profiles)
+    targets = [output] if output else found
+    journals = {path: profile['journal'] for path, profile in zip(found, profiles) if 'journal' in profile}
+    for path in targets:
+        # The merge holds the journal entries read so far; only later ones replay over it
+        _write(path, dict(merged, journal=journals[path]) if path in journals else merged)
+    return {
+        'sources': {path: {field: len(profile.get(field, [])) for field in LOG_FIELDS}
+                    for path, profile in zip(found, profiles)},
+        'merged': {field: len(merged.get(field, [])) for field in LOG_FIELDS},
+        'duplicates': duplicates,
+        'written': targets,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
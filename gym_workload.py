@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Training Volume and Workload
+Author: Aryan Kumawat
+Per-day and per-week volume from the plan and the progress log, with acute:chronic workload ratios
+
+Volume is reps x sets for counted exercises and minutes x sets for timed ones.
+Workload adds the two, counting a minute as REPS_PER_MINUTE reps. The acute load
+is the last ACUTE_DAYS of workload, the chronic load the weekly average over the
+last CHRONIC_DAYS; their ratio flags sudden spikes (above ~1.5) or detraining.
+"""
+
+from array import array
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from gym import WorkoutCalculator
+from gym_index import EXERCISE_LINE
+from gym_records import MINUTES_PER_DAY, parse_minute
+
+REPS_PER_MINUTE = 10
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+
+def workout_volume(workout: str) -> Tuple[int, int]:
+    """(reps x sets, minutes x sets) of one workout text"""
+    reps = mins = 0
+    for line in workout.split("\n"):
+        match = EXERCISE_LINE.match(line)
+        if match:
+            volume = int(match.group('amount')) * int(match.group('sets'))
+            if match.group('unit') == 'reps':
+                reps += volume
+            else:
+                mins += volume
+    return reps, mins
+
+
+def workload(reps: float, mins: float) -> float:
+    return reps + mins * REPS_PER_MINUTE
+
+
+def plan_volume(workout_plan: List[Dict]) -> List[Dict]:
+    """Volume of each plan day"""
+    days = []
+    for day in workout_plan:
+        reps, mins = workout_volume(day['workout'])
+        days.append({'day': day['day'], 'reps': reps, 'mins': mins, 'workload': workload(reps, mins)})
+    return days
+
+
+class WorkloadSeries:
+    """Daily reps and minutes of logged workouts, one array slot per calendar day"""
+
+    def __init__(self, start: int, reps: array, mins: array, sessions: array):
+        self.start = start        # Date ordinal of slot 0
+        self.reps = reps
+        self.mins = mins
+        self.sessions = sessions
+        self._prefix: Optional[array] = None
+
+    @classmethod
+    def from_log(cls, progress_log: List[Dict], day_volumes: List[Dict]) -> 'WorkloadSeries':
+        """Accumulate the plan-day volume of every logged workout"""
+        reps_by_day = [0] + [day['reps'] for day in day_volumes]
+        mins_by_day = [0] + [day['mins'] for day in day_volumes]
+        ordinals, days = array('l'), array('l')
+        for entry in progress_log:
+            # Entries without a plan day or a 'YYYY-MM-DD HH:MM' date are skipped, as in the statistics
+            day = entry.get('day')
+            if type(day) is not int or not 0 < day < len(reps_by_day):
+                continue
+            minute = parse_minute(entry.get('date'))
+            if minute is None:
+                continue
+            ordinals.append(minute // MINUTES_PER_DAY)
+            days.append(day)
+
+        if not ordinals:
+            return cls(date.today().toordinal(), array('d'), array('d'), array('l'))
+        start = min(ordinals)
+        span = max(ordinals) - start + 1
+        reps, mins, sessions = array('d', [0.0]) * span, array('d', [0.0]) * span, array('l', [0]) * span
+        for ordinal, day in zip(ordinals, days):
+            slot = ordinal - start
+            reps[slot] += reps_by_day[day]
+            mins[slot] += mins_by_day[day]
+            sessions[slot] += 1
+        return cls(start, reps, mins, sessions)
+
+    def __len__(self) -> int:
+        return len(self.reps)
+
+    def _window(self, end: int, days: int) -> float:
+        """Workload of the days slots ending at slot end (inclusive)"""
+        if self._prefix is None:
+            prefix, total = array('d', [0.0]), 0.0
+            for reps, mins in zip(self.reps, self.mins):
+                total += workload(reps, mins)
+                prefix.append(total)
+            self._prefix = prefix
+        last = min(end, len(self) - 1)
+        first = max(end - days + 1, 0)
+        if last < first:
+            return 0.0
+        return self._prefix[last + 1] - self._prefix[first]
+
+    def acwr(self, on: Optional[date] = None) -> Dict:
+        """Acute load, chronic (weekly average) load and their ratio as of a date"""
+        end = (on or date.today()).toordinal() - self.start
+        acute = self._window(end, ACUTE_DAYS)
+        chronic = self._window(end, CHRONIC_DAYS) / (CHRONIC_DAYS / ACUTE_DAYS)
+        return {'acute': acute, 'chronic': chronic, 'ratio': acute / chronic if chronic else None}
+
+    def weekly(self) -> List[Dict]:
+        """Volume per Monday-based week that has logged workouts"""
+        weeks: Dict[int, List[float]] = {}
+        for slot, sessions in enumerate(self.sessions):
+            if not sessions:
+                continue
+            ordinal = self.start + slot
+            monday = ordinal - date.fromordinal(ordinal).weekday()
+            totals = weeks.setdefault(monday, [0, 0.0, 0.0])
+            totals[0] += sessions
+            totals[1] += self.reps[slot]
+            totals[2] += self.mins[slot]
+        return [{'week': date.fromordinal(monday).isoformat(), 'sessions': int(sessions),
+                 'reps': reps, 'mins': mins, 'workload': workload(reps, mins)}
+                for monday, (sessions, reps, mins) in sorted(weeks.items())]
+
+
+def member_workload(user, workout_plan: Optional[List[Dict]] = None,
+                    on: Optional[date] = None, weeks: bool = True) -> Dict:
+    """Planned volume, logged weekly volume and ACWR of one member"""
+    if workout_plan is None:
+        workout_plan = WorkoutCalculator.generate_workout_plan(user)
+    day_volumes = plan_volume(workout_plan)
+    series = WorkloadSeries.from_log(user.progress_log, day_volumes)
+    result = {
+        'plan': day_volumes,
+        'planned_weekly_workload': sum(day['workload'] for day in day_volumes),
+        'logged_workload': workload(sum(series.reps), sum(series.mins)),
+        'acwr': series.acwr(on),
+    }
+    if weeks:
+        result['weeks'] = series.weekly()
+    return result
+
+
+def roster_workload(users: Iterable, plan_for: Callable = WorkoutCalculator.generate_workout_plan,
+                    on: Optional[date] = None) -> Dict[str, Dict]:
+    """ACWR and totals for every member; the default plan_for shares interned plans"""
+    return {user.name: member_workload(user, plan_for(user), on, weeks=False) for user in users}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Custom Workout Store Tests
+Author: Aryan Kumawat
+ID allocation and the per-version render cache of CustomWorkoutStore
+"""
+
+import unittest
+
+from gym_advanced import AdvancedUser, CustomWorkoutManager, CustomWorkoutStore
+
+SQUATS = [{'name': 'Squats', 'type': 'reps', 'value': 10, 'sets': 3}]
+RUN = [{'name': 'Run', 'type': 'mins', 'value': 20, 'sets': 1}]
+
+
+class IdTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # next_id() remembers the last ID process-wide; don't leak far-future IDs to other tests
+        self.addCleanup(setattr, CustomWorkoutManager, '_last_id', CustomWorkoutManager._last_id)
+
+
+class NextIdTest(IdTestCase):
+
+    def test_ids_strictly_increase(self):
+        ids = [int(CustomWorkoutManager.next_id()) for _ in range(50)]
+        self.assertEqual(ids, sorted(set(ids)))
+        self.assertGreaterEqual(ids[0], 20000101000000)  # Timestamp style
+
+    def test_ids_stay_above_after(self):
+        after = 99990101000000
+        self.assertGreater(int(CustomWorkoutManager.next_id(after)), after)
+        self.assertGreater(int(CustomWorkoutManager.next_id()), after + 1)
+
+
+class CustomWorkoutStoreTest(IdTestCase):
+
+    def test_added_ids_are_unique(self):
+        store = CustomWorkoutStore()
+        ids = [store.add(f"Workout {i}", SQUATS)['id'] for i in range(20)]
+        self.assertEqual(len(set(ids)), 20)
+        self.assertEqual([workout['id'] for workout in store], ids)
+
+    def test_loaded_ids_are_kept_and_duplicates_reassigned(self):
+        store = CustomWorkoutStore([
+            {'id': '5', 'name': 'A', 'exercises': SQUATS},
+            {'id': '5', 'name': 'B', 'exercises': RUN},
+            {'name': 'C', 'exercises': RUN},
+            {'id': 'legacy', 'name': 'D', 'exercises': RUN},
+        ])
+        ids = [workout['id'] for workout in store]
+        self.assertEqual(len(set(ids)), 4)
+        self.assertEqual((ids[0], ids[3]), ('5', 'legacy'))
+        self.assertEqual([workout['name'] for workout in store], ['A', 'B', 'C', 'D'])
+
+    def test_new_ids_follow_the_largest_loaded_id(self):
+        store = CustomWorkoutStore([{'id': '99990101000000', 'name': 'Future', 'exercises': RUN}])
+        self.assertGreater(int(store.add("Next", SQUATS)['id']), 99990101000000)
+
+    def test_deleted_ids_are_not_reused(self):
+        store = CustomWorkoutStore()
+        first = store.add("First", SQUATS)['id']
+        self.assertTrue(store.delete(first))
+        self.assertFalse(store.delete(first))
+        self.assertNotEqual(store.add("Second", SQUATS)['id'], first)
+        self.assertNotIn(first, store)
+
+    def test_render_is_cached_per_version(self):
+        store = CustomWorkoutStore()
+        workout_id = store.add("Legs", SQUATS)['id']
+        text = store.render(workout_id)
+        self.assertEqual(text, "Custom workout: Legs\n\nSquats (10 reps x 3 sets)")
+        self.assertIs(store.render(workout_id), text)
+
+        store.update(workout_id, name="Leg day")
+        self.assertTrue(store.render(workout_id).startswith("Custom workout: Leg day"))
+        store.update(workout_id, exercises=RUN)
+        self.assertEqual(store.render(workout_id), "Custom workout: Leg day\n\nRun (20 mins x 1 sets)")
+
+    def test_delete_drops_the_rendered_text(self):
+        store = CustomWorkoutStore()
+        workout_id = store.add("Legs", SQUATS)['id']
+        store.render(workout_id)
+        store.delete(workout_id)
+        self.assertEqual(store._rendered, {})
+        with self.assertRaises(KeyError):
+            store.render(workout_id)
+        with self.assertRaises(KeyError):
+            store.update(workout_id, name="Gone")
+
+    def test_round_trip_through_the_profile(self):
+        user = AdvancedUser("Jane", 30, "female", 1, 3)
+        workout = user.custom_workouts.add("Legs", SQUATS)
+        loaded = AdvancedUser.from_dict(user.to_dict())
+        self.assertEqual(loaded.custom_workouts.get(workout['id']), workout)
+        self.assertEqual(len(loaded.custom_workouts), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
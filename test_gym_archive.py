@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Journal, Compaction and Archive Tests
+Author: Aryan Kumawat
+Journal replay, compaction with rollups and restore, on files in a temporary directory
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from gym_advanced import AdvancedUser, WeightTracker, WorkoutStatistics
+from gym_archive import (
+    append_journal, compact, folding_path, iter_archive, journal_path, read_profile, restore
+)
+
+TODAY = date(2025, 6, 30)
+
+
+def profile(days: int = 0) -> dict:
+    """A profile with a workout every day for `days` days before TODAY and weekly weigh-ins"""
+    start = datetime(TODAY.year, TODAY.month, TODAY.day, 18, 0) - timedelta(days=days)
+    progress = [{'date': (start + timedelta(days=i)).strftime('%Y-%m-%d %H:%M'), 'day': i % 7 + 1,
+                 'notes': ''} for i in range(days)]
+    weights = [{'date': (start + timedelta(days=i)).strftime('%Y-%m-%d'), 'weight': 80 - i / 70,
+                'unit': 'kg'} for i in range(0, days, 7)]
+    return {'name': 'Jane', 'age': 30, 'gender': 'female', 'goal': 1, 'training_days': 5,
+            'progress_log': progress, 'weight_log': weights}
+
+
+class ArchiveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'user_data.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def save(self, data: dict):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+
+    def user(self) -> AdvancedUser:
+        return AdvancedUser.from_dict(read_profile(self.path))
+
+
+class JournalTest(ArchiveTestCase):
+
+    def test_identical_entries_are_all_kept(self):
+        self.save(profile())
+        for weight in (70, 71, 70, 70):
+            append_journal(self.path, 'weight_log', {'date': '2025-03-03', 'weight': weight, 'unit': 'kg'})
+        workout = {'date': '2025-03-03 10:00', 'day': 1, 'notes': ''}
+        append_journal(self.path, 'progress_log', workout)
+        append_journal(self.path, 'progress_log', dict(workout))
+
+        user = self.user()
+        stats = WeightTracker.get_weight_statistics(user)
+        self.assertEqual((stats['entries'], stats['current']), (4, 70))
+        self.assertEqual(len(user.progress_log), 2)
+
+    def test_saved_snapshot_does_not_replay_its_entries_again(self):
+        self.save(profile(3))
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 1, 'notes': ''})
+        self.save(self.user().to_dict())  # e.g. the GUI saving the loaded profile
+        self.assertEqual(len(read_profile(self.path)['progress_log']), 4)
+
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 20:00', 'day': 2, 'notes': ''})
+        self.assertEqual(len(read_profile(self.path)['progress_log']), 5)
+
+    def test_entries_journaled_after_a_load_survive_its_save(self):
+        self.save(profile(3))
+        loaded = self.user()
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 1, 'notes': ''})
+        loaded.progress_log.append({'date': '2025-06-30 20:00', 'day': 2, 'notes': ''})
+        self.save(loaded.to_dict())
+        self.assertEqual([entry['date'] for entry in read_profile(self.path)['progress_log'][-2:]],
+                         ['2025-06-30 20:00', '2025-06-30 19:00'])
+
+    def test_unfinished_last_line_is_read_later(self):
+        self.save(profile())
+        append_journal(self.path, 'weight_log', {'date': '2025-03-03', 'weight': 70, 'unit': 'kg'})
+        with open(journal_path(self.path), 'a') as f:
+            f.write('{"append": "weight_log", "entry": {"date": "2025-03-04", ')
+        data = read_profile(self.path)
+        self.assertEqual(len(data['weight_log']), 1)
+        self.save(data)
+        with open(journal_path(self.path), 'a') as f:
+            f.write('"weight": 69, "unit": "kg"}}\n')
+        self.assertEqual([entry['weight'] for entry in read_profile(self.path)['weight_log']], [70, 69])
+
+    def test_only_logs_are_journaled(self):
+        self.save(profile())
+        with self.assertRaises(ValueError):
+            append_journal(self.path, 'name', {'date': '2025-03-03'})
+
+
+class CompactionTest(ArchiveTestCase):
+
+    def statistics(self):
+        user = self.user()
+        return WorkoutStatistics.get_statistics(user), WeightTracker.get_weight_statistics(user)
+
+    def test_statistics_survive_compaction_and_restore(self):
+        self.save(profile(800))
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 3, 'notes': ''})
+        before = self.statistics()
+
+        report = compact(self.path, retention_days=90, codec='lzma', today=TODAY)
+        self.assertEqual(report['journal_entries'], 1)
+        self.assertEqual(report['kept']['progress_log'], 91)
+        self.assertFalse(os.path.exists(journal_path(self.path)))
+        self.assertLess(report['bytes_after'], report['bytes_before'])
+        self.assertEqual(self.statistics(), before)
+        self.assertEqual(len(list(iter_archive(self.path, 'progress_log'))), 710)
+
+        append_journal(self.path, 'progress_log', {'date': '2025-07-01 08:00', 'day': 4, 'notes': ''})
+        compact(self.path, retention_days=35, today=TODAY + timedelta(days=1))
+        expected = self.statistics()
+
+        restore(self.path)
+        self.assertEqual(self.statistics(), expected)
+        self.assertEqual(len(read_profile(self.path)['progress_log']), 802)
+        self.assertFalse(os.path.exists(f"{self.path}.archive"))
+
+    def test_backdated_entries_recount_the_rollups(self):
+        self.save(profile(400))
+        compact(self.path, retention_days=90, today=TODAY)
+        append_journal(self.path, 'progress_log', {'date': '2024-01-01 10:00', 'day': 2, 'notes': ''})
+        compact(self.path, retention_days=90, today=TODAY)
+        self.assertEqual(self.user().archive['progress_log']['count'], 311)
+        self.assertEqual(WorkoutStatistics.get_statistics(self.user())['total_workouts'], 401)
+
+    def test_interrupted_compaction_is_finished_by_the_next_one(self):
+        self.save(profile(100))
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 1, 'notes': ''})
+        os.replace(journal_path(self.path), folding_path(self.path))  # Crashed right after setting it aside
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 20:00', 'day': 2, 'notes': ''})
+        self.assertEqual(len(read_profile(self.path)['progress_log']), 102)
+
+        compact(self.path, retention_days=35, today=TODAY)
+        self.assertFalse(os.path.exists(folding_path(self.path)))
+        self.assertEqual(WorkoutStatistics.get_statistics(self.user())['total_workouts'], 102)
+
+    def test_invalid_options(self):
+        self.save(profile(10))
+        with self.assertRaises(ValueError):
+            compact(self.path, retention_days=7)
+        with self.assertRaises(ValueError):
+            compact(self.path, codec='zip')
+
+
+if __name__ == '__main__':
+    unittest.main()
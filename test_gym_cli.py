@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Command Line Interface Tests
+Author: Aryan Kumawat
+Runs gym_cli.main() against a temporary data file and checks its JSON output
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from gym_cli import main
+
+PROFILE = ['--name', 'Jane', '--age', '30', '--gender', 'female', '--goal', '1', '--days', '3']
+
+
+class CLITest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.directory.name, 'user_data.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *argv: str, status: int = 0) -> dict:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(['--data-file', self.data_file, *argv]), status)
+        return json.loads(output.getvalue())
+
+    def test_plan_without_profile(self):
+        result = self.run_cli('plan', *PROFILE)
+        self.assertEqual(len(result['plan']), 3)
+        self.assertFalse(result['saved'])
+        self.assertFalse(os.path.exists(self.data_file))
+
+    def test_missing_profile_is_an_error(self):
+        self.assertIn('error', self.run_cli('stats', status=1))
+        self.assertIn('missing', self.run_cli('plan', status=1)['error'])
+
+    def test_log_and_stats(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        self.assertEqual(self.run_cli('log', '--day', '1', '--date', '2025-03-03 10:00')['total_workouts'], 1)
+        self.assertEqual(self.run_cli('log', '--day', '1', '--date', '2025-03-03 10:00')['total_workouts'], 2)
+        self.assertEqual(self.run_cli('stats')['workouts']['total_workouts'], 2)
+
+    def test_weight_entries_are_all_counted(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        for weight in ('70', '71', '70', '70'):
+            added = self.run_cli('weight', 'add', weight)
+        self.assertEqual(added['entries'], 4)
+        weight = self.run_cli('stats')['weight']
+        self.assertEqual((weight['entries'], weight['current']), (4, 70.0))
+
+    def test_saving_the_profile_keeps_journaled_workouts(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        self.run_cli('log', '--day', '2')
+        self.run_cli('plan', '--days', '4', '--save')
+        self.run_cli('log', '--day', '3')
+        stats = self.run_cli('stats')['workouts']
+        self.assertEqual(stats['total_workouts'], 2)
+
+    def test_notes_and_import(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        csv_file = os.path.join(self.directory.name, 'history.csv')
+        with open(csv_file, 'w') as f:
+            f.write("date,day,notes,weight\n2025-01-02 10:00,1,knee sore,\n2025-01-03,,,70.5\n"
+                    "2025-01-04 10:00,9,bad day,\n")
+        report = self.run_cli('import', csv_file)
+        self.assertEqual((report['workouts'], report['weights'], report['invalid']), (1, 1, 1))
+        self.assertTrue(report['saved'])
+        matches = self.run_cli('notes', 'knee')['matches']
+        self.assertEqual([match['date'] for match in matches], ['2025-01-02 10:00'])
+
+    def test_export(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        output = os.path.join(self.directory.name, 'plan.md')
+        self.assertEqual(self.run_cli('export', '--output', output, '--format', 'md')['file'], output)
+        with open(output) as f:
+            self.assertIn('Jane', f.read())
+
+    def test_compact_and_restore(self):
+        self.run_cli('plan', *PROFILE, '--save')
+        self.run_cli('log', '--day', '1', '--date', '2020-01-01 10:00')
+        self.run_cli('log', '--day', '2')
+        report = self.run_cli('compact', '--codec', 'lzma')
+        self.assertEqual(report['archived'], {'progress_log': 1})
+        self.assertEqual(self.run_cli('stats')['workouts']['total_workouts'], 2)
+        self.assertEqual(self.run_cli('compact', '--restore')['restored']['progress_log'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
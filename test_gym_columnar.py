@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Columnar Progress Log Tests
+Author: Aryan Kumawat
+ProgressLog against a plain list of dicts, and the statistics read from its columns
+"""
+
+import copy
+import json
+import unittest
+from datetime import datetime, timedelta
+
+from gym_advanced import AdvancedUser, RestDayRecommender, WorkoutStatistics
+from gym_columnar import EPOCH_MINUTE, ProgressLog, columnar_log, epoch_seconds
+from gym_records import parse_minute
+
+ENTRIES = [
+    {'date': '2025-03-03 10:00', 'day': 1, 'notes': 'Felt strong'},
+    {'date': '2025-03-04 18:30', 'day': 2, 'notes': 'Knie – sore'},
+    {'date': '2025-03-06 07:15', 'day': 1, 'notes': ''},
+]
+ODD = {'date': '2025-3-7 7:00', 'day': 3, 'notes': ''}  # Kept in overflow
+
+
+class ProgressLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log = ProgressLog(ENTRIES)
+
+    def test_reads_like_a_list(self):
+        self.assertEqual(len(self.log), 3)
+        self.assertEqual(self.log, ENTRIES)
+        self.assertEqual(self.log[-1], ENTRIES[-1])
+        self.assertEqual(self.log[::2], ENTRIES[::2])
+        self.assertEqual(list(self.log), ENTRIES)
+        with self.assertRaises(IndexError):
+            self.log[3]
+
+    def test_items_are_read_only(self):
+        entry = self.log[0]
+        with self.assertRaises(TypeError):
+            entry['notes'] = 'changed'
+        with self.assertRaises(TypeError):
+            self.log[-1].update(notes='changed')
+        self.log[0] = dict(entry, notes='changed')
+        self.assertEqual(self.log[0]['notes'], 'changed')
+        self.assertEqual(json.loads(json.dumps(self.log[1])), ENTRIES[1])
+        self.assertEqual(copy.deepcopy(self.log[1]), ENTRIES[1])
+        self.log.to_list()[1]['notes'] = 'plain dicts'  # to_list() gives mutable dicts
+
+    def test_read_entries_go_back_into_the_columns(self):
+        log = ProgressLog(self.log)
+        log.append(self.log[0])
+        self.assertTrue(log.is_columnar())
+        self.assertEqual(log, ENTRIES + ENTRIES[:1])
+
+    def test_changes_match_a_list(self):
+        expected = [dict(entry) for entry in ENTRIES]
+        for log in (self.log, expected):
+            log.append({'date': '2025-03-08 10:00', 'day': 4, 'notes': 'x'})
+            log[1] = {'date': '2025-03-04 19:00', 'day': 5, 'notes': ''}
+            del log[0]
+            log.insert(0, {'date': '2025-03-01 09:00', 'day': 2, 'notes': ''})
+            log.insert(99, {'date': '2025-03-09 09:00', 'day': 3, 'notes': ''})
+            log.extend([ENTRIES[0]])
+        self.assertEqual(self.log, expected)
+
+    def test_overflow_entries(self):
+        self.log.append(ODD)
+        self.log.append({'date': '2025-03-08 10:00', 'day': 1, 'notes': '', 'rpe': 8})
+        self.assertEqual(self.log[3], ODD)
+        self.assertEqual(self.log[4]['rpe'], 8)
+        self.assertFalse(self.log.is_columnar())
+        self.assertIsNone(columnar_log(self.log))
+        del self.log[3:]
+        self.assertIs(columnar_log(self.log), self.log)
+
+    def test_copy_is_independent(self):
+        self.log.append(ODD)
+        clone = self.log.copy()
+        self.log.append({'date': '2025-03-08 10:00', 'day': 4, 'notes': 'later'})
+        self.assertEqual(clone, ENTRIES + [ODD])
+        self.assertEqual(clone.overflow, {3: ODD})
+        clone.append(ENTRIES[0])
+        self.assertEqual(len(self.log), 5)
+
+    def test_day_counts(self):
+        self.assertEqual(self.log.day_counts(), {1: 2, 2: 1})
+
+    def test_since(self):
+        minute = parse_minute('2025-03-04 18:30') - EPOCH_MINUTE
+        self.assertEqual(len(self.log.since(minute)), 1)
+        self.log.append({'date': '2025-03-05 10:00', 'day': 1, 'notes': ''})
+        self.assertFalse(self.log.is_sorted)
+        self.assertEqual(len(self.log.since(minute)), 2)
+
+    def test_epoch_seconds(self):
+        self.assertEqual(epoch_seconds(datetime(1970, 1, 2, 0, 0, 30)), 86430)
+
+
+class ColumnarStatisticsTest(unittest.TestCase):
+
+    def test_statistics_match_the_dict_path(self):
+        now = datetime.now().replace(second=0, microsecond=0)
+        stamps = [now - timedelta(days=days, hours=1) for days in (40, 20, 6, 3, 2, 1, 0)]
+        data = {'name': 'Jane', 'age': 30, 'gender': 'female', 'goal': 1, 'training_days': 4,
+                'progress_log': [{'date': stamp.strftime('%Y-%m-%d %H:%M'), 'day': i % 3 + 1, 'notes': ''}
+                                 for i, stamp in enumerate(stamps)]}
+        plain = AdvancedUser.from_dict(data)
+        columns = AdvancedUser.from_dict(data, columnar=True)
+        self.assertIsInstance(columns.progress_log, ProgressLog)
+        self.assertEqual(WorkoutStatistics.get_statistics(columns), WorkoutStatistics.get_statistics(plain))
+        self.assertEqual(RestDayRecommender.recent_activity(columns.progress_log, now),
+                         RestDayRecommender.recent_activity(plain.progress_log, now))
+        self.assertEqual(columns.to_dict()['progress_log'], data['progress_log'])
+
+
+if __name__ == '__main__':
+    unittest.main()
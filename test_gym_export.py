@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Export Format Tests
+Author: Aryan Kumawat
+Every registered format written to a temporary directory, plus format selection
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from gym_advanced import AdvancedUser
+from gym_export import EXPORTERS, TextExporter, export_members, export_user, exporter_for, file_types
+from gym_records import compact_progress
+
+
+def member(name: str = 'Jane Doe') -> AdvancedUser:
+    user = AdvancedUser(name, 45, 'female', 1, 3)
+    user.progress_log = [{'date': '2025-03-03 10:00', 'day': 1, 'notes': 'Knee | sore'},
+                         {'date': '2025-03-04 10:00', 'day': 2, 'notes': ''}]
+    user.weight_log = [{'date': '2025-03-03', 'weight': 70.5, 'unit': 'kg'}]
+    return user
+
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def export(self, fmt: str, user=None, **kwargs) -> str:
+        filename = os.path.join(self.directory.name, f"plan{EXPORTERS[fmt].extension}")
+        export_user(filename, user or member(), **kwargs)
+        with open(filename, encoding='utf-8') as f:
+            return f.read()
+
+    def test_every_format_writes_plan_and_histories(self):
+        for fmt in EXPORTERS:
+            with self.subTest(fmt=fmt):
+                content = self.export(fmt)
+                for text in ('Jane Doe', '2025-03-03 10:00', '2025-03-04 10:00', '70.5'):
+                    self.assertIn(text, content)
+                self.assertFalse(os.path.exists(os.path.join(self.directory.name, f"plan.{fmt}.tmp")))
+
+    def test_json_document(self):
+        document = json.loads(self.export('json'))
+        self.assertEqual(document['profile']['training_days'], 3)
+        self.assertEqual([day['day'] for day in document['plan']], [1, 2, 3])
+        self.assertEqual(document['progress_log'], member().progress_log)
+        self.assertEqual(document['weight_log'], member().weight_log)
+
+    def test_json_with_compact_records(self):
+        user = member()
+        user.progress_log = compact_progress(user.progress_log)
+        self.assertEqual(json.loads(self.export('json', user))['progress_log'], member().progress_log)
+
+    def test_csv_rows(self):
+        rows = list(csv.DictReader(self.export('csv').splitlines()))
+        self.assertEqual([row['section'] for row in rows], ['plan'] * 3 + ['progress'] * 2 + ['weight'])
+        self.assertEqual(rows[3]['text'], 'Knee | sore')
+        self.assertEqual((rows[5]['weight'], rows[5]['unit']), ('70.5', 'kg'))
+
+    def test_markdown_escapes_cells(self):
+        self.assertIn('Knee \\| sore', self.export('md'))
+
+    def test_sections(self):
+        content = self.export('txt', sections=('plan',))
+        self.assertIn('DAY 1', content)
+        self.assertNotIn('PROGRESS HISTORY', content)
+        self.assertNotIn('WEIGHT HISTORY', content)
+
+    def test_empty_histories_have_no_headings(self):
+        user = member()
+        user.progress_log, user.weight_log = [], []
+        self.assertNotIn('Progress History', self.export('md', user))
+
+    def test_on_item_reports_each_day_and_can_abort(self):
+        calls = []
+        self.export('txt', on_item=lambda done, total: calls.append((done, total)))
+        self.assertEqual(calls, [(1, 3), (2, 3), (3, 3)])
+
+        def cancel(done, total):
+            raise KeyboardInterrupt
+        filename = os.path.join(self.directory.name, 'aborted.txt')
+        with self.assertRaises(KeyboardInterrupt):
+            export_user(filename, member(), on_item=cancel)
+        self.assertEqual(os.listdir(self.directory.name), ['plan.txt'])
+
+    def test_exporter_for(self):
+        self.assertIs(exporter_for('plan.HTML'), EXPORTERS['html'])
+        self.assertIs(exporter_for('plan.html', 'csv'), EXPORTERS['csv'])
+        self.assertIs(exporter_for('plan.unknown'), TextExporter)
+        with self.assertRaises(ValueError):
+            exporter_for('plan.txt', 'pdf')
+        self.assertEqual(file_types()[-1], ("All files", "*.*"))
+
+    def test_export_members(self):
+        output_dir = os.path.join(self.directory.name, 'members')
+        written = export_members((member(name) for name in ('Jane Doe', 'John')), output_dir, fmt='json')
+        self.assertEqual([os.path.basename(path) for path in written],
+                         ['workout_plan_Jane_Doe.json', 'workout_plan_John.json'])
+        with open(written[1]) as f:
+            self.assertEqual(json.load(f)['profile']['name'], 'John')
+
+
+if __name__ == '__main__':
+    unittest.main()
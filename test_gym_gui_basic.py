@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Basic GUI Profile Tests
+Author: Aryan Kumawat
+Loading and saving a shared data file through the basic GUI's User keeps journal and archive state
+"""
+
+import os
+import tempfile
+import unittest
+
+from gym_advanced import AdvancedUser, WorkoutStatistics
+from gym_archive import append_journal, compact, read_profile
+from gym_gui_basic import User
+from gym_gui_support import read_json_file, snapshot_user_data, write_json_file
+from test_gym_archive import TODAY, profile
+
+
+class BasicUserTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'user_data.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load_and_save(self):
+        """What the basic GUI does on start-up and when the profile is saved"""
+        user = User.from_dict(read_json_file(self.path))
+        write_json_file(self.path, snapshot_user_data(user))
+
+    def test_journaled_entries_are_not_duplicated(self):
+        write_json_file(self.path, profile(3))
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 1, 'notes': ''})
+        self.load_and_save()
+        self.load_and_save()
+        dates = [entry['date'] for entry in read_profile(self.path)['progress_log']]
+        self.assertEqual(len(dates), 4)
+        self.assertEqual(dates.count('2025-06-30 19:00'), 1)
+
+    def test_archive_rollups_are_kept(self):
+        write_json_file(self.path, profile(400))
+        compact(self.path, retention_days=90, today=TODAY)
+        append_journal(self.path, 'progress_log', {'date': '2025-06-30 19:00', 'day': 1, 'notes': ''})
+        self.load_and_save()
+        data = read_profile(self.path)
+        self.assertIn('progress_log', data['archive'])
+        self.assertEqual(WorkoutStatistics.get_statistics(AdvancedUser.from_dict(data))['total_workouts'], 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - GUI Support Tests
+Author: Aryan Kumawat
+Background task runner, refresh scheduler and user snapshots, driven by a fake Tk root
+"""
+
+import threading
+import unittest
+
+from gym_advanced import AdvancedUser, WorkoutStatistics
+from gym_columnar import ProgressLog
+from gym_gui_support import BackgroundTaskRunner, RefreshScheduler, snapshot_user
+
+
+class FakeRoot:
+    """Collects after()/after_idle() callbacks so tests run the main loop by hand"""
+
+    def __init__(self):
+        self.pending = []
+        self.errors = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def after_idle(self, callback):
+        self.pending.append(callback)
+
+    def report_callback_exception(self, kind, error, tb):
+        self.errors.append(error)
+
+    def run(self, runner=None):
+        """Run callbacks (waiting for the runner's futures) until nothing is scheduled"""
+        while self.pending:
+            if runner is not None:
+                for task in list(runner._active):
+                    task['handle'].future.exception()  # Wait for the worker
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+
+
+class BackgroundTaskRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.runner = BackgroundTaskRunner(self.root)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_callbacks_run_on_poll(self):
+        results, errors = [], []
+        self.runner.submit("add", lambda a, b: a + b, 2, 3, on_success=results.append)
+        self.runner.submit("fail", lambda: 1 / 0, on_error=errors.append)
+        self.root.run(self.runner)
+        self.assertEqual(results, [5])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        self.assertFalse(self.runner.busy)
+
+    def test_failing_callback_does_not_stall_the_runner(self):
+        results = []
+
+        def broken(result):
+            raise RuntimeError("callback failed")
+
+        self.runner.submit("first", lambda: 1, on_success=broken)
+        self.runner.submit("second", lambda: 2, on_success=results.append)
+        self.root.run(self.runner)
+        self.assertEqual(results, [2])
+        self.assertEqual([str(e) for e in self.root.errors], ["callback failed"])
+        self.assertFalse(self.runner.busy)
+
+        self.root.run(self.runner)  # Finished tasks are not dispatched again
+        self.assertEqual(results, [2])
+
+    def test_callbacks_may_submit_tasks(self):
+        results = []
+        self.runner.submit("outer", lambda: 1, on_success=lambda value: self.runner.submit(
+            "inner", lambda: value + 1, on_success=results.append))
+        self.root.run(self.runner)
+        self.assertEqual(results, [2])
+
+    def test_handle_cancellation(self):
+        started, release = threading.Event(), threading.Event()
+        cancelled = []
+
+        def work(handle):
+            started.set()
+            release.wait(5)
+            handle.check_cancelled()
+
+        handle = self.runner.submit("slow", work, pass_handle=True, on_cancel=lambda: cancelled.append(True))
+        started.wait(5)
+        handle.cancel()
+        release.set()
+        self.root.run(self.runner)
+        self.assertEqual(cancelled, [True])
+
+    def test_latest_key_skips_superseded_tasks(self):
+        release = threading.Event()
+        written = []
+
+        def save(value):
+            release.wait(5)
+            written.append(value)
+            return value
+
+        for value in range(4):
+            self.runner.submit("save", save, value, latest_key='profile', cancellable=False)
+        release.set()
+        self.root.run(self.runner)
+        self.assertEqual(written[-1], 3)
+        self.assertEqual(written, sorted(written))
+
+    def test_process_runner_rejects_thread_only_options(self):
+        runner = BackgroundTaskRunner(self.root, use_processes=True)
+        try:
+            with self.assertRaises(ValueError):
+                runner.submit("task", abs, -1, pass_handle=True)
+            with self.assertRaises(ValueError):
+                runner.submit("task", abs, -1, latest_key='profile')
+        finally:
+            runner.shutdown()
+
+
+class RefreshSchedulerTest(unittest.TestCase):
+
+    def test_requests_coalesce_into_one_repaint(self):
+        root = FakeRoot()
+        repaints = []
+        scheduler = RefreshScheduler(root, repaints.append)
+        scheduler.request('stats')
+        scheduler.request('log')
+        scheduler.request('stats')
+        root.run()
+        self.assertEqual(repaints, [{'stats', 'log'}])
+        self.assertEqual(scheduler.stats(), {'requested': 3, 'executed': 1, 'coalesced': 2})
+
+    def test_request_after_repaint_is_not_dropped(self):
+        root = FakeRoot()
+        repaints = []
+        scheduler = RefreshScheduler(root, repaints.append)
+        scheduler.request()
+        root.run()
+        scheduler.request('weight')
+        root.run()
+        self.assertEqual(repaints, [{RefreshScheduler.ALL}, {'weight'}])
+
+
+class SnapshotUserTest(unittest.TestCase):
+
+    def test_snapshot_does_not_see_later_workouts(self):
+        user = AdvancedUser('Jane', 30, 'female', 1, 3)
+        user.progress_log = ProgressLog([{'date': '2025-03-03 10:00', 'day': 1, 'notes': 'Legs'}])
+        user.weight_log = [{'date': '2025-03-03', 'weight': 70.5, 'unit': 'kg'}]
+        snapshot = snapshot_user(user)
+        user.progress_log.append({'date': '2025-03-04 10:00', 'day': 2, 'notes': ''})
+        user.weight_log.append({'date': '2025-03-04', 'weight': 70.0, 'unit': 'kg'})
+        self.assertIsInstance(snapshot.progress_log, ProgressLog)
+        self.assertEqual((len(snapshot.progress_log), len(snapshot.weight_log)), (1, 1))
+        self.assertEqual(WorkoutStatistics.get_statistics(snapshot)['total_workouts'], 1)
+        self.assertEqual(snapshot.name, 'Jane')
+
+
+if __name__ == '__main__':
+    unittest.main()
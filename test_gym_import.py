@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - CSV Import Tests
+Author: Aryan Kumawat
+Validation, de-duplication and ordering of rows imported into the logs
+"""
+
+import io
+import unittest
+from datetime import datetime
+
+from gym_import import RowError, import_csv, parse_weight, parse_workout
+
+NOW = datetime(2025, 6, 30, 12, 0)
+LATEST = '2025-06-30 12:00'
+
+
+def run_import(text: str, progress_log=None, weight_log=None, **kwargs):
+    progress_log = [] if progress_log is None else progress_log
+    weight_log = [] if weight_log is None else weight_log
+    report = import_csv(io.StringIO(text), progress_log, weight_log, now=NOW, **kwargs)
+    return report, progress_log, weight_log
+
+
+class ParseRowTest(unittest.TestCase):
+
+    def test_workout_dates(self):
+        for text in ('2025-03-03 10:00', '2025-03-03T10:00:30', '2025-03-03'):
+            entry = parse_workout({'date': text, 'day': '2', 'notes': ' ok '}, LATEST)
+            self.assertEqual(entry['date'][:10], '2025-03-03')
+            self.assertEqual((entry['day'], entry['notes']), (2, 'ok'))
+
+    def test_weight_defaults_to_kg(self):
+        self.assertEqual(parse_weight({'date': '2025-03-03 07:00', 'weight': '70.5'}, LATEST),
+                         {'date': '2025-03-03', 'weight': 70.5, 'unit': 'kg'})
+        self.assertEqual(parse_weight({'date': '2025-03-03', 'weight': '155', 'unit': 'LBS'}, LATEST)['unit'],
+                         'lbs')
+
+    def test_invalid_rows(self):
+        for row in ({'date': '2025-03-03', 'day': '8'}, {'date': 'March', 'day': '1'},
+                    {'date': '2025-07-01', 'day': '1'}, {'date': '2025-06-30 12:01', 'day': '1'}):
+            with self.subTest(row=row), self.assertRaises(RowError):
+                parse_workout(row, LATEST)
+        for row in ({'date': '2025-03-03', 'weight': 'heavy'}, {'date': '2025-03-03', 'weight': '0'},
+                    {'date': '2025-03-03', 'weight': '70', 'unit': 'stone'},
+                    {'date': '2025-07-01', 'weight': '70'}):
+            with self.subTest(row=row), self.assertRaises(RowError):
+                parse_weight(row, LATEST)
+
+
+class ImportCSVTest(unittest.TestCase):
+
+    def test_rows_are_sorted_into_the_logs(self):
+        report, progress, weights = run_import(
+            "Date, Day, Notes, Weight, Unit, Extra\n"
+            "2025-03-03 10:00,1,Legs,,,x\n"
+            "2025-03-04,,,70.5,kg,\n"
+            "2025-03-05 10:00,2,,,,\n")
+        self.assertEqual((report.rows, report.workouts, report.weights, report.invalid), (3, 2, 1, 0))
+        self.assertEqual([entry['day'] for entry in progress], [1, 2])
+        self.assertEqual(weights, [{'date': '2025-03-04', 'weight': 70.5, 'unit': 'kg'}])
+
+    def test_type_column(self):
+        report, progress, weights = run_import(
+            "date,type,day,weight\n2025-03-03,workout,1,70\n2025-03-03,weight,,71\n2025-03-03,cardio,1,\n")
+        self.assertEqual((len(progress), len(weights), report.invalid), (1, 1, 1))
+        self.assertIn('line 4', report.errors[0])
+
+    def test_duplicates_against_the_log_and_the_file(self):
+        existing = [{'date': '2025-03-03 10:00', 'day': 1, 'notes': ''}]
+        report, progress, _ = run_import(
+            "date,day\n2025-03-03 10:00,1\n2025-03-04 10:00,1\n2025-03-04 10:00,1\n", existing)
+        self.assertEqual((report.workouts, report.duplicates), (1, 2))
+        self.assertEqual(len(progress), 2)
+
+    def test_out_of_order_rows_are_sorted(self):
+        existing = [{'date': '2025-03-05', 'weight': 70, 'unit': 'kg'}]
+        _, _, weights = run_import("date,weight\n2025-03-07,69\n2025-03-01,72\n", weight_log=existing,
+                                   batch_size=1)
+        self.assertEqual([entry['weight'] for entry in weights], [72, 70, 69])
+
+    def test_errors_are_capped(self):
+        report, _, _ = run_import("date,day\n" + "2025-03-03,9\n" * 30)
+        self.assertEqual(report.invalid, 30)
+        self.assertEqual(len(report.errors), 20)
+        self.assertEqual(report.to_dict()['invalid'], 30)
+
+    def test_header_needs_a_date_column(self):
+        for text in ("", "day,notes\n1,x\n"):
+            with self.subTest(text=text), self.assertRaises(RowError):
+                run_import(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Exercise Index Tests
+Author: Aryan Kumawat
+Exercise lookups and weekly volume, checked against the workout database and generated plans
+"""
+
+import unittest
+
+from gym import User, WorkoutCalculator, WorkoutDatabase
+from gym_index import EXERCISE_LINE, ExerciseIndex, exercise_index, normalize_exercise
+
+
+class ExerciseLineTest(unittest.TestCase):
+
+    def test_every_database_exercise_line_matches(self):
+        # A line the regex misses would silently drop out of the index and all volume figures
+        for i, workout in enumerate(WorkoutDatabase.WORKOUT_LISTS):
+            title, *lines = workout.split("\n")
+            self.assertIsNone(EXERCISE_LINE.match(title.strip()))
+            for line in filter(str.strip, lines):
+                with self.subTest(workout=i, line=line):
+                    self.assertIsNotNone(EXERCISE_LINE.match(line.strip()))
+
+
+class ExerciseIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = exercise_index()
+
+    def test_shared_index(self):
+        self.assertIs(exercise_index(), self.index)
+        self.assertEqual(len(self.index.titles), len(WorkoutDatabase.WORKOUT_LISTS))
+
+    def test_lookup_by_name(self):
+        occurrence, = self.index.lookup("  back SQUATS ")
+        self.assertEqual((occurrence.workout, occurrence.position), (3, 1))
+        self.assertEqual((occurrence.amount, occurrence.unit, occurrence.sets), (10, 'reps', 5))
+        self.assertEqual(self.index.lookup("Zumba"), [])
+        self.assertEqual(normalize_exercise("Back   Squats"), "back squats")
+
+    def test_workouts_including(self):
+        self.assertEqual(self.index.workouts_including("Squats"), [3, 6, 7, 9])
+        for workout in self.index.workouts_including("Squats"):
+            self.assertIn("Squats (", WorkoutDatabase.WORKOUT_LISTS[workout])
+
+    def test_search(self):
+        self.assertEqual(self.index.search("curl"), ['Leg curls', 'Seated incline curls', 'Standing biceps curls'])
+        self.assertEqual(self.index.search("zumba"), [])
+
+    def test_custom_workouts(self):
+        index = ExerciseIndex(["Mine\n\nSquats (5 reps x 2 sets)\nRun (3 mins x 1 sets)\nCool down"])
+        self.assertEqual(index.titles, ["Mine"])
+        self.assertEqual([o.position for o in index.lookup("run")], [2])
+
+
+class WeeklyVolumeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = exercise_index()
+
+    def plan_volume(self, user: User, name: str) -> dict:
+        """The same figures read straight from the generated plan text"""
+        volume = {}
+        for day in WorkoutCalculator.generate_workout_plan(user):
+            for line in day['workout'].split("\n"):
+                match = EXERCISE_LINE.match(line)
+                if match and normalize_exercise(match.group('name')) == normalize_exercise(name):
+                    totals = volume.setdefault(match.group('unit'), {'sessions': 0, 'sets': 0, 'total': 0})
+                    totals['sessions'] += 1
+                    totals['sets'] += int(match.group('sets'))
+                    totals['total'] += int(match.group('amount')) * int(match.group('sets'))
+        return volume
+
+    def test_weekly_volume(self):
+        self.assertEqual(self.index.weekly_volume(User("Jane", 30, "female", 4, 3), "Back squats"),
+                         {'reps': {'sessions': 2, 'sets': 10, 'total': 100}})
+        self.assertEqual(self.index.weekly_volume(User("Jane", 30, "female", 2, 2), "Quad stretchs"),
+                         {'mins': {'sessions': 1, 'sets': 3, 'total': 6}})
+        self.assertEqual(self.index.weekly_volume(User("Jane", 30, "female", 4, 3), "Zumba"), {})
+
+    def test_age_adjusted_like_the_plan(self):
+        older = User("Jane", 70, "female", 4, 3)
+        self.assertEqual(self.index.weekly_volume(older, "Back squats")['reps']['total'], 90)
+        for age, gender, goal, days in ((30, 'male', 1, 4), (16, 'female', 2, 5), (78, 'male', 6, 7)):
+            user = User("Member", age, gender, goal, days)
+            for name in ('Squats', 'Crunches', 'Treadmill', 'Quad stretchs', 'Bench presses'):
+                with self.subTest(age=age, goal=goal, name=name):
+                    self.assertEqual(self.index.weekly_volume(user, name), self.plan_volume(user, name))
+
+
+if __name__ == '__main__':
+    unittest.main()
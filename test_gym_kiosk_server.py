@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Kiosk Session Server Tests
+Author: Aryan Kumawat
+Dispatching kiosk requests against a temporary profile store
+"""
+
+import asyncio
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from gym_kiosk_server import KioskServer, KioskSession
+from gym_server import APIError, PlanService
+from gym_store import ProfileStore
+
+PROFILE = {'op': 'create_profile', 'member': 'Jane', 'age': 30, 'gender': 'female', 'goal': 4,
+           'training_days': 3}
+
+
+class KioskServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.store = ProfileStore(self.data_dir.name)
+        self.kiosk = KioskServer(PlanService(self.store))
+
+    def tearDown(self):
+        self.kiosk.close()
+        self.data_dir.cleanup()
+
+    def test_session_flow(self):
+        async def flow():
+            session = KioskSession('test')
+            await self.kiosk.dispatch(session, PROFILE)
+            await self.kiosk.dispatch(session, {'op': 'log_workout', 'day': 2, 'notes': 'Felt strong'})
+            progress = await self.kiosk.dispatch(session, {'op': 'view_progress'})
+            with self.assertRaises(APIError):
+                await self.kiosk.dispatch(session, {'op': 'dance'})
+            return progress
+
+        progress = asyncio.run(flow())
+        self.assertEqual(progress['total_workouts'], 1)
+        self.assertEqual(progress['progress_log'][0]['notes'], 'Felt strong')
+
+    def test_cached_read_does_not_block_the_event_loop(self):
+        async def flow():
+            session = KioskSession('test')
+            await self.kiosk.dispatch(session, PROFILE)  # Jane is now cached
+            loop, lock = asyncio.get_running_loop(), self.store.lock('Jane')
+            saver = ThreadPoolExecutor(max_workers=1)  # Holds the member lock like a save would
+            await loop.run_in_executor(saver, lock.acquire)
+            try:
+                read = asyncio.ensure_future(self.kiosk.dispatch(session, {'op': 'view_progress'}))
+                pong = await asyncio.wait_for(self.kiosk.dispatch(KioskSession('other'), {'op': 'ping'}), 1)
+                self.assertFalse(read.done())
+            finally:
+                await loop.run_in_executor(saver, lock.release)
+                saver.shutdown()
+            return pong, await asyncio.wait_for(read, 5)
+
+        pong, progress = asyncio.run(flow())
+        self.assertEqual(pong, {'status': 'ok'})
+        self.assertEqual(progress['total_workouts'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Hot-Path Instrumentation Tests
+Author: Aryan Kumawat
+Histograms, Prometheus output, method and function wrapping and --metrics parsing
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import gym_gui_basic
+import gym_gui_support
+import gym_metrics
+from gym_metrics import MetricsRegistry, configure, instrument_class, instrument_function
+
+
+class Planner:
+
+    calls = 0
+
+    @staticmethod
+    def plan(days):
+        return list(range(days))
+
+    @classmethod
+    def count(cls):
+        cls.calls += 1
+        return cls.calls
+
+    def create_log_tab(self):
+        return 'log'
+
+    def helper(self):
+        return 'untimed'
+
+
+class RegistryTest(unittest.TestCase):
+
+    def test_prometheus_histogram(self):
+        metrics = MetricsRegistry()
+        for seconds in (0.0002, 0.2, 10):
+            metrics.observe('WorkoutCalculator.generate_workout_plan', seconds)
+        lines = metrics.to_prometheus().splitlines()
+        self.assertEqual(lines[1], "# TYPE gym_function_duration_seconds histogram")
+        label = 'function="WorkoutCalculator.generate_workout_plan"'
+        self.assertIn(f'gym_function_duration_seconds_bucket{{{label},le="0.0001"}} 0', lines)
+        self.assertIn(f'gym_function_duration_seconds_bucket{{{label},le="0.0005"}} 1', lines)
+        self.assertIn(f'gym_function_duration_seconds_bucket{{{label},le="5.0"}} 2', lines)
+        self.assertIn(f'gym_function_duration_seconds_bucket{{{label},le="+Inf"}} 3', lines)
+        self.assertIn(f'gym_function_duration_seconds_sum{{{label}}} 10.2002', lines)
+        self.assertIn(f'gym_function_duration_seconds_count{{{label}}} 3', lines)
+
+    def test_timed_records_failures_too(self):
+        metrics = MetricsRegistry()
+        timed = metrics.timed('fail', lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            timed()
+        self.assertEqual(metrics.histograms['fail'].count, 1)
+
+    def test_dump_format_follows_the_extension(self):
+        metrics = MetricsRegistry()
+        metrics.observe('f', 0.01)
+        with tempfile.TemporaryDirectory() as directory:
+            for filename, start in (('m.prom', '# HELP'), ('m.json', '{')):
+                path = os.path.join(directory, filename)
+                metrics.dump(path)
+                with open(path) as f:
+                    self.assertTrue(f.read().startswith(start))
+
+
+class InstrumentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = dict(vars(Planner))
+        self.addCleanup(gym_metrics.registry.histograms.clear)
+
+    def tearDown(self):
+        for name in ('plan', 'count', 'create_log_tab', 'helper'):
+            setattr(Planner, name, self.saved[name])
+
+    def test_instrument_class(self):
+        instrument_class(Planner, ['plan', 'count', 'create_*_tab', 'missing'])
+        instrument_class(Planner, ['plan'])  # Already wrapped: left as is
+        self.assertEqual(Planner.plan(3), [0, 1, 2])
+        self.assertEqual(Planner.count(), Planner.calls)
+        self.assertEqual(Planner().create_log_tab(), 'log')
+        self.assertEqual(Planner().helper(), 'untimed')
+        histograms = gym_metrics.registry.histograms
+        self.assertEqual(sorted(histograms), ['Planner.count', 'Planner.create_log_tab', 'Planner.plan'])
+        self.assertEqual(histograms['Planner.plan'].count, 1)
+
+    def test_instrument_function_where_it_was_imported(self):
+        original = gym_gui_support.read_json_file
+        self.assertIs(gym_gui_basic.read_json_file, original)
+        self.addCleanup(setattr, gym_gui_support, 'read_json_file', original)
+        self.addCleanup(setattr, gym_gui_basic, 'read_json_file', original)
+
+        instrument_function(gym_gui_support, 'read_json_file')
+        instrument_function(gym_gui_support, 'read_json_file')
+        self.assertIsNot(gym_gui_basic.read_json_file, original)
+        self.assertIs(gym_gui_basic.read_json_file, gym_gui_support.read_json_file)
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(gym_gui_basic.read_json_file(os.path.join(directory, 'missing.json')))
+        self.assertEqual(gym_metrics.registry.histograms['gym_gui_support.read_json_file'].count, 1)
+
+
+class ConfigureTest(unittest.TestCase):
+
+    def configure(self, argv, env=None):
+        with mock.patch.dict(os.environ), mock.patch.object(gym_metrics, 'enable') as enable:
+            os.environ.pop(gym_metrics.METRICS_ENV, None)
+            if env is not None:
+                os.environ[gym_metrics.METRICS_ENV] = env
+            remaining = configure(argv)
+        return remaining, [call.args for call in enable.call_args_list]
+
+    def test_flag(self):
+        self.assertEqual(self.configure(['stats', '--metrics']), (['stats'], [(None,)]))
+        self.assertEqual(self.configure(['--metrics=out.prom', 'plan']), (['plan'], [('out.prom',)]))
+
+    def test_environment(self):
+        self.assertEqual(self.configure(['stats'], '1'), (['stats'], [(None,)]))
+        self.assertEqual(self.configure([], 'out.json'), ([], [('out.json',)]))
+        self.assertEqual(self.configure([], '0'), ([], []))
+        self.assertEqual(self.configure(['--metrics=flag.prom'], 'env.prom'), ([], [('flag.prom',)]))
+
+    def test_off_by_default(self):
+        self.assertEqual(self.configure(['stats']), (['stats'], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Workout Notes Search Tests
+Author: Aryan Kumawat
+Ranking, date filters and incremental indexing of NotesIndex
+"""
+
+import unittest
+from datetime import date
+
+from gym_notes import NotesIndex, tokenize
+
+
+def entry(day: str, notes: str) -> dict:
+    return {'date': f"{day} 18:00", 'day': 1, 'notes': notes}
+
+
+class NotesIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log = [
+            entry('2025-01-01', "Felt strong on squats"),
+            entry('2025-01-02', "Knee felt sore"),
+            entry('2025-01-03', "Tired, knee sore again"),
+            entry('2025-01-04', "felt great"),
+            {'date': '2025-01-05 18:00', 'day': 2},
+        ]
+        self.index = NotesIndex(self.log)
+
+    def positions(self, *args, **kwargs):
+        return [match['position'] for match in self.index.search(*args, **kwargs)]
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Knee SORE, again!"), ['knee', 'sore', 'again'])
+
+    def test_entries_with_every_word_rank_first_newest_first(self):
+        self.assertEqual(self.positions("knee sore"), [2, 1])
+        self.assertEqual(self.positions("felt knee"), [1, 2, 3, 0])  # "knee" is the rarer word
+
+    def test_rarer_words_score_higher(self):
+        matches = self.index.search("felt squats")
+        self.assertEqual(matches[0]['position'], 0)
+        self.assertGreater(matches[0]['score'], matches[1]['score'])
+
+    def test_unknown_words_are_ignored(self):
+        self.assertEqual(self.positions("knee zumba"), [2, 1])
+        self.assertEqual(self.positions("zumba"), [])
+        self.assertEqual(self.positions(""), [])
+
+    def test_date_range_is_inclusive(self):
+        self.assertEqual(self.positions("felt", since='2025-01-02', until='2025-01-03'), [1])
+        self.assertEqual(self.positions("felt", since=date(2025, 1, 4)), [3])
+        with self.assertRaises(ValueError):
+            self.index.search("felt", since='January')
+
+    def test_limit(self):
+        self.assertEqual(self.positions("felt", limit=2), [3, 1])
+        self.assertEqual(self.positions("felt", limit=0), [])
+
+    def test_appended_entries_are_indexed_on_search(self):
+        self.log.append(entry('2025-01-06', "Knee fine now"))
+        self.assertEqual(self.positions("knee"), [5, 2, 1])
+        self.assertEqual(len(self.index), 6)
+
+    def test_rebuild_after_removal(self):
+        del self.log[1:3]
+        self.assertEqual(self.positions("knee"), [])
+        self.assertEqual(self.positions("felt"), [1, 0])
+
+    def test_unsorted_log(self):
+        log = [entry('2025-02-01', "late knee"), entry('2025-01-01', "early knee")]
+        index = NotesIndex(log)
+        self.assertEqual([m['position'] for m in index.search("knee", until='2025-01-31')], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Periodization Tests
+Author: Aryan Kumawat
+Week prescriptions, scaled exercise lines and the shared read-only week plans
+"""
+
+import json
+import unittest
+from datetime import datetime
+
+from gym import PlanDay, User, WorkoutCalculator, WorkoutPlan
+from gym_periodization import PeriodizationBlock, WeekPrescription
+
+
+class PrescriptionTest(unittest.TestCase):
+
+    def test_ramp_deload_and_sets(self):
+        block = PeriodizationBlock(12)
+        weeks = {week: block.prescription(week).to_dict() for week in (1, 3, 4, 5, 11, 12)}
+        self.assertEqual(weeks[1], {'week': 1, 'phase': 'loading', 'factor': 1.0, 'extra_sets': 0})
+        self.assertEqual(weeks[3]['factor'], 1.125)
+        self.assertEqual((weeks[4]['phase'], weeks[4]['factor'], weeks[4]['extra_sets']), ('deload', 0.6, -1))
+        self.assertEqual((weeks[5]['factor'], weeks[5]['extra_sets']), (1.188, 1))
+        self.assertEqual((weeks[11]['factor'], weeks[11]['extra_sets']), (1.5, 2))  # The peak
+        self.assertEqual((weeks[12]['phase'], weeks[12]['extra_sets']), ('deload', 1))
+
+    def test_long_blocks_reach_the_same_peak(self):
+        block = PeriodizationBlock(52)
+        self.assertEqual(block.prescription(51).factor, 1.5)
+        self.assertEqual(block.prescription(51).extra_sets, 2)
+
+    def test_invalid(self):
+        for kwargs in ({'weeks': 11}, {'weeks': 53}, {'cycle_weeks': 1}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                PeriodizationBlock(**kwargs)
+        for week in (0, 13):
+            with self.assertRaises(ValueError):
+                PeriodizationBlock(12).prescription(week)
+
+    def test_apply(self):
+        prescription = WeekPrescription(5, 'loading', 1.25, 1)
+        self.assertEqual(prescription.apply("Squats (10 reps x 3 sets)"), "Squats (13 reps x 4 sets)")
+        self.assertEqual(prescription.apply("Gym workout for strong legs"), "Gym workout for strong legs")
+        deload = WeekPrescription(4, 'deload', 0.1, -5)
+        self.assertEqual(deload.apply("Treadmill (2 mins x 3 sets)"), "Treadmill (1 mins x 1 sets)")
+
+
+class WeekPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.block = PeriodizationBlock(12)
+        self.user = User("Jane", 30, "female", 4, 3)
+
+    def test_week_plan_is_an_immutable_shared_plan(self):
+        plan = self.block.week_plan(self.user, 5)
+        self.assertIsInstance(plan, WorkoutPlan)
+        self.assertTrue(all(isinstance(day, PlanDay) for day in plan))
+        self.assertEqual([(day['day'], day['week'], day['phase']) for day in plan],
+                         [(1, 5, 'loading'), (2, 5, 'loading'), (3, 5, 'loading')])
+        with self.assertRaises(TypeError):
+            plan[0]['workout'] = "Rest"
+        self.assertIs(self.block.week_plan(User("John", 35, "female", 4, 3), 5), plan)
+        self.assertEqual(json.loads(json.dumps(plan))[0]['week'], 5)
+
+    def test_first_week_is_the_weekly_plan(self):
+        base = WorkoutCalculator.generate_workout_plan(self.user)
+        self.assertEqual([day['workout'] for day in self.block.week_plan(self.user, 1)],
+                         [day['workout'] for day in base])
+        self.assertIn("Back squats (15 reps x 7 sets)", self.block.week_plan(self.user, 11)[0]['workout'])
+
+    def test_days_sharing_a_workout_share_its_text(self):
+        plan = self.block.week_plan(self.user, 7)
+        self.assertIs(plan[0]['workout'], plan[2]['workout'])
+
+    def test_least_recently_used_weeks_are_dropped(self):
+        block = PeriodizationBlock(12, max_entries=2)
+        first = block.week_plan(self.user, 1)
+        block.week_plan(self.user, 2)
+        block.week_plan(self.user, 1)
+        block.week_plan(self.user, 3)
+        self.assertIs(block.week_plan(self.user, 1), first)
+        self.assertEqual(len(block._plans), 2)
+
+    def test_iter_weeks(self):
+        self.assertEqual([plan[0]['week'] for plan in self.block.iter_weeks(self.user, start=10)], [10, 11, 12])
+
+    def test_week_number(self):
+        start = datetime(2025, 1, 6)
+        self.assertEqual(self.block.week_number(start, datetime(2025, 1, 6)), 1)
+        self.assertEqual(self.block.week_number(start, datetime(2025, 1, 21)), 3)
+        self.assertEqual(self.block.week_number(start, datetime(2024, 12, 1)), 1)
+        self.assertEqual(self.block.week_number(start, datetime(2025, 3, 31)), 1)  # Week 13 starts over
+        self.assertEqual(self.block.current_week_plan(self.user, start, datetime(2025, 1, 21))[0]['week'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Compact Log Record Tests
+Author: Aryan Kumawat
+Round trips between the JSON log dicts and the slotted records
+"""
+
+import unittest
+
+from gym_records import LogRecord, compact_progress, compact_weights, parse_minute, plain_log
+
+PROGRESS = [
+    {'date': '2025-03-03 10:00', 'day': 1, 'notes': 'Felt strong'},
+    {'date': '2025-03-04 18:30', 'day': 2, 'notes': ''},
+    {'date': '2025-3-5 7:00', 'day': 3},  # Not in the compact form: kept verbatim
+    {'date': '2025-03-06 09:15', 'day': 4, 'notes': 'Extra', 'rpe': 8},
+]
+WEIGHTS = [
+    {'date': '2025-03-03', 'weight': 70.5, 'unit': 'kg'},
+    {'date': '2025-03-03', 'weight': 70.5, 'unit': 'kg'},
+    {'date': 'yesterday', 'weight': 155, 'unit': 'lbs'},
+]
+
+
+class LogRecordTest(unittest.TestCase):
+
+    def test_progress_round_trip(self):
+        records = compact_progress(PROGRESS)
+        self.assertEqual(plain_log(records), PROGRESS)
+        self.assertEqual(records[0]['date'], '2025-03-03 10:00')
+        self.assertEqual(records[2].get('notes', 'none'), 'none')
+        self.assertEqual(records[3]['rpe'], 8)
+        self.assertEqual(records[1], PROGRESS[1])
+
+    def test_weight_round_trip(self):
+        records = compact_weights(WEIGHTS)
+        self.assertEqual(plain_log(records), WEIGHTS)
+        self.assertEqual([record['weight'] for record in records], [70.5, 70.5, 155])
+
+    def test_get_agrees_with_getitem(self):
+        for entry in PROGRESS + [{'date': '2025-03-07 08:00', 'day': '5'}, {'day': None}, {}]:
+            record = compact_progress([entry])[0]
+            for key in ('date', 'day', 'notes', 'rpe'):
+                with self.subTest(entry=entry, key=key):
+                    self.assertEqual(record.get(key, 'missing'), entry.get(key, 'missing'))
+                    if key in entry:
+                        self.assertEqual(record[key], entry[key])
+
+    def test_records_are_slotted(self):
+        for record in compact_progress(PROGRESS[:1]) + compact_weights(WEIGHTS[:1]):
+            self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_log_record_is_abstract(self):
+        with self.assertRaises(TypeError):
+            LogRecord()
+
+    def test_parse_minute(self):
+        self.assertEqual(parse_minute('0001-01-01 00:01'), 1441)
+        for text in ('2025-3-5 7:00', '2025-02-30 10:00', '2025-03-03 24:00', None, 20250303):
+            self.assertIsNone(parse_minute(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Roster Rest-Day Recommendation Tests
+Author: Aryan Kumawat
+Activity counting, the advice rules and roster reports from users, dicts and files
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+from gym_advanced import AdvancedUser, RestDayRecommender
+from gym_rest import recommend, recommend_directory, recommend_files, recommend_roster, reference_time
+
+NOW = datetime(2025, 6, 30, 12, 0)
+
+
+def workouts(*stamps: str) -> list:
+    return [{'date': stamp, 'day': 1, 'notes': ''} for stamp in stamps]
+
+
+def member(name: str, *stamps: str, training_days: int = 3) -> dict:
+    return {'name': name, 'age': 30, 'gender': 'female', 'goal': 1, 'training_days': training_days,
+            'progress_log': workouts(*stamps)}
+
+
+class RecentActivityTest(unittest.TestCase):
+
+    def test_days_ago(self):
+        log = workouts('2025-06-30 08:00', '2025-06-29 12:00', '2025-06-22 12:01', '2025-06-22 12:00',
+                       '2025-06-30 13:00', 'not a date', '2025-6-29 9:00')  # Unpadded dates still parse
+        log.append({'day': 1})
+        self.assertEqual(RestDayRecommender.recent_activity(log, NOW), [1, 2, 0, 0, 0, 0, 0, 1, 1])
+
+    def test_advice(self):
+        self.assertEqual(RestDayRecommender.advise([0] * 9, 3)[0], False)
+        self.assertEqual(RestDayRecommender.advise([2, 1, 0, 0, 0, 0, 0, 0, 0], 5)[0], True)  # 3 in 2 days
+        self.assertEqual(RestDayRecommender.advise([0, 0, 1, 1, 1, 0, 0, 0, 0], 3)[0], True)  # Weekly goal met
+        rest, message = RestDayRecommender.advise([1, 0, 0, 1, 0, 0, 0, 0, 0], 4)
+        self.assertEqual((rest, message), (False, "You have 2 workouts left this week."))
+
+    def test_should_rest_today_uses_now(self):
+        user = AdvancedUser.from_dict(member('Jane', '2025-06-30 08:00', '2025-06-29 10:00', '2025-06-29 18:00'))
+        self.assertTrue(RestDayRecommender.should_rest_today(user, NOW)[0])
+        self.assertFalse(RestDayRecommender.should_rest_today(user, datetime(2025, 7, 20))[0])
+
+
+class RosterTest(unittest.TestCase):
+
+    def test_reference_time(self):
+        self.assertEqual(reference_time(date(2025, 6, 30)), datetime(2025, 6, 30))
+        self.assertIs(reference_time(NOW), NOW)
+
+    def test_users_and_dicts_agree(self):
+        profile = member('Jane', '2025-06-30 08:00', '2025-06-29 10:00', '2025-06-29 18:00')
+        self.assertEqual(recommend(profile, NOW), recommend(AdvancedUser.from_dict(profile), NOW))
+
+    def test_roster_report(self):
+        profiles = (member('Jane', '2025-06-30 08:00', '2025-06-29 10:00', '2025-06-29 18:00'),
+                    member('John', '2025-06-25 08:00'),
+                    member('New'))
+        report = recommend_roster(profiles, NOW)
+        self.assertEqual((report['members'], report['rest'], report['train'], report['no_history']), (3, 1, 2, 1))
+        self.assertEqual(report['reference'], '2025-06-30 12:00')
+        self.assertEqual([r['recent_workouts'] for r in report['recommendations']], [3, 1, None])
+
+
+class RosterFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(5):
+            path = os.path.join(self.directory.name, f"member_{i}.json")
+            with open(path, 'w') as f:
+                json.dump(member(f"Member {i}", *['2025-06-29 10:00'] * i), f)
+            self.paths.append(path)
+        with open(os.path.join(self.directory.name, 'broken.json'), 'w') as f:
+            f.write('{"name": ')
+        with open(os.path.join(self.directory.name, 'notes.txt'), 'w') as f:
+            f.write('not a profile')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_files_in_process_and_in_chunks(self):
+        expected = recommend_roster([member(f"Member {i}", *['2025-06-29 10:00'] * i) for i in range(5)], NOW)
+        for workers, chunk_size in ((1, 2), (2, 2)):
+            with self.subTest(workers=workers):
+                report = recommend_files(self.paths, NOW, workers=workers, chunk_size=chunk_size)
+                self.assertEqual(report['recommendations'], expected['recommendations'])
+
+    def test_broken_files_are_reported(self):
+        report = recommend_directory(self.directory.name, NOW, workers=1)
+        self.assertEqual(report['members'], 5)
+        self.assertEqual([os.path.basename(error['file']) for error in report['errors']], ['broken.json'])
+
+    def test_missing_directory(self):
+        with self.assertRaises(ValueError):
+            recommend_directory(os.path.join(self.directory.name, 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - HTTP Plan Service Tests
+Author: Aryan Kumawat
+PlanService routing against a temporary ProfileStore, and one round trip over HTTP
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from gym import WorkoutCalculator
+from gym_server import APIError, PlanService, make_server
+from gym_store import ProfileStore
+
+PROFILE = {'age': 30, 'gender': 'Female', 'goal': 1, 'training_days': 3}
+
+
+class PlanServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.service = PlanService(ProfileStore(self.directory.name))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get(self, path: str, query=None) -> dict:
+        return self.service.route('GET', path, query or {}, None)
+
+    def post(self, path: str, body: dict) -> dict:
+        return self.service.route('POST', path, {}, body)
+
+    def assertStatus(self, status: int, method: str, path: str, query=None, body=None):
+        with self.assertRaises(APIError) as raised:
+            self.service.route(method, path, query or {}, body)
+        self.assertEqual(raised.exception.status, status)
+
+    def test_anonymous_plan(self):
+        result = self.get('/plan', {'age': ['30'], 'gender': ['male'], 'goal': ['4'], 'days': ['3']})
+        self.assertEqual(len(result['plan']), 3)
+        self.assertEqual(result['goal_name'], 'Stronger Legs')
+
+    def test_validation_errors(self):
+        for query in ({'age': ['30'], 'goal': ['4'], 'days': ['3']},
+                      {'age': ['200'], 'gender': ['male'], 'goal': ['4'], 'days': ['3']},
+                      {'age': ['thirty'], 'gender': ['male'], 'goal': ['4'], 'days': ['3']},
+                      {'age': ['30'], 'gender': ['male'], 'goal': ['4']}):
+            with self.subTest(query=query):
+                self.assertStatus(400, 'GET', '/plan', query)
+        self.post('/members/Jane', PROFILE)
+        self.assertStatus(400, 'POST', '/members/J4ne', body=PROFILE)
+        self.assertStatus(400, 'GET', '/members/J4ne/plan')
+        self.assertStatus(400, 'POST', '/members/Jane/log', body={'day': 4})
+        self.assertStatus(400, 'POST', '/members/Jane/log', body={'day': 1, 'date': '2025-03-03'})
+        self.assertStatus(400, 'POST', '/members/Jane/weight', body={})
+        self.assertStatus(400, 'POST', '/members/Jane/weight', body={'weight': 70, 'unit': 'stone'})
+
+    def test_not_found(self):
+        self.assertStatus(404, 'GET', '/members/John')
+        self.assertStatus(404, 'GET', '/members/John/stats')
+        self.assertStatus(404, 'GET', '/members/Jane/plan/extra')
+        self.assertStatus(404, 'GET', '/unknown')
+        self.assertStatus(404, 'POST', '/health', body={})
+
+    def test_log_weight_and_stats_round_trip(self):
+        self.assertEqual(self.post('/members/Jane', PROFILE)['gender'], 'female')
+        self.assertEqual(self.get('/members')['members'], ['jane'])
+        logged = self.post('/members/Jane/log', {'day': 1, 'date': '2025-03-03 10:00'})
+        self.assertEqual(logged['total_workouts'], 1)
+        self.assertEqual(self.post('/members/Jane/log', {'day': 2, 'notes': 'Arms'})['total_workouts'], 2)
+        for weight in (70, 71, 70):
+            added = self.post('/members/Jane/weight', {'weight': weight})
+        self.assertEqual(added['entries'], 3)
+
+        stats = self.get('/members/Jane/stats')
+        self.assertEqual(stats['workouts']['total_workouts'], 2)
+        self.assertEqual((stats['weight']['entries'], stats['weight']['current']), (3, 70))
+        self.assertEqual(self.get('/members/jane/progress')['progress_log'][1]['notes'], 'Arms')
+
+        # A fresh service reads what the first one saved
+        service = PlanService(ProfileStore(self.directory.name))
+        self.assertEqual(len(service.route('GET', '/members/Jane', {}, None)['weight_log']), 3)
+
+    def test_profile_update_changes_the_plan(self):
+        self.post('/members/Jane', PROFILE)
+        self.assertEqual(len(self.get('/members/Jane/plan')['plan']), 3)
+        self.post('/members/Jane', dict(PROFILE, training_days=5))
+        self.assertEqual(len(self.get('/members/Jane/plan')['plan']), 5)
+        self.assertEqual(self.get('/members/Jane')['training_days'], 5)
+
+    def test_plans_are_the_interned_plans(self):
+        self.post('/members/Jane', PROFILE)
+        self.post('/members/Mary', PROFILE)
+        plan = self.get('/members/Jane/plan')['plan']
+        self.assertIs(plan, self.get('/members/Mary/plan')['plan'])
+        self.assertIs(plan, WorkoutCalculator.generate_workout_plan(self.service.store.get('Jane')))
+        self.assertEqual(self.get('/cache')['plans'], WorkoutCalculator.plan_stats())
+        self.assertGreaterEqual(WorkoutCalculator.plan_stats()['plans'], 1)
+
+
+class HTTPServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.server = make_server('127.0.0.1', 0, PlanService(ProfileStore(self.directory.name)))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def request(self, path: str, data: bytes = None):
+        try:
+            with urlopen(Request(self.url + path, data=data), timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_requests(self):
+        self.assertEqual(self.request('/health'), (200, {'status': 'ok'}))
+        status, result = self.request('/members/Jane', json.dumps(PROFILE).encode())
+        self.assertEqual((status, result['name']), (200, 'Jane'))
+        self.assertEqual(self.request('/members/Jane/log', b'not json'),
+                         (400, {'error': "Request body must be JSON"}))
+        self.assertEqual(self.request('/members/Jane/log', b'[1]')[0], 400)
+        self.assertEqual(self.request('/members/John/plan')[0], 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
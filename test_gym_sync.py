@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Data File Sync Tests
+Author: Aryan Kumawat
+Log merging, profile merging and syncing data files in a temporary directory
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from gym_sync import merge_logs, merge_profiles, sync_files
+
+WEIGH_IN = {'date': '2025-03-03', 'weight': 70.0, 'unit': 'kg'}
+
+
+def workout(stamp: str, day: int = 1) -> dict:
+    return {'date': stamp, 'day': day, 'notes': ''}
+
+
+class MergeLogsTest(unittest.TestCase):
+
+    def test_repeats_within_one_log_are_kept(self):
+        merged, duplicates = merge_logs([[WEIGH_IN, dict(WEIGH_IN)]])
+        self.assertEqual(merged, [WEIGH_IN, WEIGH_IN])
+        self.assertEqual(duplicates, 0)
+
+    def test_entries_from_another_log_are_dropped(self):
+        a = [workout('2025-03-01 10:00'), workout('2025-03-03 10:00')]
+        b = [workout('2025-03-02 10:00'), workout('2025-03-03 10:00')]
+        merged, duplicates = merge_logs([a, b])
+        self.assertEqual([entry['date'] for entry in merged],
+                         ['2025-03-01 10:00', '2025-03-02 10:00', '2025-03-03 10:00'])
+        self.assertEqual(duplicates, 1)
+
+    def test_copies_are_kept_as_often_as_in_the_log_with_most(self):
+        merged, duplicates = merge_logs([[WEIGH_IN], [WEIGH_IN, WEIGH_IN], [WEIGH_IN]])
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(duplicates, 2)
+
+    def test_same_timestamp_different_entries_are_kept(self):
+        merged, duplicates = merge_logs([[workout('2025-03-03 10:00', 1)], [workout('2025-03-03 10:00', 2)]])
+        self.assertEqual([entry['day'] for entry in merged], [1, 2])
+        self.assertEqual(duplicates, 0)
+
+    def test_unsorted_log(self):
+        merged, _ = merge_logs([[workout('2025-03-02 10:00'), workout('2025-03-01 10:00')], []])
+        self.assertEqual([entry['date'] for entry in merged], ['2025-03-01 10:00', '2025-03-02 10:00'])
+
+
+class MergeProfilesTest(unittest.TestCase):
+
+    def test_newest_profile_fields_win_and_collections_combine(self):
+        old = {'name': 'Jane', 'age': 30, 'rest_days': ['Sunday'],
+               'custom_workouts': [{'id': 'a', 'name': 'Old'}], 'workout_calendar': {'2025-03-01': 'Legs'}}
+        new = {'name': 'Jane', 'age': 31, 'rest_days': ['Sunday', 'Monday'],
+               'custom_workouts': [{'id': 'a', 'name': 'New'}, {'id': 'b', 'name': 'Other'}],
+               'workout_calendar': {'2025-03-02': 'Arms'}}
+        merged, _ = merge_profiles([old, new])
+        self.assertEqual(merged['age'], 31)
+        self.assertEqual(merged['rest_days'], ['Sunday', 'Monday'])
+        self.assertEqual([w['name'] for w in merged['custom_workouts']], ['New', 'Other'])
+        self.assertEqual(merged['workout_calendar'], {'2025-03-01': 'Legs', '2025-03-02': 'Arms'})
+
+
+class SyncFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, filename: str, data: dict, mtime: int) -> str:
+        path = os.path.join(self.directory.name, filename)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_files_are_merged_and_written_back(self):
+        a = self.write('a.json', {'name': 'Jane', 'goal': 1, 'training_days': 3,
+                                  'progress_log': [workout('2025-03-01 10:00')],
+                                  'weight_log': [WEIGH_IN, WEIGH_IN]}, 1000)
+        b = self.write('b.json', {'name': 'jane', 'goal': 2, 'training_days': 3,
+                                  'progress_log': [workout('2025-03-01 10:00'), workout('2025-03-02 10:00')],
+                                  'weight_log': [WEIGH_IN]}, 2000)
+        report = sync_files([b, a])
+        self.assertEqual(report['merged'], {'progress_log': 2, 'weight_log': 2})
+        self.assertEqual(report['duplicates'], {'progress_log': 1, 'weight_log': 1})
+        for path in (a, b):
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual(data['goal'], 2)
+            self.assertEqual(len(data['weight_log']), 2)
+
+    def test_different_members_need_force(self):
+        a = self.write('a.json', {'name': 'Jane', 'progress_log': []}, 1000)
+        b = self.write('b.json', {'name': 'John', 'progress_log': []}, 2000)
+        with self.assertRaises(ValueError):
+            sync_files([a, b])
+        output = os.path.join(self.directory.name, 'merged.json')
+        self.assertEqual(sync_files([a, b], output, force=True)['written'], [output])
+
+    def test_no_files(self):
+        with self.assertRaises(ValueError):
+            sync_files([os.path.join(self.directory.name, 'missing.json')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Training Volume and Workload Tests
+Author: Aryan Kumawat
+Workout volume, daily and weekly series and acute:chronic workload ratios
+"""
+
+import unittest
+from datetime import date
+
+from gym_advanced import AdvancedUser
+from gym_workload import (
+    WorkloadSeries, member_workload, plan_volume, roster_workload, workload, workout_volume
+)
+
+PLAN = [
+    {'day': 1, 'workout': "Legs\n\nSquats (10 reps x 3 sets)\nTreadmill (5 mins x 2 sets)\nStretch well"},
+    {'day': 2, 'workout': "Arms\n\nCurls (12 reps x 2 sets)"},
+]
+LOG = [
+    {'date': '2025-03-01 10:00', 'day': 1, 'notes': ''},
+    {'date': '2025-03-03 09:00', 'day': 1, 'notes': ''},
+    {'date': '2025-03-03 18:00', 'day': 2, 'notes': ''},
+    {'date': '2025-03-10 10:00', 'day': 2, 'notes': ''},
+]
+INVALID = [
+    {'date': '2025-03-04 10:00', 'day': '1'},
+    {'date': '2025-03-04 10:00', 'day': 3},
+    {'date': '2025-03-04 10:00'},
+    {'day': 1},
+    {'date': None, 'day': 1},
+    {'date': 'yesterday', 'day': 1},
+    {'date': '2025-02-30 10:00', 'day': 1},
+]
+
+
+def member(log=LOG) -> AdvancedUser:
+    user = AdvancedUser('Jane', 30, 'female', 1, 2)
+    user.progress_log = list(log)
+    return user
+
+
+class VolumeTest(unittest.TestCase):
+
+    def test_workout_volume(self):
+        self.assertEqual(workout_volume(PLAN[0]['workout']), (30, 10))
+        self.assertEqual(workload(30, 10), 130)
+        self.assertEqual([day['workload'] for day in plan_volume(PLAN)], [130, 24])
+
+
+class WorkloadSeriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.series = WorkloadSeries.from_log(LOG, plan_volume(PLAN))
+
+    def test_one_slot_per_day(self):
+        self.assertEqual(self.series.start, date(2025, 3, 1).toordinal())
+        self.assertEqual(len(self.series), 10)
+        self.assertEqual(list(self.series.sessions), [1, 0, 2, 0, 0, 0, 0, 0, 0, 1])
+        self.assertEqual((self.series.reps[2], self.series.mins[2]), (54, 10))
+
+    def test_invalid_entries_are_skipped(self):
+        series = WorkloadSeries.from_log(INVALID + LOG, plan_volume(PLAN))
+        self.assertEqual(list(series.sessions), list(self.series.sessions))
+        self.assertEqual(len(WorkloadSeries.from_log(INVALID, plan_volume(PLAN))), 0)
+
+    def test_acwr(self):
+        # Acute: the 7 days up to the date; chronic: the 28 days up to it, per week
+        self.assertEqual(self.series.acwr(date(2025, 3, 3)), {'acute': 284, 'chronic': 71, 'ratio': 4.0})
+        self.assertEqual(self.series.acwr(date(2025, 3, 10)), {'acute': 24, 'chronic': 77, 'ratio': 24 / 77})
+        self.assertEqual(self.series.acwr(date(2025, 4, 30)), {'acute': 0, 'chronic': 0, 'ratio': None})
+        self.assertEqual(self.series.acwr(date(2025, 2, 1))['ratio'], None)
+
+    def test_weekly(self):
+        weeks = self.series.weekly()
+        self.assertEqual([week['week'] for week in weeks], ['2025-02-24', '2025-03-03', '2025-03-10'])
+        self.assertEqual([week['sessions'] for week in weeks], [1, 2, 1])
+        self.assertEqual([week['workload'] for week in weeks], [130, 154, 24])
+
+
+class MemberWorkloadTest(unittest.TestCase):
+
+    def test_member(self):
+        result = member_workload(member(LOG + INVALID), PLAN, on=date(2025, 3, 10))
+        self.assertEqual(result['planned_weekly_workload'], 154)
+        self.assertEqual(result['logged_workload'], 308)
+        self.assertEqual(result['acwr']['chronic'], 77)
+        self.assertEqual(len(result['weeks']), 3)
+
+    def test_no_workouts(self):
+        result = member_workload(member([]), PLAN, on=date(2025, 3, 10))
+        self.assertEqual((result['logged_workload'], result['weeks'], result['acwr']['ratio']), (0, [], None))
+
+    def test_roster(self):
+        report = roster_workload([member()], plan_for=lambda user: PLAN, on=date(2025, 3, 3))
+        self.assertEqual(report['Jane']['acwr']['ratio'], 4.0)
+        self.assertNotIn('weeks', report['Jane'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Gym Workout Planner - Import Graph Tests
+Author: Aryan Kumawat
+Every rule of benchmarks.imports, run in a fresh interpreter per statement
+"""
+
+import unittest
+
+from benchmarks.imports import RULES, check
+
+
+class ImportGraphTest(unittest.TestCase):
+
+    def test_modules_import_only_what_they_need(self):
+        for statement, forbidden in RULES.items():
+            with self.subTest(statement=statement):
+                result = check(statement, forbidden)
+                if 'error' in result and statement.startswith('import gym_gui'):
+                    self.skipTest(f"Tk is not available: {result['error']}")
+                self.assertNotIn('error', result)
+                self.assertEqual(result['forbidden'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()